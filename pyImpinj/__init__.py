@@ -14,9 +14,32 @@
 #           2020-03-02 Ver:1.2 [Heyn] Bugfix:20200302 The last message was not processed.
 #           2020-03-03 Ver:1.2 [Heyn] Optimize the code.
 #           2020-03-04 Ver:1.3 [Heyn] New add distance function.
+#           2026-10-17 Ver:1.4 [Heyn] Chunk-level frame scanner ( see framer.py ).
+#           2026-10-17 Ver:1.4 [Heyn] New add compact TagRead record ( see records.py ).
+#           2026-10-17 Ver:1.4 [Heyn] New add batched tag delivery ( see batch.py ).
+#           2026-10-17 Ver:1.4 [Heyn] New add columnar inventory rounds ( see rounds.py ). Bugfix get_variance.
+#           2026-10-17 Ver:1.4 [Heyn] New add streaming tag de-duplication ( see dedup.py ).
+#           2026-10-17 Ver:1.4 [Heyn] Correlate responses by command code ( see dispatcher.py ).
+#           2026-10-17 Ver:1.4 [Heyn] New add pipeline function ( see pipeline.py ).
+#           2026-10-17 Ver:1.4 [Heyn] New add AsyncImpinjR2KReader ( see aio.py ).
+#           2026-10-17 Ver:1.4 [Heyn] New add connect( reconnect=True ) ( see transport.py ).
+#           2026-10-17 Ver:1.4 [Heyn] New add ImpinjR2KBus ( see bus.py ).
+#           2026-10-17 Ver:1.4 [Heyn] New add ImpinjR2KFleet ( see fleet.py ).
+#           2026-10-17 Ver:1.4 [Heyn] New add ImpinjTagRing ( see ringbuffer.py ).
+#           2026-10-17 Ver:1.4 [Heyn] New add start(stop)_inventory ( see scheduler.py ).
+#           2026-10-17 Ver:1.4 [Heyn] Bugfix session_inventory ignored its arguments. New add ImpinjSessionScheduler.
+#           2026-10-17 Ver:1.4 [Heyn] New add ImpinjDwellScheduler ( start_inventory( mode='fast', dwell=True ) ).
+#           2026-10-17 Ver:1.4 [Heyn] New add drain_inventory_buffer function.
+#           2026-10-17 Ver:1.4 [Heyn] New add access function ( see access.py ).
+#           2026-10-17 Ver:1.4 [Heyn] New add encode function ( see station.py ).
+#           2026-10-17 Ver:1.4 [Heyn] New add ImpinjR2KSimulator ( see simulator.py ).
+#           2026-10-17 Ver:1.4 [Heyn] New add benchmark suite ( python -m pyImpinj.benchmark ).
+#           2026-10-17 Ver:1.4 [Heyn] New add record function and ImpinjR2KReplay ( see capture.py ).
+#           2026-10-17 Ver:1.4 [Heyn] New add statistics & serve_metrics function ( see metrics.py ).
+#           2026-10-17 Ver:1.4 [Heyn] New add ImpinjTagQueue, the reader owns its package_queue by default ( see tagqueue.py ).
 
 __author__    = 'Heyn'
-__version__   = '1.3'
+__version__   = '1.4'
 
 import os
 import queue
@@ -28,23 +51,54 @@ import serial.threaded
 import serial.tools.list_ports
 
 from .enums    import ImpinjR2KRegion
-from .enums    import ImpinjR2KCommands
 from .enums    import ImpinjR2KGlobalErrors
 from .enums    import ImpinjR2KFastSwitchInventory
 
-from .protocol import ImpinjR2KProtocols
-from .constant import FREQUENCY_TABLES, READER_ANTENNA
-
+from .aio        import AsyncImpinjR2KReader
+from .access     import ImpinjR2KAccess, ImpinjR2KAccessResult
+from .bus        import ImpinjR2KBus
+from .capture    import ImpinjR2KRecorder, ImpinjR2KReplay, ImpinjR2KTap
+from .fleet      import ImpinjR2KFleet
+from .metrics    import ImpinjR2KMetrics, ImpinjR2KMetricsServer, ImpinjR2KHistogram
+from .framer     import ImpinjR2KFramer
+from .batch      import ImpinjTagBatcher
+from .rounds     import ImpinjRoundCollector, ImpinjInventoryRound
+from .dedup      import ImpinjTagDeduplicator
+from .ringbuffer import ImpinjTagRing
+from .tagqueue   import ImpinjTagQueue
+from .records    import TagRead, decode_tag_report, decode_buffer_tag
+from .simulator  import ImpinjR2KSimulator, ImpinjTagPopulation
+from .station    import ImpinjEncodingStation, ImpinjEncodingResult
+from .scheduler  import ImpinjInventoryScheduler, ImpinjSessionScheduler, ImpinjDwellScheduler
+from .pipeline   import ImpinjR2KPipeline, ImpinjR2KResult
+from .protocol   import ImpinjR2KProtocols
+from .transport  import ImpinjR2KLink
+from .constant   import FREQUENCY_TABLES, READER_ANTENNA
+from .dispatcher import ImpinjR2KDispatcher, TAG_COMMANDS
+
+__all__ = [ 'ImpinjR2KReader', 'ImpinjProtocolFactory',
+            'ImpinjR2KRegion', 'ImpinjR2KGlobalErrors', 'ImpinjR2KFastSwitchInventory',
+            'AsyncImpinjR2KReader', 'ImpinjR2KAccess', 'ImpinjR2KAccessResult', 'ImpinjR2KBus',
+            'ImpinjR2KRecorder', 'ImpinjR2KReplay', 'ImpinjR2KTap', 'ImpinjR2KFleet',
+            'ImpinjR2KMetrics', 'ImpinjR2KMetricsServer', 'ImpinjR2KHistogram', 'ImpinjR2KFramer',
+            'ImpinjTagBatcher', 'ImpinjRoundCollector', 'ImpinjInventoryRound', 'ImpinjTagDeduplicator',
+            'ImpinjTagRing', 'ImpinjTagQueue', 'TagRead', 'decode_tag_report', 'decode_buffer_tag',
+            'ImpinjR2KSimulator', 'ImpinjTagPopulation', 'ImpinjEncodingStation', 'ImpinjEncodingResult',
+            'ImpinjInventoryScheduler', 'ImpinjSessionScheduler', 'ImpinjDwellScheduler',
+            'ImpinjR2KPipeline', 'ImpinjR2KResult', 'ImpinjR2KProtocols', 'ImpinjR2KLink',
+            'FREQUENCY_TABLES', 'READER_ANTENNA', 'ImpinjR2KDispatcher', 'TAG_COMMANDS' ]
 
 class ImpinjProtocolFactory( serial.threaded.FramedPacket ):
     START = b'\xA0'
-    def __init__( self, package_queue, command_queue, address=0xFF ):
-        self.packet = bytearray()
-        self.in_packet = False
+    def __init__( self, package_queue, command_queue, address=0xFF, compact=False, metrics=None ):
+        self.framer    = ImpinjR2KFramer( address=address )
+        self.metrics   = ImpinjR2KMetrics( ) if metrics is None else metrics
         self.transport = None
         self.address   = address
+        self.compact   = compact
         self.package_queue = package_queue
         self.command_queue = command_queue
+        self.recorder  = None       # ImpinjR2KRecorder
         super( ImpinjProtocolFactory, self ).__init__( )
 
     def __call__( self ):
@@ -55,74 +109,25 @@ class ImpinjProtocolFactory( serial.threaded.FramedPacket ):
 
     def data_received( self, data ):
         # logging.debug( data )
-        for byte in serial.iterbytes( data ):
-            if ( byte == self.START ) and ( self.in_packet is False ):
-                self.in_packet = True
-                self.packet.extend( byte )
-            elif self.in_packet:
-                self.packet.extend( byte )
-
-                if ( ( self.packet[1] + 2 ) == len( self.packet ) ):
-                    self.in_packet = False
-                    if self.address == self.packet[2]:                  # Check if the address is correct.
-                        if ( libscrc.lrc( bytes(self.packet) ) == 0 ):  # Check if the package's crc is correct.
-                            self.handle_packet( bytes( self.packet ) )  # Process data.
-                    del self.packet[:]                                  # Clear buffer.
+        if self.recorder is not None:
+            self.recorder.write( data )
+        for packet in self.framer.feed( data ):
+            self.handle_packet( packet )
 
     def handle_packet( self, packet ):
         try:
-            length, command, message = packet[1], packet[3], packet[4:-1]
+            length, address, command, message = packet[1], packet[2], packet[3], packet[4:-1]
         except BaseException as err:
             logging.error( '[ERROR] ImpinjProtocolFactory.handle_packet : {}'.format( err ) )
             return
-        ### Tags 
-        if command in [ ImpinjR2KCommands.REAL_TIME_INVENTORY, ImpinjR2KCommands.ISO18000_6B_INVENTORY,
-                        ImpinjR2KCommands.FAST_SWITCH_ANT_INVENTORY, ImpinjR2KCommands.CUSTOMIZED_SESSION_TARGET_INVENTORY ]:
-            
-            if len( message ) <= 1:
-                self.package_queue.put( dict( type='ERROR', logs=ImpinjR2KGlobalErrors.to_string( message[0] ) ) )
-                return
-            
-            ### Special process.
-            if length == 0x0A:        # Operation successful.
-                if command in [ ImpinjR2KCommands.REAL_TIME_INVENTORY, ImpinjR2KCommands.CUSTOMIZED_SESSION_TARGET_INVENTORY ]:
-                     ### Head -- Length(fix=0x0A) -- Address -- Cmd -- AntID(1B) -- ReadRate(2B) -- TotalRead(4B) -- Check
-                    duration   = struct.unpack( '>H', message[1:3] )[0]
-                    total_read = struct.unpack( '>I', message[3:7] )[0]
-                else:
-                     ### Head -- Length(fix=0x0A) -- Address -- Cmd -- TotalRead(3B) -- CommandDuration(4B) -- Check
-                    total_read = ((message[0]<<16) & 0x00FF0000) + ((message[1]<<8)& 0x0000FF00) + message[2]
-                    duration   = struct.unpack( '>I', message[3:7] )[0]
-                self.package_queue.put( dict( type='DONE', total_read=total_read, duration=duration ) )
-                return
-
-            elif length == 0x04:      # Operation failed.
-                ### Head -- Length(fix=0x04) -- Address -- Cmd -- ErrorCode -- Check
-                self.package_queue.put( dict( type='ERROR', logs='{}'.format( ImpinjR2KGlobalErrors.to_string( message[0] ) ) ) )
-                return
-
-            antenna   = ( message[0] & 0x03 ) + 1
-            frequency = FREQUENCY_TABLES[ ( ( ( message[0] & 0xFC ) >> 2 ) & 0x3F ) ]
-
-            try:
-                pc = struct.unpack( '>H', message[1:3] )[0]
-            except BaseException:
-                if message[1] == ImpinjR2KGlobalErrors.ANTENNA_MISSING_ERROR:
-                    self.package_queue.put( dict( type='ERROR', logs='Antenna-{} disconnect.'.format( antenna ) ) )
-                return
-
-            size = ( ( pc & 0xF800 ) >> 10 ) & 0x003E
-            if size == 0:
-                self.package_queue.put( dict( type='ERROR', logs='Nothing!' ) )
-                return
-
-            rssi = message[-1] - 129
-            epc  = ''.join( [ '%02X' % x for x in message[3:size+3] ] )     # Bugfix:20200224
-            self.package_queue.put( dict( type='TAG',
-                                          antenna=antenna,
-                                          frequency=frequency, rssi=rssi, epc=epc ) )
+        ### Tags
+        if command in TAG_COMMANDS:
+            item = decode_tag_report( length, command, message, compact=self.compact )
+            if item is not None:
+                self.metrics.report( address, command, item )
+                self.package_queue.put( item )
         else:
-            self.command_queue.put( dict( command=command, data=message ) )
+            self.command_queue.put( dict( address=address, command=command, data=message ) )
 
     def connection_lost( self, exc ):
         self.transport = None
@@ -156,10 +161,32 @@ class ImpinjR2KReader( object ):
             return wrapper
         return decorator
 
-    def __init__( self, package_queue, address=0xFF ):
+    def __init__( self, package_queue=None, address=0xFF, compact=False, batch_size=0, batch_latency=0.05, dedup_window=0,
+                  queue_size=1024, queue_policy='drop-oldest', queue_timeout=0.5 ):
+        """
+            @param  package_queue = None  # The reader owns an ImpinjTagQueue( @queue_size, @queue_policy ),
+                                          # see R2000.package_queue. A queue.Queue blocks the serial thread when full.
+                    queue_policy  = 'block' | 'drop-newest' | 'drop-oldest' | 'coalesce'
+                    queue_timeout = 0.5   # Longest wait (Unit:s) of the serial thread with 'block', once per
+                                          # stall of the consumer ( see ImpinjTagQueue ).
+                    compact       = True  # Tag reports are TagRead records instead of dicts.
+                    batch_size    = N     # package_queue receives lists of up to N tag reads.
+                    batch_latency = 0.05  # Maximum age (Unit:s) of a pending batch.
+                    dedup_window  = 1.0   # One TagAggregate per EPC and window (Unit:s).
+        """
+        if package_queue is None:
+            package_queue = ImpinjTagQueue( maxsize=queue_size, policy=queue_policy, timeout=queue_timeout )
         self.package_queue, self.address = package_queue, address
-        self.command_queue = queue.Queue( 1024 )
-        self.ser, self.serial_worker = None, None
+        self.compact = compact
+        self.batch_size, self.batch_latency = batch_size, batch_latency
+        self.dedup_window = dedup_window
+        self.metrics       = ImpinjR2KMetrics( )
+        self.command_queue = ImpinjR2KDispatcher( metrics=self.metrics )
+        self.exporter      = None
+        self.ser, self.serial_worker, self.link = None, None, None
+        self.protocol_factory = None
+        self.batcher, self.deduplicator = None, None
+        self.scheduler, self.recorder = None, None
         super( ImpinjR2KReader, self ).__init__( )
 
     def __del__( self ):
@@ -175,7 +202,20 @@ class ImpinjR2KReader( object ):
             if description in device[1]:
                 yield device[0]
 
-    def connect( self, port='COM1', baudrate=115200 ):
+    def connect( self, port='COM1', baudrate=115200, reconnect=False, **kwargs ):
+        """
+            @param  reconnect = True    # Use a shared ImpinjR2KLink: automatic reconnect with backoff,
+                                        # re-applied configuration and one link for every reader
+                                        # address on the same port ( e.g. 'socket://192.168.1.116:4001' ).
+                    kwargs              # ImpinjR2KLink( backoff=( 0.5, 30 ), keepalive=None )
+        """
+        if reconnect:
+            self.link = self.ser = ImpinjR2KLink.shared( port, baudrate, **kwargs )
+            self.protocol = ImpinjR2KProtocols( address=self.address, serial=self.link, listener=self.command_queue.expect )
+            if not self.link.connected.wait( 3 ):
+                raise FileNotFoundError( 'Could not open {}, still retrying in the background.'.format( port ) )
+            return True
+
         self.ser = serial.serial_for_url( port, do_not_open=True )
         self.ser.baudrate, self.ser.bytesize = baudrate, 8
         self.ser.parity, self.ser.stopbits = serial.PARITY_NONE, serial.STOPBITS_ONE
@@ -187,20 +227,142 @@ class ImpinjR2KReader( object ):
         except BaseException as err:
             raise FileNotFoundError('Could not open serial port {}: {}'.format(self.ser.name, err))
 
-        self.protocol = ImpinjR2KProtocols( address=self.address, serial=self.ser )
+        self.protocol = ImpinjR2KProtocols( address=self.address, serial=self.ser, listener=self.command_queue.expect )
 
         return True
 
     def worker_start( self ):
-        self.protocol_factory = ImpinjProtocolFactory( self.package_queue, self.command_queue, self.address )
-        self.serial_worker = serial.threaded.ReaderThread( self.ser, self.protocol_factory )
+        tag_queue = self.package_queue
+        if self.batch_size > 0:
+            tag_queue = self.batcher = ImpinjTagBatcher( tag_queue, size=self.batch_size, latency=self.batch_latency )
+        if self.dedup_window > 0:
+            tag_queue = self.deduplicator = ImpinjTagDeduplicator( tag_queue, window=self.dedup_window )
+        self.protocol_factory = ImpinjProtocolFactory( tag_queue, self.command_queue, self.address, compact=self.compact, metrics=self.metrics )
+        if ( self.recorder is not None ) and ( self.link is None ):
+            self.protocol_factory.recorder = self.recorder      # record( ) before worker_start( ).
+        self.__collect( )
+        if self.link is not None:
+            self.link.attach( self.address, self.protocol_factory )
+            return
+        port = self.ser.serial if isinstance( self.ser, ImpinjR2KTap ) else self.ser
+        self.serial_worker = serial.threaded.ReaderThread( port, self.protocol_factory )
         self.serial_worker.start( )
 
     def worker_close( self ):
+        self.stop_inventory( )
+        self.stop_record( )
+        if self.exporter:
+            self.exporter.close( )
+            self.exporter = None
         if self.serial_worker:
             self.serial_worker.close()
-        self.serial_worker = None
-    
+        if self.link:
+            self.link.detach( self.address )
+        if self.deduplicator:
+            self.deduplicator.close()
+        if self.batcher:
+            self.batcher.close()
+        self.serial_worker, self.batcher, self.deduplicator = None, None, None
+
+    def start_inventory( self, mode='rt', **kwargs ):
+        """ Continuous inventory, the next command is written on every DONE ( see ImpinjInventoryScheduler ).
+            R2000.worker_start( )
+            R2000.start_inventory( mode='fast', param=dict( A=0, Aloop=1, B=1, Bloop=1, C=4, D=4, Interval=0, Repeat=1 ) )
+            @return : ImpinjInventoryScheduler ( statistics( ) )
+        """
+        self.stop_inventory( )
+        if mode == 'session':
+            self.scheduler = ImpinjSessionScheduler( self, self.protocol_factory.package_queue, **kwargs )
+        elif kwargs.pop( 'dwell', False ):
+            self.scheduler = ImpinjDwellScheduler( self, self.protocol_factory.package_queue, **kwargs )
+        else:
+            self.scheduler = ImpinjInventoryScheduler( self, self.protocol_factory.package_queue, mode=mode, **kwargs )
+        self.protocol_factory.package_queue = self.scheduler
+        self.scheduler.start( )
+        return self.scheduler
+
+    def stop_inventory( self ):
+        if self.scheduler is None:
+            return
+        self.scheduler.stop( )
+        self.protocol_factory.package_queue = self.scheduler.queue
+        self.scheduler = None
+
+    def __collect( self ):
+        """ Values read by ImpinjR2KMetrics.snapshot( ). With a shared link the framer counts every address. """
+        framer = self.protocol_factory.framer if self.link is None else self.link.framer
+        collect = self.metrics.collect
+        collect( 'bytes_received_total',        lambda : framer.received )
+        collect( 'frames_total',                lambda : framer.frames )
+        collect( 'lrc_errors_total',            lambda : framer.lrc )
+        collect( 'address_mismatch_total',      lambda : framer.mismatch )
+        collect( 'resync_total',                lambda : framer.resync )
+        collect( 'discarded_bytes_total',       lambda : framer.discarded )
+        collect( 'command_queue_depth',         self.command_queue.qsize )
+        collect( 'command_queue_dropped_total', lambda : self.command_queue.stale )
+        collect( 'package_queue_depth',         lambda : self.package_queue.qsize( ) )
+        collect( 'package_queue_dropped_total', lambda : self.package_queue.statistics( )['dropped'] )
+        collect( 'package_queue_coalesced_total', lambda : self.package_queue.statistics( )['coalesced'] )
+        collect( 'package_queue_blocked_total', lambda : self.package_queue.statistics( )['blocked'] )
+
+    def statistics( self ):
+        """ Metrics snapshot ( see ImpinjR2KMetrics ).
+            @return : dict( tags={ antenna : count }, tag_rate, tag_errors, rounds, rounds_reported,
+                            command_latency={ command : histogram }, command_timeouts, bytes_received_total,
+                            frames_total, lrc_errors_total, address_mismatch_total, ..., package_queue_depth,
+                            package_queue_dropped_total, command_queue_depth, command_queue_dropped_total )
+            Values the package_queue does not provide ( qsize, statistics ) are None.
+        """
+        return self.metrics.snapshot( )
+
+    def serve_metrics( self, port=9464, host='127.0.0.1', labels=None ):
+        """ Prometheus exporter on a local HTTP thread ( GET /metrics ).
+            R2000.serve_metrics( port=9464, labels=dict( reader='dock-1' ) )
+            @return : ImpinjR2KMetricsServer ( .url )
+        """
+        if self.exporter is None:
+            self.exporter = ImpinjR2KMetricsServer( self.statistics, host=host, port=port, labels=labels )
+            self.exporter.start( )
+        return self.exporter
+
+    def record( self, path, **kwargs ):
+        """ Record the raw bytes received ( RX ) and written ( TX ) to a capture file, see ImpinjR2KRecorder.
+            R2000.connect( 'COM9' )
+            R2000.record( 'site.r2k', max_bytes=64*1024*1024, backups=10, compress=True )
+            R2000.worker_start( )
+            ImpinjR2KReplay.rotated( 'site.r2k' ).feed( factory, speed=10.0 )    # Offline
+        """
+        if self.ser is None:
+            raise ConnectionError( 'Reader {} is not connected, call connect( ) before record( ).'.format( self.address ) )
+        self.stop_record( )
+        self.recorder = ImpinjR2KRecorder( path, **kwargs )
+        if self.link is not None:
+            self.link.recorder = self.recorder
+        elif self.protocol_factory is not None:
+            self.protocol_factory.recorder = self.recorder
+        self.ser = self.protocol.serial = ImpinjR2KTap( self.ser, self.recorder )
+        return self.recorder
+
+    def stop_record( self ):
+        if self.recorder is None:
+            return
+        if self.link is not None:
+            self.link.recorder = None
+        elif self.protocol_factory is not None:
+            self.protocol_factory.recorder = None
+        self.ser = self.protocol.serial = self.ser.serial
+        self.recorder.close( )
+        self.recorder = None
+
+    def pipeline( self, timeout=3 ):
+        """ Write several commands at once, see ImpinjR2KPipeline.
+            with R2000.pipeline( ) as pipe:
+                pipe.fast_power( value=30 )
+                pipe.set_work_antenna( antenna=READER_ANTENNA['ANTENNA1'] )
+            print( pipe.results )
+        """
+        return ImpinjR2KPipeline( self, timeout=timeout )
+
     #-------------------------------------------------
 
     @analyze_data( 'DATA' )
@@ -259,7 +421,7 @@ class ImpinjR2KReader( object ):
         self.protocol.rt_inventory( repeat=repeat )
 
     def session_inventory( self, session='S1', target='A', repeat=1 ):
-        self.protocol.session_inventory( session='S1', target='A', repeat=1 )
+        self.protocol.session_inventory( session=session, target=target, repeat=repeat )
 
     def fast_switch_ant_inventory( self, param = dict( A=ImpinjR2KFastSwitchInventory.ANTENNA1, Aloop=1,
                                                        B=ImpinjR2KFastSwitchInventory.DISABLED, Bloop=1,
@@ -329,37 +491,12 @@ class ImpinjR2KReader( object ):
         return count
 
     def __unpack_inventory_buffer( self, data ):
-        try:
-            count, length = struct.unpack( '>HB', data[0:3] )
-        except BaseException as err:
-            logging.error( err )
-            return ''
-
-        if (length + 6) != len( data ):
-            return ''
-
-        pc   = struct.unpack( '>H', data[3:5] )[0]
-        size = ( ( pc & 0xF800 ) >> 10 ) & 0x003E
-        epc  = ''.join( [ '%02X' % x for x in data[5:size+5] ] )
-
-        crc  = struct.unpack( '>H', data[size+5:size+5+2] )[0]
-        if crc != ( libscrc.xmodem( data[3:size+5], 0xFFFF ) ^ 0xFFFF ):
-            logging.error( 'TAGS CRC16 is ERROR.')
+        tag = decode_buffer_tag( data )
+        if tag is None:
+            logging.error( 'Inventory buffer frame or TAGS CRC16 is ERROR.' )
             return ''
-
-        rssi = ( data[-3] - 129  )
-        ant  = ( data[-2] & 0x03 ) + 1 # Bugfix:20200303
-        invcount = data[-1]
-
-        logging.debug( '*'*50 )
-        logging.debug( 'COUNT    : {}'.format( count ) )
-        logging.debug( 'EPC      : {}'.format( epc   ) )
-        logging.debug( 'CRC      : {:X}'.format( crc ) )
-        logging.debug( 'RSSI     : {}'.format( rssi  ) )
-        logging.debug( 'ANT      : {}'.format( ant   ) )
-        logging.debug( 'INVCOUNT : {}'.format( invcount ) )
-
-        return ( ant, rssi, epc )
+        count, ant, rssi, epc, invcount = tag
+        return ( ant, rssi, epc.hex( ).upper( ) )
 
     def get_inventory_buffer( self, loop=1 ):
         """
@@ -367,9 +504,12 @@ class ImpinjR2KReader( object ):
         """
         tags = []
         self.protocol.get_inventory_buffer( )
-        for _ in range( loop ):
-            value = ImpinjR2KReader.analyze_data( 'DATA' )( lambda x, y : y )( self, None )
-            tags.append( self.__unpack_inventory_buffer( value ) )
+        try:
+            for _ in range( loop ):
+                value = ImpinjR2KReader.analyze_data( 'DATA' )( lambda x, y : y )( self, None )
+                tags.append( self.__unpack_inventory_buffer( value ) )
+        finally:
+            self.command_queue.release( )
         return tags
 
     def get_and_reset_inventory_buffer( self, loop=1 ):
@@ -378,14 +518,53 @@ class ImpinjR2KReader( object ):
         """
         tags = []
         self.protocol.get_and_reset_inventory_buffer( )
-        for _ in range( loop ):
-            value = ImpinjR2KReader.analyze_data( 'DATA' )( lambda x, y : y )( self, None )
-            tags.append( self.__unpack_inventory_buffer( value ) )
-        ### Bugfix:20200302
-        value = ImpinjR2KReader.analyze_data( 'DATA' )( lambda x, y : y )( self, None )
-        logging.info( 'GET_AND_RESET_INVENTORY_BUFFER = {}'.format( ImpinjR2KGlobalErrors.to_string( value[0] ) ) )
+        try:
+            for _ in range( loop ):
+                value = ImpinjR2KReader.analyze_data( 'DATA' )( lambda x, y : y )( self, None )
+                tags.append( self.__unpack_inventory_buffer( value ) )
+        finally:
+            ### Bugfix:20200302 Unread responses are dropped as stale by ImpinjR2KDispatcher.
+            self.command_queue.release( )
         return tags
     
+    def drain_inventory_buffer( self, reset=True, timeout=3 ):
+        """ Stream the inventory buffer without knowing its size.
+            R2000.inventory( repeat=5 )
+            for ant, rssi, epc in R2000.drain_inventory_buffer( ):
+                print( ant, rssi, epc )
+
+            @param  reset = True    # GET_AND_RESET_INVENTORY_BUFFER ( else GET_INVENTORY_BUFFER ).
+            @return : generator of ( ant, rssi, epc ), it stops after the tag count of the first
+                      response, on BUFFER_IS_EMPTY_ERROR or on timeout.
+            Send no other command from this thread until the generator is exhausted or closed.
+        """
+        if reset:
+            self.protocol.get_and_reset_inventory_buffer( )
+        else:
+            self.protocol.get_inventory_buffer( )
+
+        remaining = None
+        try:
+            while remaining != 0:
+                try:
+                    value = self.command_queue.get( timeout=timeout )['data']
+                except queue.Empty:
+                    logging.error( '[ERROR] Inventory buffer drain is timeout.' )
+                    return
+                if len( value ) <= 1:
+                    if value[0] != ImpinjR2KGlobalErrors.BUFFER_IS_EMPTY_ERROR:
+                        logging.error( ImpinjR2KGlobalErrors.to_string( value[0] ) )
+                    return
+
+                remaining = ( ( ( value[0] << 8 ) | value[1] ) if remaining is None else remaining ) - 1
+                tag = decode_buffer_tag( value )
+                if tag is None:
+                    logging.error( 'Inventory buffer frame or TAGS CRC16 is ERROR.' )
+                    continue
+                yield tag[1], tag[2], tag[3].hex( ).upper( )
+        finally:
+            self.command_queue.release( )
+
     @analyze_data( )
     def reset_inventory_buffer( self ):
         self.protocol.reset_inventory_buffer()
@@ -406,7 +585,10 @@ class ImpinjR2KReader( object ):
             return ''
 
         self.protocol.read( bank=bank, addr=address, size=size, password=password )
-        value = ImpinjR2KReader.analyze_data( 'DATA', timeout=5 )( lambda x, y : y )( self, None )
+        try:
+            value = ImpinjR2KReader.analyze_data( 'DATA', timeout=5 )( lambda x, y : y )( self, None )
+        finally:
+            self.command_queue.release( )   # READ is a stream command, its waiter would take every later response.
 
         try:
             count, length = struct.unpack( '>HB', value[0:3] )
@@ -466,7 +648,10 @@ class ImpinjR2KReader( object ):
             logging.error( 'Data must be hex string.' )
             return ''
 
-        value = ImpinjR2KReader.analyze_data( 'DATA' )( lambda x, y : y )( self, None )
+        try:
+            value = ImpinjR2KReader.analyze_data( 'DATA' )( lambda x, y : y )( self, None )
+        finally:
+            self.command_queue.release( )   # WRITE_BLOCK is a stream command.
 
         try:
             count, length = struct.unpack( '>HB', value[0:3] )
@@ -500,6 +685,20 @@ class ImpinjR2KReader( object ):
 
         return epc
 
+    def access( self, jobs, window=4, retries=2, timeout=5 ):
+        """ Read / write many tags, see ImpinjR2KAccess.
+            jobs = [ ( epc, bank, address, data ), ... ]     # data : hex string ( write ) or words ( read )
+            @return : [ ImpinjR2KAccessResult( epc, bank, address, success, data, error, attempts, latency ), ... ]
+        """
+        return ImpinjR2KAccess( self, window=window, retries=retries, timeout=timeout ).run( jobs )
+
+    def encode( self, assignments, **kwargs ):
+        """ Encoding station, see ImpinjEncodingStation.
+            for result in R2000.encode( [ [ ( 'EPC', 2, NEW_EPC ) ] ] ).run( ):
+                print( result )
+        """
+        return ImpinjEncodingStation( self, assignments, **kwargs )
+
     # # # -------------------------------------------------
     @analyze_data( )
     def set_frequency_region_user( self, start_khz, space_khz, quantity ):
@@ -556,5 +755,6 @@ class ImpinjR2KReader( object ):
         return sum( data ) / len( data )
 
     def get_variance( self, data:list ):
-        average = get_average( data )
+        """ See rounds.variance for the vectorized version. """
+        average = self.get_average( data )
         return sum( [ ( x - average ) ** 2 for x in data ] ) / len( data )
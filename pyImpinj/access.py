@@ -0,0 +1,160 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 batch tag access."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 pipelined read / write of many tags.
+# Package:  pip3 install libscrc.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+
+import time
+import queue
+import struct
+import libscrc
+import logging
+import collections
+
+from .enums    import ImpinjR2KCommands, ImpinjR2KGlobalErrors
+from .protocol import ImpinjR2KProtocols
+
+### Transient errors, the job is tried again.
+RETRY_ERRORS = frozenset( [ ImpinjR2KGlobalErrors.FAIL_TO_GET_RN16_FROM_TAG,
+                            ImpinjR2KGlobalErrors.NO_TAG_ERROR ] )
+
+ImpinjR2KAccessResult = collections.namedtuple( 'ImpinjR2KAccessResult',
+                                                [ 'epc', 'bank', 'address', 'success', 'data', 'error', 'attempts', 'latency' ] )
+
+def parse_access( command, value ):
+    """ Decode a READ / WRITE / WRITE_BLOCK response.
+        Count(2B) -- DataLen(1B) -- PC(2B) -- EPC -- CRC(2B) -- [ Data ] -- ReadLen or ErrorCode(1B) -- AntID(1B) -- Count(1B)
+        @return : ( epc, error_code, data ), error_code is SUCCESS for a read.
+    """
+    if len( value ) <= 1:
+        return None, value[0], b''
+    try:
+        pc = struct.unpack( '>H', value[3:5] )[0]
+    except struct.error:
+        return None, ImpinjR2KGlobalErrors.FAIL, b''
+    size = ( ( pc & 0xF800 ) >> 10 ) & 0x003E
+    crc  = struct.unpack( '>H', value[size+5:size+7] )[0]
+    if crc != ( libscrc.xmodem( value[3:size+5], 0xFFFF ) ^ 0xFFFF ):
+        return None, ImpinjR2KGlobalErrors.FAIL, b''
+    if command == ImpinjR2KCommands.READ:
+        return value[5:size+5], ImpinjR2KGlobalErrors.SUCCESS, value[size+7:size+7+value[-3]]
+    return value[5:size+5], value[-3], b''
+
+class ImpinjR2KAccess( object ):
+    """ Read / write many tags, the frames of several jobs are written at once.
+
+        jobs = [ ( 'E20000000000000000000001', 'USER', 0, '11112222' ),   # Write ( hex string )
+                 ( 'E20000000000000000000001', 'TID',  0, 6 ),            # Read 6 words
+                 ( 'E20000000000000000000002', 'EPC',  2, 'E200...', [ 0 ]*4 ) ]
+        for result in R2000.access( jobs ):
+            print( result.epc, result.success, result.data, result.error, result.attempts, result.latency )
+
+        - SET_ACCESS_EPC_MATCH is only sent when the EPC differs from the previous job.
+        - Up to @window jobs are in flight ( match + access frames in one write ).
+        - Jobs failing with RETRY_ERRORS are sent again, up to @retries times.
+        - A response with another EPC fails the job ( retried as NO_TAG_ERROR ).
+        - After a timeout the jobs in flight are sent again.
+    """
+    def __init__( self, reader, window=4, retries=2, timeout=5 ):
+        self.reader, self.window, self.retries, self.timeout = reader, window, retries, timeout
+        self.encoder = ImpinjR2KProtocols( address=reader.address )    # serial=None : returns bytes.
+        self.matched = None
+
+    def __frames( self, job ):
+        """ @return : [ ( frame, stage ) ] of one job, stage is 'match' or 'access'. """
+        epc, bank, address, data = job[:4]
+        password = job[4] if len( job ) > 4 else [ 0 ]*4
+        frames = list( )
+        if epc != self.matched:
+            frames.append( ( self.encoder.set_access_epc_match( 0, list( bytearray.fromhex( epc ) ) ), 'match' ) )
+            self.matched = epc
+        if isinstance( data, int ):
+            frame = self.encoder.read( bank=bank, addr=address, size=data, password=password )
+        else:
+            frame = self.encoder.write_block( list( bytearray.fromhex( data ) ), bank=bank, addr=address, password=password )
+        frames.append( ( frame, 'access' ) )
+        return frames
+
+    def __send( self, entries ):
+        dispatcher, frames = self.reader.command_queue, list( )
+        for entry in entries:
+            entry['waiters'] = list( )
+            for frame, stage in self.__frames( entry['job'] ):
+                entry['waiters'].append( ( dispatcher.register( frame[2], frame[3], stream=False ), stage ) )
+                frames.append( frame )
+            entry['sent'] = time.monotonic( )
+        try:
+            self.reader.ser.write( b''.join( frames ) )
+        except BaseException as err:
+            logging.error( err )
+
+    def __collect( self, entry ):
+        """ @return : ( error_code, data ) of one job, error_code is None on timeout. """
+        deadline   = entry['sent'] + self.timeout
+        error, data = ImpinjR2KGlobalErrors.FAIL, b''
+        for waiter, stage in entry['waiters']:
+            try:
+                value = waiter.get( timeout=max( 0, deadline - time.monotonic( ) ) )['data']
+            except queue.Empty:
+                return None, b''
+            if stage == 'match':
+                error = value[0]
+                if error != ImpinjR2KGlobalErrors.SUCCESS:
+                    self.matched = None
+                    return error, b''
+                continue
+            epc, error, data = parse_access( waiter.command, value )
+            if ( epc is not None ) and ( epc != bytes.fromhex( entry['job'][0] ) ):
+                logging.error( '[ACCESS] Response of {} instead of {}'.format( epc.hex( ).upper( ), entry['job'][0] ) )
+                error = ImpinjR2KGlobalErrors.NO_TAG_ERROR
+        return error, data
+
+    def __abort( self, flight, todo ):
+        """ Timeout: forget the frames in flight and send them again. """
+        for entry in reversed( flight ):
+            todo.appendleft( entry )
+        for entry in flight:
+            for waiter, _ in entry['waiters']:
+                self.reader.command_queue.release( waiter )
+        flight.clear( )
+        self.matched = None
+
+    def run( self, jobs ):
+        """ @return : [ ImpinjR2KAccessResult, ... ] in the order of @jobs. """
+        results = [ None ]*len( jobs )
+        todo    = collections.deque( [ dict( index=index, job=job, attempts=0 ) for index, job in enumerate( jobs ) ] )
+        flight  = collections.deque( )
+        self.matched = None
+
+        while todo or flight:
+            batch = list( )
+            while todo and ( len( flight ) + len( batch ) < self.window ):
+                entry = todo.popleft( )
+                entry['attempts'] += 1
+                batch.append( entry )
+            if batch:
+                self.__send( batch )
+                flight.extend( batch )
+
+            entry = flight.popleft( )
+            error, data = self.__collect( entry )
+            for waiter, _ in entry['waiters']:
+                self.reader.command_queue.release( waiter )
+            if error is None:
+                self.__abort( flight, todo )
+            if ( error in RETRY_ERRORS ) and ( entry['attempts'] <= self.retries ):
+                todo.appendleft( entry )
+                continue
+
+            epc, bank, address = entry['job'][:3]
+            latency = time.monotonic( ) - entry['sent']
+            results[ entry['index'] ] = ImpinjR2KAccessResult( epc, bank, address, error == ImpinjR2KGlobalErrors.SUCCESS,
+                                                               data.hex( ).upper( ),
+                                                               'Timeout' if error is None else ImpinjR2KGlobalErrors.to_string( error ),
+                                                               entry['attempts'], latency )
+        return results
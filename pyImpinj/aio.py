@@ -0,0 +1,216 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 asyncio reader."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 asyncio reader.
+# Package:  pip3 install pyserial-asyncio ( Only for serial ports ).
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+
+import asyncio
+import logging
+import collections
+
+try:
+    import serial_asyncio
+except ImportError:
+    serial_asyncio = None
+
+from .enums      import ImpinjR2KGlobalErrors
+from .enums      import ImpinjR2KFastSwitchInventory
+
+from .framer     import ImpinjR2KFramer
+from .records    import decode_tag_report
+from .protocol   import ImpinjR2KProtocols
+from .constant   import READER_ANTENNA
+from .dispatcher import TAG_COMMANDS
+
+class ImpinjR2KAsyncProtocol( asyncio.Protocol ):
+    def __init__( self, reader ):
+        self.reader = reader
+
+    def connection_made( self, transport ):
+        self.reader.transport = transport
+
+    def data_received( self, data ):
+        for packet in self.reader.framer.feed( data ):
+            self.reader.handle_packet( packet )
+
+    def connection_lost( self, exc ):
+        logging.debug( '[ERROR] Connection lost {}.'.format( exc ) )
+        self.reader.connection_lost( exc )
+
+class AsyncImpinjR2KReader( object ):
+    """ asyncio reader client ( one event loop can drive many readers ).
+
+        async def main( ):
+            R2000 = AsyncImpinjR2KReader( address=1 )
+            await R2000.connect( 'socket://192.168.1.116:4001' )   # or 'COM9' ( pyserial-asyncio )
+            await R2000.fast_power( 22 )
+            await R2000.rt_inventory( repeat=1 )
+            async for data in R2000:
+                print( data )
+
+        Tag reports are buffered up to @maxsize items, then the transport stops
+        reading until the consumer has caught up ( backpressure ).
+
+        When the connection is lost, the iteration ends after the buffered items
+        ( StopAsyncIteration on close( ), the connection error otherwise ) and
+        pending requests fail with ConnectionError.
+    """
+    def __init__( self, address=0xFF, compact=False, maxsize=1024 ):
+        self.address, self.compact, self.maxsize = address, compact, maxsize
+        self.framer    = ImpinjR2KFramer( address=address )
+        self.protocol  = ImpinjR2KProtocols( address=address, serial=self, listener=self.__expect )
+        self.transport = None
+        self.tags      = collections.deque( )
+        self.waiters   = dict( )
+        self.paused    = False
+        self.event     = None
+        self.future    = None
+        self.error     = None
+        self.stale     = 0
+
+    async def connect( self, port='COM1', baudrate=115200 ):
+        loop = asyncio.get_event_loop( )
+        self.event = asyncio.Event( )
+        self.error = None
+        factory = lambda : ImpinjR2KAsyncProtocol( self )
+        if port.startswith( 'socket://' ):
+            host, _, tcp_port = port[len( 'socket://' ):].partition( ':' )
+            await loop.create_connection( factory, host, int( tcp_port ) )
+        else:
+            if serial_asyncio is None:
+                raise ImportError( 'pyserial-asyncio is required for serial ports ( pip3 install pyserial-asyncio ).' )
+            await serial_asyncio.create_serial_connection( loop, factory, port, baudrate=baudrate )
+        return True
+
+    def close( self ):
+        if self.transport is not None:
+            self.transport.close( )
+
+    def write( self, data ):
+        """ Called by ImpinjR2KProtocols. """
+        if self.transport is None:
+            raise ConnectionError( 'Reader {} is not connected.'.format( self.address ) )
+        self.transport.write( data )
+        return len( data )
+
+    def connection_lost( self, exc ):
+        """ Wake up the consumer and fail every pending request. """
+        self.transport, self.paused = None, False
+        self.error = exc
+        for waiters in self.waiters.values( ):
+            while waiters:
+                future = waiters.popleft( )
+                if not future.done( ):
+                    future.set_exception( ConnectionError( 'Connection lost: {}'.format( exc ) ) )
+        if self.event is not None:
+            self.event.set( )
+
+    #-------------------------------------------------
+    def __expect( self, address, command ):
+        if command in TAG_COMMANDS:
+            self.future = None
+            return
+        self.future = asyncio.get_event_loop( ).create_future( )
+        self.waiters.setdefault( ( address, command ), collections.deque( ) ).append( self.future )
+
+    def handle_packet( self, packet ):
+        length, address, command, message = packet[1], packet[2], packet[3], packet[4:-1]
+        if command in TAG_COMMANDS:
+            item = decode_tag_report( length, command, message, compact=self.compact )
+            if item is None:
+                return
+            self.tags.append( item )
+            self.event.set( )
+            if ( not self.paused ) and ( len( self.tags ) >= self.maxsize ):
+                self.paused = True
+                self.transport.pause_reading( )
+            return
+
+        waiters = self.waiters.get( ( address, command ) )
+        while waiters:
+            future = waiters.popleft( )
+            if not future.done( ):      # Cancelled or timed out.
+                future.set_result( message )
+                return
+        self.stale += 1
+        logging.debug( '[AIO] Drop stale response {:02X}'.format( command ) )
+
+    async def request( self, name, *args, timeout=3, **kwargs ):
+        """ Send ImpinjR2KProtocols.<name>( *args, **kwargs ) and return the response data. """
+        getattr( self.protocol, name )( *args, **kwargs )
+        future, self.future = self.future, None
+        if future is None:
+            return None
+        try:
+            return await asyncio.wait_for( future, timeout )
+        except asyncio.TimeoutError:
+            logging.error( '[ERROR] {} is timeout.'.format( name ) )
+            return bytes( [ ImpinjR2KGlobalErrors.FAIL ] )
+
+    async def result( self, name, *args, timeout=3, **kwargs ):
+        data = await self.request( name, *args, timeout=timeout, **kwargs )
+        return ( True if data[0] == ImpinjR2KGlobalErrors.SUCCESS else False, ImpinjR2KGlobalErrors.to_string( data[0] ) )
+
+    #-------------------------------------------------
+    def __aiter__( self ):
+        return self
+
+    async def __anext__( self ):
+        while not self.tags:
+            if ( self.transport is None ) and ( self.error is not None ):
+                raise self.error
+            if ( self.transport is None ) or self.transport.is_closing( ):
+                raise StopAsyncIteration
+            self.event.clear( )
+            await self.event.wait( )
+
+        item = self.tags.popleft( )
+        if self.paused and ( self.transport is not None ) and ( len( self.tags ) <= self.maxsize // 2 ):
+            self.paused = False
+            self.transport.resume_reading( )
+        return item
+
+    #-------------------------------------------------
+    async def identifier( self ):
+        return await self.request( 'get_reader_identifier' )
+
+    async def set_rf_power( self, antenna1=20, antenna2=20, antenna3=20, antenna4=20 ):
+        return await self.result( 'set_rf_power', ant1=antenna1, ant2=antenna2, ant3=antenna3, ant4=antenna4 )
+
+    async def get_rf_power( self ):
+        return await self.request( 'get_rf_power' )
+
+    async def fast_power( self, value=22 ):
+        return await self.result( 'fast_power', value=value )
+
+    async def set_work_antenna( self, antenna=READER_ANTENNA['ANTENNA1'] ):
+        return await self.result( 'set_work_antenna', antenna=antenna )
+
+    async def get_work_antenna( self ):
+        return await self.request( 'get_work_antenna' )
+
+    async def beeper( self, mode=0 ):
+        return await self.result( 'beeper', mode=mode )
+
+    async def temperature( self ):
+        value = await self.request( 'temperature' )
+        return value[1]*( -1 if value[0] == 0 else 1 )
+
+    async def rt_inventory( self, repeat=1 ):
+        await self.request( 'rt_inventory', repeat=repeat )
+
+    async def session_inventory( self, session='S1', target='A', repeat=1 ):
+        await self.request( 'session_inventory', session=session, target=target, repeat=repeat )
+
+    async def fast_switch_ant_inventory( self, param = dict( A=ImpinjR2KFastSwitchInventory.ANTENNA1, Aloop=1,
+                                                             B=ImpinjR2KFastSwitchInventory.DISABLED, Bloop=1,
+                                                             C=ImpinjR2KFastSwitchInventory.DISABLED, Cloop=1,
+                                                             D=ImpinjR2KFastSwitchInventory.DISABLED, Dloop=1,
+                                                             Interval = 0,
+                                                             Repeat   = 1 ) ):
+        await self.request( 'fast_switch_ant_inventory', param=param )
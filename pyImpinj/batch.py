@@ -0,0 +1,76 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 batched tag delivery."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 batched tag delivery.
+# Package:  None.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+
+import time
+import threading
+
+from .records import is_tag
+
+class ImpinjTagBatcher( object ):
+    """ Queue-like wrapper that delivers tag reads as lists.
+
+        TAG_QUEUE = queue.Queue( 1024 )
+        batcher   = ImpinjTagBatcher( TAG_QUEUE, size=64, latency=0.05 )
+        batcher.put( tag )          # TAG_QUEUE.get( ) -> [ tag, tag, ... ]
+
+        A batch is flushed when it holds @size reads, when its first read is
+        older than @latency seconds, or before a DONE / ERROR item, which is
+        then forwarded on its own.
+    """
+    def __init__( self, queue, size=64, latency=0.05 ):
+        assert ( size > 0 ) and ( latency > 0 )
+        self.queue, self.size, self.latency = queue, size, latency
+        self.batch, self.deadline = [], None
+        self.condition = threading.Condition( )
+        self.alive   = True
+        self.flusher = threading.Thread( target=self.__run, daemon=True )
+        self.flusher.start( )
+
+    def __flush( self ):
+        if self.batch:
+            batch, self.batch, self.deadline = self.batch, [], None
+            self.queue.put( batch )
+
+    def __run( self ):
+        with self.condition:
+            while self.alive:
+                if self.deadline is None:
+                    self.condition.wait( )
+                    continue
+                remain = self.deadline - time.monotonic( )
+                if remain > 0:
+                    self.condition.wait( remain )
+                    continue
+                self.__flush( )
+
+    def put( self, item, block=True, timeout=None ):
+        with self.condition:
+            if not is_tag( item ):
+                self.__flush( )
+                self.queue.put( item, block, timeout )
+                return
+
+            self.batch.append( item )
+            if len( self.batch ) >= self.size:
+                self.__flush( )
+            elif self.deadline is None:
+                self.deadline = time.monotonic( ) + self.latency
+                self.condition.notify( )
+
+    def flush( self ):
+        with self.condition:
+            self.__flush( )
+
+    def close( self ):
+        with self.condition:
+            self.__flush( )
+            self.alive = False
+            self.condition.notify( )
@@ -0,0 +1,303 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 benchmark suite."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 decode / encode / end-to-end throughput ( machine-readable results ).
+# Package:  pip3 install libscrc pyserial.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+#
+# Usage:    python -m pyImpinj.benchmark --output bench-1.4.json
+#           python -m pyImpinj.benchmark --compare bench-1.3.json --tolerance 0.1     # exit 1 on regression
+#           python -m pyImpinj.benchmark --stream site.r2k                             # Capture file ( R2000.record ) or raw bytes
+
+import sys
+import json
+import time
+import queue
+import argparse
+import platform
+import threading
+import statistics
+
+from .enums     import ImpinjR2KCommands
+from .framer    import ImpinjR2KFramer
+from .capture   import ImpinjR2KReplay
+from .protocol  import ImpinjR2KProtocols
+from .simulator import ImpinjR2KSimulator, ImpinjTagPopulation
+
+class NullQueue( object ):
+    """ Queue-like sink that only counts. """
+    def __init__( self ):
+        self.count = 0
+
+    def put( self, item, block=True, timeout=None ):
+        self.count += 1
+
+class LoopbackSerial( object ):
+    """ Serial-like object: every written frame is answered in the calling thread by
+        an ImpinjR2KSimulator and fed to @factory.data_received ( no socket, no thread ).
+    """
+    def __init__( self, simulator, factory=None ):
+        self.simulator, self.factory = simulator, factory
+        self.framer = ImpinjR2KFramer( address=None )
+
+    def write( self, data ):
+        for packet in self.framer.feed( data ):
+            self.simulator.handle( packet, lambda frame, reads=0 : self.factory.data_received( frame ) )
+        return len( data )
+
+def synthetic_stream( tags=2000, repeat=10, command=ImpinjR2KCommands.REAL_TIME_INVENTORY, seed=1 ):
+    """ @return : Raw bytes of one simulated inventory ( @repeat passes over @tags tags ) and a DONE frame. """
+    population = ImpinjTagPopulation( count=tags, antennas=( 1, ), seed=seed )
+    simulator  = ImpinjR2KSimulator( address=1, population=population, speed=0, seed=seed )
+    encoder    = ImpinjR2KProtocols( address=1 )
+    frame      = encoder.rt_inventory( repeat=repeat ) if command == ImpinjR2KCommands.REAL_TIME_INVENTORY else encoder.inventory( repeat=repeat )
+    chunks     = list( )
+    simulator.handle( frame, lambda data, reads=0 : chunks.append( data ) )
+    return b''.join( chunks )
+
+def split( stream, size=4096 ):
+    """ ReaderThread hands data_received chunks of up to in_waiting bytes. """
+    return [ stream[ index:index + size ] for index in range( 0, len( stream ), size ) ]
+
+def measure( func, count, unit, min_time=0.2, rounds=5 ):
+    """ Best of @rounds, each round calls func( ) until @min_time elapsed.
+        func( ) processes @count items, @return : dict( value=items/s, unit, ... )
+    """
+    best, calls = 0.0, 0
+    for _ in range( rounds ):
+        loops, start = 0, time.perf_counter( )
+        while True:
+            func( )
+            loops += 1
+            elapsed = time.perf_counter( ) - start
+            if elapsed >= min_time:
+                break
+        best   = max( best, loops * count / elapsed )
+        calls += loops
+    return dict( value=best, unit=unit, higher_is_better=True, iterations=calls * count )
+
+#-------------------------------------------------
+### Benchmarks, each one returns a dict of results.
+
+def bench_framer( stream, **kwargs ):
+    chunks = split( stream )
+    frames = sum( len( packets ) for packets in map( ImpinjR2KFramer( address=None ).feed, chunks ) )
+    def loop( ):
+        framer = ImpinjR2KFramer( address=None )
+        for chunk in chunks:
+            framer.feed( chunk )
+    return dict( framer_feed=measure( loop, frames, 'frames/s', **kwargs ) )
+
+def bench_data_received( stream, **kwargs ):
+    from . import ImpinjProtocolFactory
+    chunks  = split( stream )
+    frames  = sum( len( packets ) for packets in map( ImpinjR2KFramer( address=None ).feed, chunks ) )
+    results = dict( )
+    for name, compact in ( ( 'data_received', False ), ( 'data_received_compact', True ) ):
+        factory = ImpinjProtocolFactory( NullQueue( ), NullQueue( ), address=None, compact=compact )
+        def loop( ):
+            for chunk in chunks:
+                factory.data_received( chunk )
+        results[ name ] = measure( loop, frames, 'frames/s', **kwargs )
+    return results
+
+def bench_handle_packet( stream, **kwargs ):
+    from . import ImpinjProtocolFactory
+    from .dispatcher import TAG_COMMANDS
+    packets = [ packet for packet in ImpinjR2KFramer( address=None ).feed( stream ) if packet[3] in TAG_COMMANDS ]
+    results = dict( )
+    for name, compact in ( ( 'handle_packet', False ), ( 'handle_packet_compact', True ) ):
+        factory = ImpinjProtocolFactory( NullQueue( ), NullQueue( ), address=None, compact=compact )
+        handle  = factory.handle_packet
+        def loop( ):
+            for packet in packets:
+                handle( packet )
+        results[ name ] = measure( loop, len( packets ), 'tags/s', **kwargs )
+    return results
+
+def bench_replay( replay, **kwargs ):
+    """ ImpinjR2KReplay.feed( speed=0 ) : capture file read ( gzip ) -- data_received -- package_queue. """
+    from . import ImpinjProtocolFactory
+    frames = len( ImpinjR2KFramer( address=None ).feed( replay.stream( ) ) )
+    def loop( ):
+        replay.feed( ImpinjProtocolFactory( NullQueue( ), NullQueue( ), address=None ), speed=0 )
+    return dict( replay=measure( loop, frames, 'frames/s', **kwargs ) )
+
+def bench_encode( **kwargs ):
+    encoder = ImpinjR2KProtocols( address=1 )
+    data    = list( range( 16 ) )
+    cases   = dict( encode_rt_inventory=lambda : encoder.rt_inventory( repeat=1 ),                  # FRAME_CACHE hit
+                    encode_read=lambda : encoder.read( bank='TID', addr=0, size=6 ),
+                    encode_write_block=lambda : encoder.write_block( data, bank='USER', addr=0 ) )    # Not cached
+    results = dict( )
+    for name, call in cases.items( ):
+        def loop( call=call ):
+            for _ in range( 100 ):
+                call( )
+        results[ name ] = measure( loop, 100, 'calls/s', **kwargs )
+    return results
+
+def loopback_reader( tags=200, compact=False ):
+    """ @return : ( ImpinjR2KReader, ImpinjR2KSimulator ) wired by LoopbackSerial. """
+    from . import ImpinjR2KReader, ImpinjProtocolFactory
+    simulator = ImpinjR2KSimulator( address=1, population=ImpinjTagPopulation( count=tags, antennas=( 1, ), seed=1 ), speed=0, seed=1 )
+    reader    = ImpinjR2KReader( NullQueue( ), address=1, compact=compact )
+    reader.protocol_factory = ImpinjProtocolFactory( reader.package_queue, reader.command_queue, reader.address, compact=compact )
+    reader.ser      = LoopbackSerial( simulator, reader.protocol_factory )
+    reader.protocol = ImpinjR2KProtocols( address=reader.address, serial=reader.ser, listener=reader.command_queue.expect )
+    return reader, simulator
+
+def bench_inventory_buffer( tags=2000, **kwargs ):
+    reader, simulator = loopback_reader( tags )
+    encoder = ImpinjR2KProtocols( address=1 )
+    simulator.handle( encoder.inventory( repeat=4 ), lambda data, reads=0 : None )
+    frames  = list( )
+    simulator.handle( encoder.get_inventory_buffer( ), lambda data, reads=0 : frames.append( data ) )
+    values  = [ frame[4:-1] for frame in frames ]
+    unpack  = reader._ImpinjR2KReader__unpack_inventory_buffer
+    def loop( ):
+        for value in values:
+            unpack( value )
+    return dict( unpack_inventory_buffer=measure( loop, len( values ), 'tags/s', **kwargs ) )
+
+def bench_read( **kwargs ):
+    """ read( ) = SET_ACCESS_EPC_MATCH + READ round trips and the response parse, in one thread. """
+    reader, simulator = loopback_reader( 16 )
+    epc = bytes( simulator.population.tags[0].epc ).hex( ).upper( )
+    assert reader.read( epc, bank='TID', address=0, size=6 ), 'read( ) failed on the loopback.'
+    def loop( ):
+        for _ in range( 20 ):
+            reader.read( epc, bank='TID', address=0, size=6 )
+    return dict( read=measure( loop, 20, 'calls/s', **kwargs ) )
+
+def bench_latency( samples=2000, **kwargs ):
+    """ Last byte of a tag frame handed to data_received -> item returned by package_queue.get( ). """
+    from . import ImpinjProtocolFactory
+    frame   = ImpinjR2KFramer( address=None ).feed( synthetic_stream( tags=8, repeat=1 ) )[0]      # One tag frame.
+    tags    = queue.Queue( )
+    factory = ImpinjProtocolFactory( tags, NullQueue( ), address=None )
+    arrived, stamps = threading.Event( ), list( )
+
+    def consumer( ):
+        for _ in range( samples ):
+            tags.get( )
+            stamps.append( time.perf_counter( ) )
+            arrived.set( )
+    worker = threading.Thread( target=consumer, daemon=True )
+    worker.start( )
+
+    latencies = list( )
+    for _ in range( samples ):
+        arrived.clear( )
+        start = time.perf_counter( )
+        factory.data_received( frame )
+        if not arrived.wait( 1 ):
+            break
+        latencies.append( ( stamps[-1] - start ) * 1e6 )
+    worker.join( 1 )
+    latencies.sort( )
+    percentile = lambda value : latencies[ min( len( latencies ) - 1, int( len( latencies ) * value ) ) ]
+    return dict( latency_e2e=dict( value=statistics.median( latencies ), unit='us', higher_is_better=False,
+                                   p90=percentile( 0.90 ), p99=percentile( 0.99 ), max=latencies[-1], iterations=len( latencies ) ) )
+
+def bench_socket( duration=2.0, **kwargs ):
+    """ rt_inventory against ImpinjR2KSimulator( speed=0 ) over socket:// : ReaderThread -- framer -- package_queue. """
+    from . import ImpinjR2KReader
+    simulator = ImpinjR2KSimulator( address=1, population=ImpinjTagPopulation( count=500, antennas=( 1, ), seed=1 ), speed=0, seed=1 )
+    tags      = queue.Queue( )
+    reader    = ImpinjR2KReader( tags, address=1, compact=True )
+    reader.connect( simulator.serve( ) )
+    reader.worker_start( )
+    count, start = 0, time.perf_counter( )
+    try:
+        while time.perf_counter( ) - start < duration:
+            reader.protocol.rt_inventory( repeat=10 )
+            while True:
+                item = tags.get( timeout=5 )
+                if isinstance( item, dict ):            # DONE / ERROR
+                    break
+                count += 1
+        elapsed = time.perf_counter( ) - start
+    finally:
+        reader.worker_close( )
+        simulator.close( )
+    return dict( inventory_socket=dict( value=count / elapsed, unit='tags/s', higher_is_better=True, iterations=count ) )
+
+#-------------------------------------------------
+
+def run( stream=None, quick=False, replay=None ):
+    """ @return : dict( meta, results={ name : dict( value, unit, higher_is_better, ... ) } )
+        @param  replay = ImpinjR2KReplay    # Its RX bytes are the stream, adds the replay benchmark.
+    """
+    from . import __version__
+    stream  = stream or ( replay.stream( ) if replay is not None else synthetic_stream( ) )
+    options = dict( min_time=0.05, rounds=2 ) if quick else dict( )
+    results = dict( )
+    if replay is not None:
+        results.update( bench_replay( replay, **options ) )
+    results.update( bench_framer( stream, **options ) )
+    results.update( bench_data_received( stream, **options ) )
+    results.update( bench_handle_packet( stream, **options ) )
+    results.update( bench_encode( **options ) )
+    results.update( bench_inventory_buffer( **options ) )
+    results.update( bench_read( **options ) )
+    results.update( bench_latency( samples=200 if quick else 2000 ) )
+    results.update( bench_socket( duration=0.5 if quick else 2.0 ) )
+    meta = dict( version=__version__, python=platform.python_version( ), implementation=platform.python_implementation( ),
+                 platform=platform.platform( ), machine=platform.machine( ), timestamp=time.strftime( '%Y-%m-%dT%H:%M:%S' ),
+                 stream_bytes=len( stream ) )
+    return dict( meta=meta, results=results )
+
+def compare( baseline, current, tolerance=0.10 ):
+    """ @return : [ ( name, baseline, current, change ) ] of the results worse than @tolerance ( 0.10 = 10% ). """
+    regressions = list( )
+    for name, result in current['results'].items( ):
+        old = baseline['results'].get( name )
+        if ( old is None ) or ( not old['value'] ):
+            continue
+        change = ( result['value'] - old['value'] ) / old['value']
+        if not result.get( 'higher_is_better', True ):
+            change = -change
+        if change < -tolerance:
+            regressions.append( ( name, old['value'], result['value'], change ) )
+    return regressions
+
+def main( argv=None ):
+    parser = argparse.ArgumentParser( prog='python -m pyImpinj.benchmark', description='pyImpinj benchmark suite.' )
+    parser.add_argument( '--output',    help='Write the JSON results to this file ( default: stdout ).' )
+    parser.add_argument( '--stream',    help='Capture file ( R2000.record ) or raw reader bytes for the decode benchmarks.' )
+    parser.add_argument( '--compare',   help='Baseline JSON results, exit 1 on regression.' )
+    parser.add_argument( '--tolerance', type=float, default=0.10, help='Allowed slowdown for --compare ( default: 0.10 ).' )
+    parser.add_argument( '--quick',     action='store_true', help='Shorter runs ( smoke test ).' )
+    args = parser.parse_args( argv )
+
+    stream, replay = None, None
+    if args.stream and ImpinjR2KReplay.is_capture( args.stream ):
+        replay = ImpinjR2KReplay.rotated( args.stream )
+    elif args.stream:
+        with open( args.stream, 'rb' ) as fp:
+            stream = fp.read( )
+    report = run( stream, quick=args.quick, replay=replay )
+
+    text = json.dumps( report, indent=2, sort_keys=True )
+    if args.output:
+        with open( args.output, 'w' ) as fp:
+            fp.write( text + '\n' )
+    else:
+        print( text )
+
+    if args.compare:
+        with open( args.compare ) as fp:
+            baseline = json.load( fp )
+        regressions = compare( baseline, report, args.tolerance )
+        for name, old, new, change in regressions:
+            sys.stderr.write( '[REGRESSION] {:<24} {:>14.1f} -> {:>14.1f} ( {:+.1%} )\n'.format( name, old, new, change ) )
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit( main( ) )
@@ -0,0 +1,104 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 multi-drop bus."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 multi-drop RS-485 bus manager.
+# Package:  pip3 install pyserial.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+
+import time
+import queue
+import struct
+import logging
+import threading
+
+from .enums import ImpinjR2KGlobalErrors
+
+class ImpinjR2KBus( object ):
+    """ Several addressed readers on one port ( e.g. one USB-485 adapter ).
+
+        BUS = ImpinjR2KBus( 'COM9' )
+        R1  = BUS.reader( 1, queue.Queue( 1024 ) )     # ImpinjR2KReader
+        R2  = BUS.reader( 2, queue.Queue( 1024 ) )
+        R1.fast_power( 22 )
+        print( BUS.inventory_round( repeat=5 ) )       # { 1 : [ ( ant, rssi, epc ), ... ], 2 : [ ... ] }
+
+        Every frame goes through one ImpinjR2KLink and is handed to the reader
+        that owns its address byte.
+
+        inventory_round( ) interleaves RF time: the buffered INVENTORY command is
+        sent to every reader, @stagger seconds apart, so all radios run at the
+        same time. The readers only answer once, at the end of their round, and
+        their buffers are then drained one after another.
+    """
+    def __init__( self, port, baudrate=115200, **kwargs ):
+        from . import ImpinjR2KReader
+        self.reader_class = ImpinjR2KReader
+        self.port, self.baudrate, self.kwargs = port, baudrate, kwargs
+        self.readers = dict( )
+        self.worker  = None
+        self.alive   = False
+
+    def reader( self, address, package_queue, **kwargs ):
+        """ @return : ImpinjR2KReader bound to @address on this bus. """
+        reader = self.reader_class( package_queue, address=address, **kwargs )
+        reader.connect( self.port, self.baudrate, reconnect=True, **self.kwargs )
+        reader.worker_start( )
+        self.readers[ address ] = reader
+        return reader
+
+    def close( self ):
+        self.stop( )
+        for reader in self.readers.values( ):
+            reader.worker_close( )
+        self.readers.clear( )
+
+    #-------------------------------------------------
+    def inventory_round( self, repeat=1, stagger=0.005, timeout=5 ):
+        """ @return : { address : [ ( ant, rssi, epc ), ... ] } """
+        pending = list( )
+        for address, reader in self.readers.items( ):
+            reader.protocol.inventory( repeat=repeat )
+            pending.append( ( address, reader ) )
+            time.sleep( stagger )
+
+        result, deadline = dict( ), time.monotonic( ) + timeout
+        for address, reader in pending:
+            try:
+                value = reader.command_queue.get( timeout=max( 0, deadline - time.monotonic( ) ) )['data']
+                antenna, tagcount, read_rate, read_total = struct.unpack( '>BHHI', value )
+            except queue.Empty:
+                logging.error( '[BUS] Reader {} inventory is timeout.'.format( address ) )
+                tagcount = None
+            except struct.error:
+                logging.error( '[BUS] Reader {} : {}'.format( address, ImpinjR2KGlobalErrors.to_string( value[0] ) ) )
+                tagcount = 0
+
+            if tagcount == 0:
+                result[ address ] = [ ]
+                continue
+            if tagcount is None:        # Missed the reply, ask the reader.
+                tagcount = reader.get_inventory_buffer_tag_count( )
+            result[ address ] = reader.get_and_reset_inventory_buffer( tagcount ) if tagcount else [ ]
+        return result
+
+    def start( self, package_queue, repeat=1, stagger=0.005 ):
+        """ Run inventory_round( ) continuously.
+            package_queue.put( dict( type='BUS', address=address, tags=[ ( ant, rssi, epc ), ... ] ) )
+        """
+        def run( ):
+            while self.alive:
+                for address, tags in self.inventory_round( repeat=repeat, stagger=stagger ).items( ):
+                    package_queue.put( dict( type='BUS', address=address, tags=tags ) )
+        self.alive  = True
+        self.worker = threading.Thread( target=run, daemon=True )
+        self.worker.start( )
+
+    def stop( self ):
+        self.alive = False
+        if self.worker is not None:
+            self.worker.join( )
+        self.worker = None
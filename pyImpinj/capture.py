@@ -0,0 +1,196 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 raw traffic capture and replay."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 capture of the raw serial bytes to a rotated binary log, offline replay.
+# Package:  None.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+
+import os
+import gzip
+import time
+import struct
+import threading
+
+### File  : Magic(6B) -- Version(1B) -- Flags(1B) -- Start(8B, epoch seconds)
+### Chunk : Timestamp(8B, us since Start) -- Direction(1B) -- Length(4B) -- Data
+MAGIC  = b'R2KCAP'
+HEADER = struct.Struct( '<6sBBd' )
+CHUNK  = struct.Struct( '<qBI' )
+
+RX, TX = 0, 1   # Reader -> host, host -> reader.
+
+class ImpinjR2KRecorder( object ):
+    """ Append timestamped raw chunks to a binary log file.
+
+        RECORDER = R2000.record( 'site.r2k', max_bytes=64*1024*1024, backups=10, compress=True )
+        ...
+        R2000.stop_record( )
+
+        @param  max_bytes : Rotate when the current file is larger ( uncompressed bytes, 0 = never ).
+                backups   : Rotated files kept ( site.r2k.1 is the newest, like logging.handlers ).
+                compress  : gzip the files ( the name is not changed, replay detects it ).
+                merge     : Chunks of the same direction closer than @merge seconds are stored as one
+                            ( ReaderThread often hands over a few bytes at a time ), 0 = keep every chunk.
+                flush     : Flush every stored chunk ( lose less on a crash, slower ).
+    """
+    def __init__( self, path, max_bytes=64*1024*1024, backups=5, compress=False, merge=0.001, flush=False ):
+        self.path, self.max_bytes, self.backups = path, max_bytes, backups
+        self.compress, self.merge, self.flush = compress, merge, flush
+        self.lock    = threading.Lock( )
+        self.file    = None
+        self.pending = None         # [ timestamp, direction, last, bytearray ]
+        self.chunks, self.bytes, self.rotations = 0, 0, 0
+        self.__open( )
+
+    def __open( self ):
+        self.start = time.time( )
+        self.file  = gzip.open( self.path, 'wb', compresslevel=6 ) if self.compress else open( self.path, 'wb' )
+        self.file.write( HEADER.pack( MAGIC, 1, 1 if self.compress else 0, self.start ) )
+        self.size  = HEADER.size
+
+    def __rotate( self ):
+        self.file.close( )
+        if self.backups > 0:
+            for index in range( self.backups - 1, 0, -1 ):
+                source = '{}.{}'.format( self.path, index )
+                if os.path.exists( source ):
+                    os.replace( source, '{}.{}'.format( self.path, index + 1 ) )
+            os.replace( self.path, self.path + '.1' )
+        self.rotations += 1
+        self.__open( )
+
+    def __store( self ):
+        timestamp, direction, _, data = self.pending
+        self.pending = None
+        self.file.write( CHUNK.pack( int( ( timestamp - self.start ) * 1e6 ), direction, len( data ) ) )
+        self.file.write( data )
+        if self.flush:
+            self.file.flush( )
+        self.size   += CHUNK.size + len( data )
+        self.chunks += 1
+        if self.max_bytes and ( self.size >= self.max_bytes ):
+            self.__rotate( )
+
+    def write( self, data, direction=RX ):
+        now = time.time( )
+        with self.lock:
+            if self.file is None:
+                return
+            self.bytes += len( data )
+            pending = self.pending
+            if ( pending is not None ) and ( pending[1] == direction ) and ( now - pending[2] <= self.merge ) and ( len( pending[3] ) < 0xFFFF ):
+                pending[2] = now
+                pending[3].extend( data )
+                return
+            if pending is not None:
+                self.__store( )
+            self.pending = [ now, direction, now, bytearray( data ) ]
+            if self.merge <= 0:
+                self.__store( )
+
+    def statistics( self ):
+        return dict( chunks=self.chunks, bytes=self.bytes, rotations=self.rotations )
+
+    def close( self ):
+        with self.lock:
+            if self.file is None:
+                return
+            if self.pending is not None:
+                self.__store( )
+            self.file.close( )
+            self.file = None
+
+class ImpinjR2KTap( object ):
+    """ Serial-like proxy that records what is written ( TX ) and passes everything through. """
+    def __init__( self, serial, recorder ):
+        self.serial, self.recorder = serial, recorder
+
+    def write( self, data ):
+        self.recorder.write( bytes( data ), TX )
+        return self.serial.write( data )
+
+    def __getattr__( self, name ):
+        return getattr( self.serial, name )
+
+class ImpinjR2KReplay( object ):
+    """ Read capture files back.
+
+        REPLAY = ImpinjR2KReplay( 'site.r2k.2', 'site.r2k.1', 'site.r2k' )    # Oldest first
+        REPLAY = ImpinjR2KReplay.rotated( 'site.r2k' )                          # Same thing
+
+        factory = ImpinjProtocolFactory( TAG_QUEUE, ImpinjR2KDispatcher( ), address=1 )
+        REPLAY.feed( factory, speed=1.0 )   # 1.0 = original timing, 10.0 = ten times faster, 0 = no waiting
+        stream = REPLAY.stream( )           # All RX bytes ( benchmark input )
+    """
+    def __init__( self, *paths ):
+        self.paths = paths
+
+    @classmethod
+    def rotated( cls, path ):
+        """ @path and its rotated files, oldest first. """
+        index = 1
+        while os.path.exists( '{}.{}'.format( path, index ) ):
+            index += 1
+        return cls( *( [ '{}.{}'.format( path, number ) for number in range( index - 1, 0, -1 ) ] + [ path ] ) )
+
+    @staticmethod
+    def open( path ):
+        """ @return : File object of @path, gzip files are detected by their magic. """
+        fp = open( path, 'rb' )
+        if fp.read( 2 ) == b'\x1f\x8b':
+            fp.close( )
+            return gzip.open( path, 'rb' )
+        fp.seek( 0 )
+        return fp
+
+    @staticmethod
+    def is_capture( path ):
+        with ImpinjR2KReplay.open( path ) as fp:
+            return fp.read( len( MAGIC ) ) == MAGIC
+
+    def chunks( self, direction=RX ):
+        """ Generator of ( timestamp, direction, data ), timestamp in epoch seconds.
+            @param  direction = None    # Both directions.
+        """
+        for path in self.paths:
+            with self.open( path ) as fp:
+                magic, version, _, start = HEADER.unpack( fp.read( HEADER.size ) )
+                if magic != MAGIC:
+                    raise ValueError( '{} is not a capture file.'.format( path ) )
+                while True:
+                    head = fp.read( CHUNK.size )
+                    if len( head ) < CHUNK.size:
+                        break                       # End of file ( or a chunk cut by a crash ).
+                    offset, way, length = CHUNK.unpack( head )
+                    data = fp.read( length )
+                    if len( data ) < length:
+                        break
+                    if ( direction is None ) or ( way == direction ):
+                        yield start + offset / 1e6, way, data
+
+    def stream( self ):
+        """ @return : The RX bytes of every chunk. """
+        return b''.join( data for _, _, data in self.chunks( ) )
+
+    def feed( self, factory, speed=1.0 ):
+        """ Replay the RX chunks into factory.data_received( ) ( ImpinjProtocolFactory ).
+            @return : dict( chunks, bytes, elapsed, duration ), duration is the recorded time span.
+        """
+        chunks, size, first, last = 0, 0, None, None
+        begin = time.monotonic( )
+        for timestamp, _, data in self.chunks( ):
+            first = timestamp if first is None else first
+            last  = timestamp
+            if speed > 0:
+                delay = ( timestamp - first ) / speed - ( time.monotonic( ) - begin )
+                if delay > 0:
+                    time.sleep( delay )
+            factory.data_received( data )
+            chunks += 1
+            size   += len( data )
+        return dict( chunks=chunks, bytes=size, elapsed=time.monotonic( ) - begin,
+                     duration=0 if first is None else last - first )
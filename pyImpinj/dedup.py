@@ -0,0 +1,109 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 streaming tag de-duplication."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 streaming tag de-duplication.
+# Package:  None.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+
+import time
+import threading
+import collections
+
+from .records  import TagRead, TagAggregate, is_tag
+from .constant import FREQUENCY_CHANNELS
+
+class ImpinjTagDeduplicator( object ):
+    """ Queue-like sink that emits one TagAggregate per EPC and time window.
+
+        TAG_QUEUE = queue.Queue( 1024 )
+        R2000 = ImpinjR2KReader( TAG_QUEUE, address=1, dedup_window=1.0 )
+
+        @param  window   : Window length ( Unit:s ). Aggregates are emitted when it ends.
+                capacity : Maximum EPCs held in one window. The least recently seen
+                           EPC is emitted early when the table is full ( LRU ).
+
+        The table is emptied at the end of every window, so memory stays flat
+        however many unique tags pass by. Non-tag items ( DONE / ERROR ) are
+        forwarded unchanged, after any window that has already expired. A
+        timer thread ends the window when no more reads arrive.
+    """
+    def __init__( self, queue, window=1.0, capacity=65536 ):
+        assert ( window > 0 ) and ( capacity > 0 )
+        self.queue, self.window, self.capacity = queue, window, capacity
+        self.table    = collections.OrderedDict( )
+        self.deadline = None
+        self.evicted  = 0
+        self.condition = threading.Condition( )
+        self.alive   = True
+        self.flusher = threading.Thread( target=self.__run, daemon=True )
+        self.flusher.start( )
+
+    def __run( self ):
+        with self.condition:
+            while self.alive:
+                if self.deadline is None:
+                    self.condition.wait( )
+                    continue
+                remain = self.deadline - time.time( )
+                if remain > 0:
+                    self.condition.wait( remain )
+                    continue
+                self.__flush( )
+
+    def __update( self, tag, now ):
+        if isinstance( tag, TagRead ):
+            epc, antenna, channel, rssi, now = tag.epc, tag.antenna, tag.channel, tag.rssi, tag.timestamp
+        else:
+            epc, antenna, channel, rssi = bytes.fromhex( tag['epc'] ), tag['antenna'], FREQUENCY_CHANNELS.get( tag['frequency'], 0 ), tag['rssi']
+
+        table = self.table
+        aggregate = table.get( epc )
+        if aggregate is None:
+            if len( table ) >= self.capacity:
+                self.evicted += 1
+                self.queue.put( table.popitem( last=False )[1] )
+            aggregate = table[ epc ] = TagAggregate( epc, now )
+        else:
+            table.move_to_end( epc )
+        aggregate.update( antenna, channel, rssi, now )
+
+    def put( self, item, block=True, timeout=None ):
+        with self.condition:
+            now = time.time( )
+            if ( self.deadline is not None ) and ( now >= self.deadline ):
+                self.__flush( )
+
+            if isinstance( item, list ):        # ImpinjTagBatcher
+                tags = item
+            elif is_tag( item ):
+                tags = [ item ]
+            else:
+                self.queue.put( item, block, timeout )
+                return
+
+            if self.deadline is None:
+                self.deadline = now + self.window
+                self.condition.notify( )
+            for tag in tags:
+                self.__update( tag, now )
+
+    def __flush( self ):
+        table, self.table, self.deadline = self.table, collections.OrderedDict( ), None
+        for aggregate in table.values( ):
+            self.queue.put( aggregate )
+
+    def flush( self ):
+        """ Emit every aggregate of the current window. """
+        with self.condition:
+            self.__flush( )
+
+    def close( self ):
+        """ Emit the current window and stop the timer thread. """
+        with self.condition:
+            self.__flush( )
+            self.alive = False
+            self.condition.notify( )
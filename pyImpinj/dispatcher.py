@@ -0,0 +1,130 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 response dispatcher."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 request/response correlation.
+# Package:  None.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+#           2026-10-17 Ver:1.4 [Heyn] Skip the waiters of threads that are gone.
+
+import time
+import queue
+import logging
+import threading
+import collections
+
+from .enums import ImpinjR2KCommands
+
+### Responses of these commands are tag reports ( ImpinjProtocolFactory.package_queue ).
+TAG_COMMANDS = frozenset( [ ImpinjR2KCommands.REAL_TIME_INVENTORY,
+                            ImpinjR2KCommands.ISO18000_6B_INVENTORY,
+                            ImpinjR2KCommands.FAST_SWITCH_ANT_INVENTORY,
+                            ImpinjR2KCommands.CUSTOMIZED_SESSION_TARGET_INVENTORY ] )
+
+### These commands answer with one frame per tag.
+STREAM_COMMANDS = frozenset( [ ImpinjR2KCommands.GET_INVENTORY_BUFFER,
+                               ImpinjR2KCommands.GET_AND_RESET_INVENTORY_BUFFER,
+                               ImpinjR2KCommands.READ,
+                               ImpinjR2KCommands.WRITE,
+                               ImpinjR2KCommands.WRITE_BLOCK,
+                               ImpinjR2KCommands.LOCK,
+                               ImpinjR2KCommands.KILL ] )
+
+class ImpinjR2KWaiter( object ):
+    """ Pending response(s) of one command. """
+    def __init__( self, address, command, stream=None ):
+        self.address, self.command = address, command
+        self.stream  = ( command in STREAM_COMMANDS ) if stream is None else stream
+        self.replies = queue.Queue( )
+        self.sent    = time.monotonic( )    # Cleared by the first response.
+        self.owner   = threading.current_thread( )
+
+    def get( self, timeout=None ):
+        return self.replies.get( timeout=timeout )
+
+class ImpinjR2KDispatcher( object ):
+    """ Queue-like command_queue that routes responses by ( address, command ).
+
+        Every frame written by ImpinjR2KProtocols registers a waiter first
+        ( ImpinjR2KProtocols( ..., listener=dispatcher.expect ) ). Responses go
+        to the oldest waiter of their ( address, command ). A response nobody is
+        waiting for ( e.g. a late reply after a timeout ) is dropped as stale
+        instead of being handed to the next caller. Waiters of threads that
+        have exited are skipped and removed.
+
+        get( timeout ) keeps the queue.Queue signature: it returns the next
+        response of the last command sent by the calling thread.
+
+        @param  metrics = ImpinjR2KMetrics  # Round-trip latency and timeouts per command.
+    """
+    def __init__( self, metrics=None ):
+        self.lock    = threading.Lock( )
+        self.local   = threading.local( )
+        self.waiters = dict( )
+        self.stale   = 0
+        self.metrics = metrics
+
+    def register( self, address, command, stream=None ):
+        """ @param  stream = False  # One response only, even for STREAM_COMMANDS ( pipelined tag access ). """
+        waiter = ImpinjR2KWaiter( address, command, stream )
+        with self.lock:
+            self.waiters.setdefault( ( address, command ), collections.deque( ) ).append( waiter )
+        return waiter
+
+    def expect( self, address, command ):
+        """ Called before a frame is written. Replaces the last waiter of this thread. """
+        if command in TAG_COMMANDS:
+            if self.metrics is not None:
+                self.metrics.sent( address, command )
+            return None
+        self.release( )
+        self.local.waiter = self.register( address, command )
+        return self.local.waiter
+
+    def release( self, waiter=None ):
+        """ Stop waiting for responses ( default: last command of this thread ). """
+        if waiter is None:
+            waiter, self.local.waiter = getattr( self.local, 'waiter', None ), None
+        if waiter is None:
+            return
+        with self.lock:
+            waiters = self.waiters.get( ( waiter.address, waiter.command ), () )
+            if waiter in waiters:
+                waiters.remove( waiter )
+
+    def put( self, item, block=True, timeout=None ):
+        key = ( item.get( 'address' ), item['command'] )
+        with self.lock:
+            waiters = self.waiters.get( key )
+            while waiters and ( not waiters[0].owner.is_alive( ) ):
+                waiters.popleft( )
+            if not waiters:
+                self.stale += 1
+                logging.debug( '[DISPATCHER] Drop stale response {}'.format( key ) )
+                return
+            waiter = waiters[0] if waiters[0].stream else waiters.popleft( )
+        if waiter.sent and ( self.metrics is not None ):
+            self.metrics.answered( waiter.command, time.monotonic( ) - waiter.sent )
+        waiter.sent = 0
+        waiter.replies.put( item )
+
+    def get( self, block=True, timeout=None ):
+        waiter = getattr( self.local, 'waiter', None )
+        if waiter is None:
+            raise queue.Empty
+        try:
+            return waiter.replies.get( block, timeout )
+        except queue.Empty:
+            if self.metrics is not None:
+                self.metrics.timeout( waiter.command )
+            self.release( )
+            raise
+
+    def qsize( self ):
+        """ @return : Responses received and not read yet. """
+        with self.lock:
+            waiters = [ waiter for pending in self.waiters.values( ) for waiter in pending ]
+        return sum( waiter.replies.qsize( ) for waiter in waiters )
@@ -0,0 +1,240 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 multi-process fleet runner."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 multi-process fleet runner.
+# Package:  pip3 install pyserial libscrc.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+
+import time
+import queue
+import logging
+import threading
+import multiprocessing
+import multiprocessing.connection
+
+from .enums    import ImpinjR2KRegion
+from .enums    import ImpinjR2KFastSwitchInventory
+from .records  import TagRead, is_tag
+
+def configure( reader, config ):
+    """ Apply the declarative @config to a connected ImpinjR2KReader. """
+    region = config.get( 'region' )
+    if region is not None:
+        reader.set_frequency_region( start=region['start'], stop=region['stop'], region=region.get( 'region', ImpinjR2KRegion.FCC ) )
+
+    power = config.get( 'power', 22 )
+    if isinstance( power, ( list, tuple ) ):
+        reader.set_rf_power( *power )
+    else:
+        reader.set_rf_power( power, power, power, power )
+
+def antenna_plan( config ):
+    """ @return : fast_switch_ant_inventory param of the 'fast' mode. """
+    antennas = config.get( 'antennas', [ 0 ] )
+    loops    = config.get( 'loops', [ 1 ]*len( antennas ) )
+    param = dict( Interval=config.get( 'interval', 0 ), Repeat=config.get( 'repeat', 1 ) )
+    for index, name in enumerate( 'ABCD' ):
+        param[ name ] = antennas[index] if index < len( antennas ) else ImpinjR2KFastSwitchInventory.DISABLED
+        param[ name + 'loop' ] = loops[index] if index < len( loops ) else 1
+    return param
+
+def is_connected( reader ):
+    """ True while the serial worker ( or the shared link ) of @reader is up. """
+    if reader.link is not None:
+        return reader.link.connected.is_set( )
+    return ( reader.serial_worker is not None ) and reader.serial_worker.alive
+
+def run_reader( config, conn, lock, stats, alive ):
+    """ Inventory loop of one reader ( worker process thread ). """
+    from . import ImpinjR2KReader
+
+    name  = config['name']
+    tags  = queue.Queue( 4096 )
+    stats[ name ] = dict( reads=0, rounds=0, errors=0, connected=False )
+    reader = ImpinjR2KReader( tags, address=config.get( 'address', 0xFF ), compact=True,
+                              batch_size=config.get( 'batch_size', 64 ), batch_latency=config.get( 'batch_latency', 0.05 ) )
+    try:
+        reader.connect( config['port'], config.get( 'baudrate', 115200 ), reconnect=config.get( 'reconnect', False ) )
+    except BaseException as err:
+        logging.error( '[FLEET] {} : {}'.format( name, err ) )
+        stats[ name ]['errors'] += 1
+        return
+    reader.worker_start( )
+    configure( reader, config )
+    stats[ name ]['connected'] = True
+
+    mode, repeat = config.get( 'mode', 'rt' ), config.get( 'repeat', 1 )
+    antennas, index = config.get( 'antennas', [ 0 ] ), 0
+    plan = antenna_plan( config )
+
+    def trigger( ):
+        nonlocal index
+        if mode == 'fast':
+            reader.fast_switch_ant_inventory( param=plan )
+            return
+        if len( antennas ) > 1:
+            reader.set_work_antenna( antennas[index] )
+            index = ( index + 1 ) % len( antennas )
+        if mode == 'session':
+            reader.session_inventory( session=config.get( 'session', 'S1' ), target=config.get( 'target', 'A' ), repeat=repeat )
+        else:
+            reader.rt_inventory( repeat=repeat )
+
+    try:
+        trigger( )
+        while alive.is_set( ):
+            try:
+                item = tags.get( timeout=config.get( 'timeout', 1 ) )
+            except queue.Empty:
+                item = None
+
+            stats[ name ]['connected'] = is_connected( reader )
+            if item is None:
+                if stats[ name ]['connected']:
+                    trigger( )
+                elif reader.link is None:   # Without reconnect the reader is gone for good.
+                    logging.error( '[FLEET] {} : connection lost.'.format( name ) )
+                    stats[ name ]['errors'] += 1
+                    break
+                continue
+
+            if isinstance( item, list ) or is_tag( item ):     # A batch, or a single read with batch_size=0.
+                batch = item if isinstance( item, list ) else [ item ]
+                stats[ name ]['reads'] += len( batch )
+                records = [ ( x.antenna, x.channel, x.rssi, x.epc, x.timestamp ) for x in batch ]
+                with lock:
+                    conn.send( ( 'TAGS', name, records ) )
+            elif item['type'] == 'DONE':
+                stats[ name ]['rounds'] += 1
+                trigger( )
+            else:
+                stats[ name ]['errors'] += 1
+                with lock:
+                    conn.send( ( 'ERROR', name, item['logs'] ) )
+    finally:
+        stats[ name ]['connected'] = False
+        reader.worker_close( )
+
+def run_worker( configs, conn, heartbeat=1.0 ):
+    """ Worker process: one thread per reader, tag batches and health go to @conn. """
+    lock, stats, alive = threading.Lock( ), dict( ), threading.Event( )
+    alive.set( )
+    threads = [ threading.Thread( target=run_reader, args=( config, conn, lock, stats, alive ), daemon=True ) for config in configs ]
+    for thread in threads:
+        thread.start( )
+
+    try:
+        while any( [ thread.is_alive( ) for thread in threads ] ):
+            if conn.poll( heartbeat ) and conn.recv( ) == 'STOP':
+                break
+            with lock:
+                conn.send( ( 'HEALTH', None, { name : dict( value ) for name, value in stats.items( ) } ) )
+    finally:
+        alive.clear( )
+        for thread in threads:
+            thread.join( timeout=3 )
+
+class ImpinjR2KFleet( object ):
+    """ Run dozens of readers in several worker processes.
+
+        CONFIG = [ dict( name='DOCK1', port='COM9',  address=1, power=30, antennas=[ 0, 1 ], mode='rt', repeat=1,
+                         region=dict( region=ImpinjR2KRegion.FCC, start=902, stop=928 ) ),
+                   dict( name='DOCK2', port='socket://192.168.1.116:4001', address=1, power=[ 30, 30, 26, 26 ],
+                         antennas=[ 0, 1, 2, 3 ], mode='fast', reconnect=True ) ]
+
+        FLEET = ImpinjR2KFleet( CONFIG, workers=4 )
+        FLEET.start( )
+        while True:
+            for kind, name, data in FLEET.poll( timeout=1 ):
+                if kind == 'TAGS':
+                    print( name, FLEET.records( data ) )
+            print( FLEET.health( ) )
+
+        Config keys:
+            name, port, address, baudrate, reconnect,
+            power ( dBm or [ ANT1, ANT2, ANT3, ANT4 ] ), region ( dict( region, start, stop ) ),
+            antennas ( [ 0 ~ 3 ] ), loops, interval, mode ( 'rt', 'session', 'fast' ), repeat,
+            session, target, batch_size, batch_latency.
+
+        A worker that exits, or sends no heartbeat for @restart seconds, is restarted.
+        There are never more workers than readers. 'connected' ( health ) follows the link.
+    """
+    def __init__( self, configs, workers=None, heartbeat=1.0, restart=10.0 ):
+        workers = min( workers or multiprocessing.cpu_count( ), len( configs ) )   # No empty worker.
+        self.groups = [ configs[index::workers] for index in range( workers ) ]
+        self.heartbeat, self.restart = heartbeat, restart
+        self.workers  = [ None ]*workers
+        self.status   = dict( )
+        self.restarts = [ 0 ]*workers
+
+    def __spawn( self, index ):
+        parent, child = multiprocessing.Pipe( )
+        process = multiprocessing.Process( target=run_worker, args=( self.groups[index], child, self.heartbeat ), daemon=True )
+        process.start( )
+        self.workers[index] = dict( process=process, conn=parent, seen=time.monotonic( ) )
+
+    def start( self ):
+        for index in range( len( self.groups ) ):
+            self.__spawn( index )
+
+    def stop( self ):
+        for worker in self.workers:
+            if worker is None:
+                continue
+            try:
+                worker['conn'].send( 'STOP' )
+            except BaseException:
+                pass
+            worker['process'].join( timeout=5 )
+            if worker['process'].is_alive( ):
+                worker['process'].terminate( )
+            worker['conn'].close( )
+        self.workers = [ None ]*len( self.groups )
+
+    def supervise( self ):
+        """ Restart crashed or silent workers. """
+        now = time.monotonic( )
+        for index, worker in enumerate( self.workers ):
+            if worker is None:
+                continue
+            if ( not worker['process'].is_alive( ) ) or ( now - worker['seen'] > self.restart ):
+                logging.error( '[FLEET] Worker {} is down, restart it.'.format( index ) )
+                worker['process'].terminate( )
+                worker['process'].join( timeout=1 )
+                worker['conn'].close( )
+                self.restarts[index] += 1
+                self.__spawn( index )
+
+    def poll( self, timeout=1.0 ):
+        """ @return : [ ( 'TAGS', name, [ ( ant, channel, rssi, epc, timestamp ), ... ] ),
+                        ( 'ERROR', name, logs ), ... ]
+        """
+        conns  = { worker['conn'] : worker for worker in self.workers if worker is not None }
+        result = list( )
+        for conn in multiprocessing.connection.wait( list( conns ), timeout ):
+            worker = conns[ conn ]
+            try:
+                while conn.poll( ):
+                    kind, name, data = conn.recv( )
+                    worker['seen'] = time.monotonic( )
+                    if kind == 'HEALTH':
+                        self.status.update( data )
+                    else:
+                        result.append( ( kind, name, data ) )
+            except ( EOFError, OSError ):
+                pass
+        self.supervise( )
+        return result
+
+    def health( self ):
+        """ @return : { name : dict( reads, rounds, errors, connected ) } plus worker restarts. """
+        return dict( readers=dict( self.status ), restarts=list( self.restarts ) )
+
+    @staticmethod
+    def records( data ):
+        """ Turn a 'TAGS' payload back into TagRead records. """
+        return [ TagRead( antenna, channel, rssi, epc, timestamp ) for antenna, channel, rssi, epc, timestamp in data ]
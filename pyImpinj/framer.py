@@ -0,0 +1,133 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 frame scanner."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 frame scanner.
+# Package:  pip install libscrc.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+#           2026-10-17 Ver:1.4 [Heyn] Resynchronize on corrupt or truncated frames.
+#           2026-10-17 Ver:1.4 [Heyn] Look ahead of an incomplete candidate for complete frames.
+
+import libscrc
+
+class ImpinjR2KFramer( object ):
+    """ Chunk-level frame scanner.
+        Head(0xA0) -- Length -- Address -- Cmd -- Data -- Check
+
+        framer = ImpinjR2KFramer( address=1 )
+        for packet in framer.feed( data ):
+            print( packet )
+
+        @param  address = None  # Accept every address ( Bus mode ).
+
+        A candidate frame that fails the LRC check is not thrown away whole:
+        the scanner backtracks to the next 0xA0 after the bad header, so good
+        frames swallowed by a corrupted length byte are recovered.
+        An incomplete candidate does not hold back the bytes behind it either:
+        when a complete good frame already follows it in the buffer, the
+        candidate is rejected and the scanner resumes at that frame.
+            resync    : Number of rejected candidate headers.
+            discarded : Number of bytes that did not belong to any good frame.
+            recovered : Number of good frames found inside a rejected candidate.
+            received  : Number of bytes fed.
+            frames    : Number of good frames returned.
+            lrc       : Number of candidate frames with a bad LRC.
+            mismatch  : Number of good frames of another address.
+    """
+    HEAD = 0xA0
+    MIN_LENGTH = 3                  # Address -- Cmd -- Check
+
+    def __init__( self, address=0xFF ):
+        self.address = address
+        self.buffer  = bytearray()
+        self.shadow  = 0            # Head bytes of the buffer covered by a rejected candidate.
+        self.resync, self.discarded, self.recovered = 0, 0, 0
+        self.received, self.frames, self.lrc, self.mismatch = 0, 0, 0, 0
+
+    def reset( self ):
+        del self.buffer[:]
+        self.shadow = 0
+
+    def statistics( self ):
+        return dict( resync=self.resync, discarded=self.discarded, recovered=self.recovered,
+                     received=self.received, frames=self.frames, lrc=self.lrc, mismatch=self.mismatch )
+
+    def __ahead( self, data, view, start, size ):
+        """ @return : Position of the first complete good frame in data[start:size], or -1. """
+        while True:
+            start = data.find( self.HEAD, start, size - 1 )
+            if start < 0:
+                return -1
+            length = data[start+1]
+            end    = start + length + 2
+            if ( length >= self.MIN_LENGTH ) and ( end <= size ) and ( ( self.address is None ) or ( self.address == data[start+2] ) ):
+                with view[start:end] as frame:
+                    if libscrc.lrc( frame ) == 0:
+                        return start
+            start += 1
+
+    def feed( self, data ):
+        """ Scan a whole chunk and return the complete frames as a list of bytes.
+            An incomplete frame at the end of the chunk is kept for the next call.
+        """
+        self.received += len( data )
+        if self.buffer:
+            self.buffer.extend( data )
+            data = self.buffer
+
+        frames, offset, size, shadow = [], 0, len( data ), self.shadow
+        with memoryview( data ) as view:
+            while True:
+                start = data.find( self.HEAD, offset )
+                if ( start < 0 ) or ( start + 1 >= size ):
+                    start = size if start < 0 else start
+                    self.discarded += start - offset
+                    offset = start
+                    break
+                self.discarded += start - offset
+
+                length = data[start+1]
+                end    = start + length + 2
+                if end > size:              # Partial frame, wait for more bytes.
+                    ahead = self.__ahead( data, view, start + 1, size )
+                    if ahead < 0:
+                        offset = start
+                        break
+                    self.resync    += 1       # A good frame inside, the length byte is corrupt.
+                    self.discarded += ahead - start
+                    shadow = max( shadow, end )
+                    offset = ahead
+                    continue
+
+                if length >= self.MIN_LENGTH:
+                    with view[start:end] as frame:
+                        valid = ( libscrc.lrc( frame ) == 0 )   # Check if the package's crc is correct.
+                        if not valid:
+                            self.lrc += 1
+                        elif ( self.address is None ) or ( self.address == data[start+2] ):
+                            frames.append( bytes( frame ) )
+                        else:
+                            self.mismatch += 1
+                else:
+                    valid = False
+
+                if valid:
+                    if start < shadow:
+                        self.recovered += 1
+                    offset = end
+                else:                       # Backtrack to the next candidate header.
+                    self.resync    += 1
+                    self.discarded += 1
+                    shadow = max( shadow, end )
+                    offset = start + 1
+
+        self.shadow = max( 0, shadow - offset )
+        if data is self.buffer:
+            del self.buffer[:offset]
+        elif offset < size:
+            self.buffer.extend( data[offset:] )
+        self.frames += len( frames )
+        return frames
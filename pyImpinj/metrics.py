@@ -0,0 +1,230 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 metrics."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 hot-path counters, histograms and Prometheus text exporter.
+# Package:  None.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+
+import time
+import bisect
+import threading
+import collections
+
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+
+from .enums      import ImpinjR2KCommands
+from .records    import TagRead
+
+COMMAND_NAMES = { value : name for name, value in vars( ImpinjR2KCommands ).items( ) if name.isupper( ) }
+
+LATENCY_BUCKETS = ( 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0 )
+ROUND_BUCKETS   = ( 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0 )
+
+class ImpinjR2KHistogram( object ):
+    """ Fixed-bucket histogram ( upper bounds in seconds, +Inf is implicit ). """
+    __slots__ = ( 'buckets', 'counts', 'sum', 'count' )
+
+    def __init__( self, buckets=LATENCY_BUCKETS ):
+        self.buckets = tuple( buckets )
+        self.counts  = [ 0 ] * ( len( self.buckets ) + 1 )
+        self.sum, self.count = 0.0, 0
+
+    def observe( self, value ):
+        self.counts[ bisect.bisect_left( self.buckets, value ) ] += 1
+        self.sum   += value
+        self.count += 1
+
+    def snapshot( self ):
+        """ @return : dict( count, sum, mean, buckets=[ ( upper bound, cumulative count ) ] ) """
+        cumulative, total = list( ), 0
+        for bound, count in zip( self.buckets + ( float( 'inf' ), ), self.counts ):
+            total += count
+            cumulative.append( ( bound, total ) )
+        return dict( count=self.count, sum=self.sum, mean=self.sum / self.count if self.count else 0.0, buckets=cumulative )
+
+class ImpinjR2KMetrics( object ):
+    """ Counters and histograms of one reader ( ImpinjR2KReader.metrics ).
+
+        print( R2000.statistics( ) )                # Snapshot ( dict )
+        R2000.serve_metrics( port=9464 )            # http://127.0.0.1:9464/metrics ( Prometheus text )
+
+        Hot path ( ReaderThread ) :
+            report( address, command, item ) : Called by ImpinjProtocolFactory.handle_packet for every
+                                          decoded tag command item. Tags per antenna, ERROR items, the
+                                          host-measured round duration ( command sent -> DONE ) and the
+                                          duration reported by the reader ( FAST_SWITCH_ANT_INVENTORY ).
+        Commands ( ImpinjR2KDispatcher ) :
+            sent( address, command )    : A tag command was written ( start of a round ).
+            answered( command, elapsed ): First response of a command, round-trip latency per command.
+            timeout( command )          : get( ) timed out.
+        Everything else ( framer counters, queue depth and drops ) is read at snapshot time from the
+        callbacks registered with collect( name, func ).
+    """
+    def __init__( self, window=5.0 ):
+        self.window   = window                                          # Seconds of tag_rate
+        self.lock     = threading.Lock( )
+        self.started  = time.time( )
+        self.antennas = [ 0 ]*5                                         # Index 1 ~ 4
+        self.errors   = collections.Counter( )                          # Tag command ERROR items
+        self.timeouts = collections.Counter( )                          # Command code : count
+        self.latency  = collections.defaultdict( ImpinjR2KHistogram )   # Command code : round trip
+        self.rounds   = ImpinjR2KHistogram( ROUND_BUCKETS )
+        self.reported = ImpinjR2KHistogram( ROUND_BUCKETS )
+        self.pending  = dict( )                                         # ( address, tag command ) : time sent
+        self.sources  = collections.OrderedDict( )                      # name : func( ) -> number
+        self.samples  = collections.deque( [ ( time.monotonic( ), [ 0 ]*5 ) ] )
+
+    #-------------------------------------------------
+    ### Hot path
+    def report( self, address, command, item ):
+        """ One decoded tag command item ( TAG, DONE or ERROR ). """
+        if isinstance( item, TagRead ):
+            self.antennas[ item.antenna ] += 1
+            return
+        kind = item['type']
+        if kind == 'TAG':
+            self.antennas[ item['antenna'] ] += 1
+        elif kind == 'DONE':
+            sent = self.pending.pop( ( address, command ), None )
+            if sent is not None:
+                self.rounds.observe( time.monotonic( ) - sent )
+            if command == ImpinjR2KCommands.FAST_SWITCH_ANT_INVENTORY:
+                self.reported.observe( item['duration'] / 1000.0 )
+        else:
+            self.errors[ item.get( 'antenna', 0 ) ] += 1
+
+    #-------------------------------------------------
+    ### Commands
+    def sent( self, address, command ):
+        self.pending[ ( address, command ) ] = time.monotonic( )
+
+    def answered( self, command, elapsed ):
+        with self.lock:
+            self.latency[ command ].observe( elapsed )
+
+    def timeout( self, command ):
+        self.timeouts[ command ] += 1
+
+    #-------------------------------------------------
+    def collect( self, name, func ):
+        """ Register a value read at snapshot time ( e.g. a queue depth ). """
+        self.sources[ name ] = func
+
+    def rates( self ):
+        """ @return : [ tags/s of antenna 1 ~ 4 ] over the last @window seconds ( or since the
+                      oldest call, any number of callers see the same rate ).
+        """
+        now, counts = time.monotonic( ), list( self.antennas )
+        with self.lock:
+            samples = self.samples
+            while ( len( samples ) > 1 ) and ( now - samples[1][0] >= self.window ):
+                samples.popleft( )
+            last, previous = samples[0]
+            samples.append( ( now, counts ) )
+        elapsed = max( now - last, 1e-6 )
+        return [ ( counts[ index ] - previous[ index ] ) / elapsed for index in range( 1, 5 ) ]
+
+    def snapshot( self ):
+        values = dict( )
+        for name, func in list( self.sources.items( ) ):
+            try:
+                values[ name ] = func( )
+            except BaseException:
+                values[ name ] = None
+        with self.lock:
+            latency = { COMMAND_NAMES.get( command, hex( command ) ) : histogram.snapshot( ) for command, histogram in self.latency.items( ) }
+        return dict( uptime=time.time( ) - self.started,
+                     tags={ antenna : self.antennas[ antenna ] for antenna in range( 1, 5 ) },
+                     tag_rate=dict( zip( range( 1, 5 ), self.rates( ) ) ),
+                     tag_errors=dict( self.errors ),
+                     rounds=self.rounds.snapshot( ),
+                     rounds_reported=self.reported.snapshot( ),
+                     command_latency=latency,
+                     command_timeouts={ COMMAND_NAMES.get( command, hex( command ) ) : count for command, count in self.timeouts.items( ) },
+                     **values )
+
+    #-------------------------------------------------
+    @staticmethod
+    def prometheus( snapshot, prefix='pyimpinj', labels=None ):
+        """ @return : Prometheus text exposition ( version 0.0.4 ) of a snapshot( ). """
+        base  = dict( labels or dict( ) )
+        lines = list( )
+
+        def label( **extra ):
+            pairs = dict( base, **extra )
+            return '{' + ','.join( '{}="{}"'.format( key, value ) for key, value in sorted( pairs.items( ) ) ) + '}' if pairs else ''
+
+        def metric( name, kind, samples ):
+            lines.append( '# TYPE {}_{} {}'.format( prefix, name, kind ) )
+            for suffix, extra, value in samples:
+                lines.append( '{}_{}{}{} {}'.format( prefix, name, suffix, label( **extra ), float( value ) ) )
+
+        def histogram( extra, data ):
+            samples = [ ( '_bucket', dict( extra, le='+Inf' if bound == float( 'inf' ) else repr( bound ) ), count ) for bound, count in data['buckets'] ]
+            return samples + [ ( '_sum', extra, data['sum'] ), ( '_count', extra, data['count'] ) ]
+
+        metric( 'uptime_seconds', 'gauge', [ ( '', dict( ), snapshot['uptime'] ) ] )
+        metric( 'tags_total', 'counter', [ ( '', dict( antenna=antenna ), count ) for antenna, count in snapshot['tags'].items( ) ] )
+        metric( 'tag_rate', 'gauge', [ ( '', dict( antenna=antenna ), rate ) for antenna, rate in snapshot['tag_rate'].items( ) ] )
+        metric( 'tag_errors_total', 'counter', [ ( '', dict( antenna=antenna ), count ) for antenna, count in snapshot['tag_errors'].items( ) ] )
+        metric( 'round_seconds', 'histogram', histogram( dict( ), snapshot['rounds'] ) )
+        metric( 'round_reported_seconds', 'histogram', histogram( dict( ), snapshot['rounds_reported'] ) )
+        samples = list( )
+        for command, data in sorted( snapshot['command_latency'].items( ) ):
+            samples += histogram( dict( command=command ), data )
+        metric( 'command_latency_seconds', 'histogram', samples )
+        metric( 'command_timeouts_total', 'counter', [ ( '', dict( command=command ), count ) for command, count in sorted( snapshot['command_timeouts'].items( ) ) ] )
+
+        fixed = ( 'uptime', 'tags', 'tag_rate', 'tag_errors', 'rounds', 'rounds_reported', 'command_latency', 'command_timeouts' )
+        for name, value in sorted( snapshot.items( ) ):
+            if ( name not in fixed ) and isinstance( value, ( int, float ) ) and not isinstance( value, bool ):
+                metric( name, 'counter' if name.endswith( '_total' ) else 'gauge', [ ( '', dict( ), value ) ] )
+        return '\n'.join( lines ) + '\n'
+
+class ThreadingHTTPServer( ThreadingMixIn, HTTPServer ):
+    daemon_threads = True
+
+class ImpinjR2KMetricsServer( threading.Thread ):
+    """ Prometheus exporter on a local HTTP thread ( GET /metrics ).
+
+        server = ImpinjR2KMetricsServer( R2000.statistics, port=9464, labels=dict( reader='dock-1' ) )
+        server.start( )     # R2000.serve_metrics( ) does both.
+        server.close( )
+    """
+    def __init__( self, snapshot, host='127.0.0.1', port=9464, labels=None ):
+        super( ImpinjR2KMetricsServer, self ).__init__( )
+        self.daemon = True
+        render = lambda : ImpinjR2KMetrics.prometheus( snapshot( ), labels=labels ).encode( 'utf-8' )
+
+        class Handler( BaseHTTPRequestHandler ):
+            def do_GET( self ):
+                if self.path.split( '?' )[0] not in ( '/', '/metrics' ):
+                    self.send_error( 404 )
+                    return
+                body = render( )
+                self.send_response( 200 )
+                self.send_header( 'Content-Type', 'text/plain; version=0.0.4; charset=utf-8' )
+                self.send_header( 'Content-Length', str( len( body ) ) )
+                self.end_headers( )
+                self.wfile.write( body )
+
+            def log_message( self, *args ):
+                pass
+
+        self.server = ThreadingHTTPServer( ( host, port ), Handler )
+
+    @property
+    def url( self ):
+        return 'http://{}:{}/metrics'.format( *self.server.server_address[:2] )
+
+    def run( self ):
+        self.server.serve_forever( poll_interval=0.5 )
+
+    def close( self ):
+        self.server.shutdown( )
+        self.server.server_close( )
@@ -0,0 +1,98 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 pipelined commands."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 pipelined command execution.
+# Package:  None.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+
+import time
+import queue
+import logging
+import collections
+
+from .enums      import ImpinjR2KCommands, ImpinjR2KGlobalErrors
+from .protocol   import ImpinjR2KProtocols
+from .dispatcher import TAG_COMMANDS, STREAM_COMMANDS
+
+### These commands answer with data instead of a status byte.
+DATA_COMMANDS = frozenset( [ value for name, value in vars( ImpinjR2KCommands ).items( ) if name.startswith( 'GET_' ) ] +
+                           [ ImpinjR2KCommands.INVENTORY ] ) | STREAM_COMMANDS
+
+ImpinjR2KResult = collections.namedtuple( 'ImpinjR2KResult', [ 'command', 'success', 'data', 'error' ] )
+
+class ImpinjR2KPipeline( object ):
+    """ Queue several ImpinjR2KProtocols frames, write them in one serial.write
+        and collect the matching responses in order.
+
+        with R2000.pipeline( ) as pipe:
+            pipe.set_rf_power( ant1=30, ant2=30, ant3=30, ant4=30 )
+            pipe.set_work_antenna( antenna=READER_ANTENNA['ANTENNA1'] )
+            pipe.set_frequency_region( region=ImpinjR2KRegion.FCC, start=7, stop=59 )
+            pipe.beeper( mode=0 )
+            pipe.get_reader_identifier( )
+        for result in pipe.results:
+            print( result )
+
+        Method names and parameters are those of ImpinjR2KProtocols.
+        One ImpinjR2KResult( command, success, data, error ) per command:
+            status commands : success = ( data[0] == SUCCESS )
+            data commands   : success = True when the response arrived ( first frame only ).
+            tag commands    : success = None, tag reports go to package_queue.
+    """
+    def __init__( self, reader, timeout=3 ):
+        self.reader, self.timeout = reader, timeout
+        self.encoder = ImpinjR2KProtocols( address=reader.address )    # serial=None : returns bytes.
+        self.frames, self.results = [], []
+
+    def __getattr__( self, name ):
+        method = getattr( self.encoder, name )
+        def append( *args, **kwargs ):
+            self.frames.append( method( *args, **kwargs ) )
+            return self
+        return append
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        if exc_type is None:
+            self.execute( )
+
+    def execute( self, timeout=None ):
+        """ @return : [ ImpinjR2KResult, ... ] in the order the commands were queued. """
+        timeout    = self.timeout if timeout is None else timeout
+        dispatcher = self.reader.command_queue
+        frames, self.frames = self.frames, []
+        waiters = [ None if frame[3] in TAG_COMMANDS else dispatcher.register( frame[2], frame[3] ) for frame in frames ]
+
+        try:
+            self.reader.ser.write( b''.join( frames ) )
+        except BaseException as err:
+            logging.error( err )
+
+        results, deadline = [], time.monotonic( ) + timeout
+        for frame, waiter in zip( frames, waiters ):
+            command = frame[3]
+            if waiter is None:
+                results.append( ImpinjR2KResult( command, None, None, '' ) )
+                continue
+            try:
+                data = waiter.get( timeout=max( 0, deadline - time.monotonic( ) ) )['data']
+            except queue.Empty:
+                results.append( ImpinjR2KResult( command, False, None, 'Timeout' ) )
+                continue
+            finally:
+                dispatcher.release( waiter )
+
+            if command in DATA_COMMANDS:
+                results.append( ImpinjR2KResult( command, True, data, '' ) )
+            else:
+                success = ( data[0] == ImpinjR2KGlobalErrors.SUCCESS )
+                results.append( ImpinjR2KResult( command, success, data, ImpinjR2KGlobalErrors.to_string( data[0] ) ) )
+
+        self.results = results
+        return results
@@ -11,10 +11,12 @@
 #           2020-02-19 Ver:1.1 [Heyn] New add some functions.
 #           2020-02-20 Ver:1.1 [Heyn] New add get_rf_port_return_loss function.
 #           2020-02-27 Ver:1.2 [Heyn] New add get(set)_frequency_region and get(set)_rf_link_profile
+#           2026-10-17 Ver:1.4 [Heyn] New add listener ( see dispatcher.py ).
+#           2026-10-17 Ver:1.4 [Heyn] Cached frame encoder.
 
-import struct
 import libscrc
 import logging
+import threading
 
 from .enums import ImpinjR2KRegion
 from .enums import ImpinjR2KCommands
@@ -30,30 +32,63 @@ class ImpinjR2KProtocols( object ):
         print( R2000.work_antenna(0) )
 
     """
+    FRAME_CACHE_SIZE = 1024
+    FRAME_CACHE      = dict()     # ( address, command, data ) : frame
+
+    def encode( self, command, data ):
+        """ @return : frame bytes, frames with short data ( <= 10 bytes ) are cached.
+                      Other frames are built in a reused buffer, copied once into the result.
+        """
+        key = ( self.__address, command, tuple( data ) ) if len( data ) <= 10 else None
+        if key is not None:
+            frame = ImpinjR2KProtocols.FRAME_CACHE.get( key )
+            if frame is not None:
+                return frame
+
+        size = len( data ) + 4
+        with self.__lock:
+            buffer, view = self.__buffer, self.__view
+            buffer[0], buffer[1], buffer[2], buffer[3] = self.__head, size - 1, self.__address, command
+            buffer[4:size] = data
+            buffer[size] = libscrc.lrc( view[:size] )
+            frame = bytes( view[:size+1] )
+
+        if key is not None:
+            if len( ImpinjR2KProtocols.FRAME_CACHE ) >= ImpinjR2KProtocols.FRAME_CACHE_SIZE:
+                ImpinjR2KProtocols.FRAME_CACHE.clear( )
+            ImpinjR2KProtocols.FRAME_CACHE[ key ] = frame
+        return frame
+
     def register( command ):
         def decorator( func ):
             def wrapper( self, *args, **kwargs ):
                 data = func( self, *args, **kwargs )
                 data = [] if data is None else data
-                message = [ self.__head ]
-                message.extend( [ 3 + len( data ), self.__address, command ] )
-                message.extend(  data   )
-                message.append( libscrc.lrc( bytes( message ) ) )
+                message = self.encode( command, data )
+                if ( self.listener is not None ) and ( self.serial is not None ):
+                    self.listener( self.__address, command )
                 self.__address = data[0] if command == ImpinjR2KCommands.SET_READER_ADDRESS else self.__address
-                logging.debug( [ hex(x) for x in message ] )
+                if logging.getLogger( ).isEnabledFor( logging.DEBUG ):
+                    logging.debug( [ hex(x) for x in message ] )
 
                 if self.serial is not None:
                     try:
-                        return self.serial.write( bytes( message ) )
+                        return self.serial.write( message )
                     except BaseException as err:
                         logging.error( err )
-                return bytes( message )
+                return message
             return wrapper
         return decorator
 
-    def __init__( self, address=0xFF, serial=None ):
-        self.serial = serial
+    def __init__( self, address=0xFF, serial=None, listener=None ):
+        """
+            @param  listener( address, command ) is called before each frame is written.
+        """
+        self.serial, self.listener = serial, listener
         self.__head, self.__address = 0xA0, address
+        self.__lock   = threading.Lock( )           # register( ) runs on user and ReaderThread threads.
+        self.__buffer = bytearray( 0xFF + 2 )       # Head -- Length(<=0xFF) -- ...
+        self.__view   = memoryview( self.__buffer )
 
     @register( ImpinjR2KCommands.RESET )
     def reset( self ):
@@ -0,0 +1,243 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 tag records."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 compact tag records.
+# Package:  None.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+#           2026-10-17 Ver:1.4 [Heyn] Move the tag report decoder here from ImpinjProtocolFactory.
+#           2026-10-17 Ver:1.4 [Heyn] New add decode_buffer_tag.
+
+import time
+import struct
+import libscrc
+
+from .enums    import ImpinjR2KCommands
+from .enums    import ImpinjR2KGlobalErrors
+from .constant import FREQUENCY_TABLES
+
+class TagRead( object ):
+    """ Compact tag report ( ImpinjR2KReader( ..., compact=True ) ).
+
+        antenna   : 1 ~ 4
+        channel   : Index of constant.FREQUENCY_TABLES
+        rssi      : dBm
+        epc       : Raw EPC bytes ( TagRead.epc_hex is encoded on demand ).
+        timestamp : time.time() when the frame was decoded.
+
+        Old dict consumers keep working:
+            data['type'] == 'TAG', data['epc'] == 'E200...', data['frequency'] == 902.5
+    """
+    __slots__ = ( 'antenna', 'channel', 'rssi', 'epc', 'timestamp' )
+
+    CACHE_SIZE = 4096
+    HEX_CACHE  = dict()
+
+    KEYS = ( 'type', 'antenna', 'frequency', 'rssi', 'epc' )
+
+    def __init__( self, antenna, channel, rssi, epc, timestamp=0.0 ):
+        self.antenna, self.channel, self.rssi = antenna, channel, rssi
+        self.epc, self.timestamp = epc, timestamp
+
+    @property
+    def frequency( self ):
+        return FREQUENCY_TABLES[ self.channel ]
+
+    @property
+    def epc_hex( self ):
+        cache = TagRead.HEX_CACHE
+        try:
+            return cache[ self.epc ]
+        except KeyError:
+            if len( cache ) >= TagRead.CACHE_SIZE:
+                cache.clear( )
+            value = cache[ self.epc ] = self.epc.hex( ).upper( )
+            return value
+
+    ### Compatibility adapter ( dict style access ).
+    def __getitem__( self, key ):
+        if key == 'type':
+            return 'TAG'
+        elif key == 'epc':
+            return self.epc_hex
+        elif key == 'frequency':
+            return self.frequency
+        elif key in ( 'antenna', 'rssi' ):
+            return getattr( self, key )
+        raise KeyError( key )
+
+    def __contains__( self, key ):
+        return key in TagRead.KEYS
+
+    def get( self, key, default=None ):
+        try:
+            return self[ key ]
+        except KeyError:
+            return default
+
+    def keys( self ):
+        return TagRead.KEYS
+
+    def to_dict( self ):
+        return dict( type='TAG', antenna=self.antenna, frequency=self.frequency, rssi=self.rssi, epc=self.epc_hex )
+
+    def __repr__( self ):
+        return 'TagRead(antenna={}, frequency={}, rssi={}, epc={})'.format( self.antenna, self.frequency, self.rssi, self.epc_hex )
+
+class TagAggregate( object ):
+    """ One tag seen during a de-dup window ( see dedup.py ).
+
+        epc        : Raw EPC bytes.
+        first_seen : time.time() of the first read.
+        last_seen  : time.time() of the last read.
+        count      : Number of reads.
+        rssi_max   : [ ANT1, ANT2, ANT3, ANT4 ] max RSSI ( None if never seen ).
+        rssi_mean  : [ ANT1, ANT2, ANT3, ANT4 ] mean RSSI ( None if never seen ).
+
+        Dict style access reports the strongest antenna, like a single TAG:
+            data['type'] == 'TAG', data['epc'], data['antenna'], data['rssi'], data['count']
+    """
+    __slots__ = ( 'epc', 'first_seen', 'last_seen', 'count', 'channel', 'rssi_max', 'rssi_sum', 'reads' )
+
+    KEYS = ( 'type', 'antenna', 'frequency', 'rssi', 'epc', 'count', 'first_seen', 'last_seen' )
+
+    def __init__( self, epc, timestamp ):
+        self.epc, self.first_seen, self.last_seen = epc, timestamp, timestamp
+        self.count, self.channel = 0, 0
+        self.rssi_max = [ None ]*4
+        self.rssi_sum = [ 0 ]*4
+        self.reads    = [ 0 ]*4
+
+    def update( self, antenna, channel, rssi, timestamp ):
+        index = antenna - 1
+        self.count    += 1
+        self.channel   = channel
+        self.last_seen = timestamp
+        self.reads[index]    += 1
+        self.rssi_sum[index] += rssi
+        if ( self.rssi_max[index] is None ) or ( rssi > self.rssi_max[index] ):
+            self.rssi_max[index] = rssi
+
+    @property
+    def rssi_mean( self ):
+        return [ ( total / reads ) if reads else None for total, reads in zip( self.rssi_sum, self.reads ) ]
+
+    @property
+    def antenna( self ):
+        return max( [ x for x in range( 4 ) if self.reads[x] ], key=lambda x : self.rssi_max[x] ) + 1
+
+    @property
+    def rssi( self ):
+        return self.rssi_max[ self.antenna - 1 ]
+
+    @property
+    def frequency( self ):
+        return FREQUENCY_TABLES[ self.channel ]
+
+    @property
+    def epc_hex( self ):
+        return TagRead.epc_hex.fget( self )
+
+    def __getitem__( self, key ):
+        if key == 'type':
+            return 'TAG'
+        elif key == 'epc':
+            return self.epc_hex
+        elif key in TagAggregate.KEYS:
+            return getattr( self, key )
+        raise KeyError( key )
+
+    def __contains__( self, key ):
+        return key in TagAggregate.KEYS
+
+    def get( self, key, default=None ):
+        try:
+            return self[ key ]
+        except KeyError:
+            return default
+
+    def keys( self ):
+        return TagAggregate.KEYS
+
+    def to_dict( self ):
+        return { key : self[ key ] for key in TagAggregate.KEYS }
+
+    def __repr__( self ):
+        return 'TagAggregate(epc={}, count={}, rssi_max={})'.format( self.epc_hex, self.count, self.rssi_max )
+
+def is_tag( item ):
+    """ True for TagRead, TagAggregate and dict( type='TAG' ) items. """
+    return isinstance( item, ( TagRead, TagAggregate ) ) or ( isinstance( item, dict ) and ( item.get( 'type' ) == 'TAG' ) )
+
+def decode_tag_report( length, command, message, compact=False ):
+    """ Decode the message of a tag command frame ( see dispatcher.TAG_COMMANDS ).
+        @return : TAG ( dict or TagRead ), DONE or ERROR item for package_queue, None to skip.
+                  The ERROR item of a failed command ( the last frame of it ) carries the error code.
+    """
+    if len( message ) <= 1:
+        return dict( type='ERROR', logs=ImpinjR2KGlobalErrors.to_string( message[0] ), code=message[0] )
+
+    ### Special process.
+    if length == 0x0A:        # Operation successful.
+        if command in ( ImpinjR2KCommands.REAL_TIME_INVENTORY, ImpinjR2KCommands.CUSTOMIZED_SESSION_TARGET_INVENTORY ):
+             ### Head -- Length(fix=0x0A) -- Address -- Cmd -- AntID(1B) -- ReadRate(2B) -- TotalRead(4B) -- Check
+            duration   = struct.unpack( '>H', message[1:3] )[0]
+            total_read = struct.unpack( '>I', message[3:7] )[0]
+        else:
+             ### Head -- Length(fix=0x0A) -- Address -- Cmd -- TotalRead(3B) -- CommandDuration(4B) -- Check
+            total_read = ((message[0]<<16) & 0x00FF0000) + ((message[1]<<8)& 0x0000FF00) + message[2]
+            duration   = struct.unpack( '>I', message[3:7] )[0]
+        return dict( type='DONE', total_read=total_read, duration=duration )
+
+    elif length == 0x04:      # Operation failed.
+        ### Head -- Length(fix=0x04) -- Address -- Cmd -- ErrorCode -- Check
+        return dict( type='ERROR', logs='{}'.format( ImpinjR2KGlobalErrors.to_string( message[0] ) ), code=message[0] )
+
+    antenna   = ( message[0] & 0x03 ) + 1
+    channel   = ( ( message[0] & 0xFC ) >> 2 ) & 0x3F
+
+    try:
+        pc = struct.unpack( '>H', message[1:3] )[0]
+    except BaseException:
+        if message[1] == ImpinjR2KGlobalErrors.ANTENNA_MISSING_ERROR:
+            return dict( type='ERROR', logs='Antenna-{} disconnect.'.format( antenna ), antenna=antenna )
+        return None
+
+    size = ( ( pc & 0xF800 ) >> 10 ) & 0x003E
+    if size == 0:
+        return dict( type='ERROR', logs='Nothing!' )
+
+    rssi = message[-1] - 129
+    if compact:
+        return TagRead( antenna, channel, rssi, message[3:size+3], time.time() )
+
+    epc  = ''.join( [ '%02X' % x for x in message[3:size+3] ] )     # Bugfix:20200224
+    return dict( type='TAG',
+                 antenna=antenna,
+                 frequency=FREQUENCY_TABLES[ channel ], rssi=rssi, epc=epc )
+
+BUFFER_STRUCTS = dict()     # DataLen : struct.Struct
+
+def decode_buffer_tag( data ):
+    """ Decode one GET(_AND_RESET)_INVENTORY_BUFFER response with one precompiled struct.Struct.
+        Count(2B) -- DataLen(1B) -- PC(2B) -- EPC -- CRC(2B) -- RSSI(1B) -- AntID(1B) -- InvCount(1B)
+        @return : ( count, ant, rssi, epc(bytes), invcount ) or None ( bad frame or CRC ).
+    """
+    if len( data ) < 10:
+        return None
+    length = data[2]
+    if ( length + 6 ) != len( data ):
+        return None
+
+    layout = BUFFER_STRUCTS.get( length )
+    if layout is None:
+        layout = BUFFER_STRUCTS[ length ] = struct.Struct( '>HBH{}sHBBB'.format( length - 4 ) )
+    count, _, pc, epc, crc, rssi, ant, invcount = layout.unpack( data )
+    if crc != ( libscrc.xmodem( data[3:length+1], 0xFFFF ) ^ 0xFFFF ):
+        return None
+
+    size = ( ( pc & 0xF800 ) >> 10 ) & 0x003E
+    return count, ( ant & 0x03 ) + 1, rssi - 129, epc[:size], invcount  # Bugfix:20200303
@@ -0,0 +1,214 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 shared-memory tag ring buffer."""
+# Python:   3.6.5+ ( 3.8+ for multiprocessing.shared_memory )
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 fixed-record ring buffer for zero-copy tag hand-off.
+# Package:  None.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+#           2026-10-17 Ver:1.4 [Heyn] Bugfix the consumer's resource_tracker unlinked the ring.
+
+import os
+import mmap
+import time
+import struct
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+from .records  import TagRead, is_tag
+from .constant import FREQUENCY_CHANNELS
+
+FORKED = False      # A forked child shares the resource_tracker of its parent.
+
+def _forked( ):
+    global FORKED
+    FORKED = True
+
+if hasattr( os, 'register_at_fork' ):
+    os.register_at_fork( after_in_child=_forked )
+
+POLICY_BLOCK       = 0
+POLICY_DROP_OLDEST = 1
+
+### Head -- Tail -- Written -- Dropped(producer) -- Overrun(consumer) -- Capacity -- EpcSize -- Policy
+HEADER = struct.Struct( '<QQQQQIHH' )
+HEAD, TAIL, WRITTEN, DROPPED, OVERRUN = 0, 8, 16, 24, 32
+INDEX  = struct.Struct( '<Q' )
+
+class ImpinjTagRing( object ):
+    """ Single-producer / single-consumer ring of packed tag records.
+
+        Record : Seq(8B) -- Timestamp(8B) -- Antenna(1B) -- Channel(1B) -- RSSI(1B) -- EpcLen(1B) -- EPC(epc_size)
+                 RSSI is clamped to -128 ~ 127 ( raw byte 0 reads -129 dBm ).
+
+        RING = ImpinjTagRing( capacity=65536, policy='drop-oldest' )
+        R2000 = ImpinjR2KReader( RING, address=1, compact=True )    # Producer ( ReaderThread )
+
+        RING = ImpinjTagRing.attach( name )                         # Consumer ( any process, 3.8+ )
+        for view in RING.views( ):                                  # Zero-copy memoryviews
+            timestamp, antenna, channel, rssi, size = RING.FIELDS.unpack_from( view )
+        print( RING.get( ) )                                        # Copies, [ TagRead, ... ]
+
+        policy :
+            'block'       : The producer waits for free space ( up to @timeout, then drops the read ).
+            'drop-oldest' : The producer never waits. The consumer skips what was overwritten.
+        Counters ( statistics ) : written, dropped, overrun, blocked.
+
+        Non-tag items ( DONE / ERROR ) go to @control ( a queue ) when given, else they are ignored.
+    """
+    FIELDS = struct.Struct( '<dBBbB' )
+
+    def __init__( self, capacity=65536, epc_size=32, policy='block', timeout=1.0, control=None, name=None, create=True ):
+        self.control, self.timeout, self.blocked = control, timeout, 0
+        if create:
+            assert policy in ( 'block', 'drop-oldest' )
+            assert capacity > 0 and ( capacity & ( capacity - 1 ) ) == 0, 'capacity must be a power of two.'
+            record = self.__record_struct( epc_size )
+            size   = HEADER.size + capacity * record.size
+            if shared_memory is not None:
+                self.shm = shared_memory.SharedMemory( name=name, create=True, size=size )
+                self.buf = self.shm.buf
+            else:
+                self.shm = None
+                self.map = mmap.mmap( -1, size )                    # Shared with forked children only.
+                self.buf = memoryview( self.map )
+            HEADER.pack_into( self.buf, 0, 0, 0, 0, 0, 0, capacity, epc_size,
+                              POLICY_BLOCK if policy == 'block' else POLICY_DROP_OLDEST )
+        else:
+            self.shm = self.__attach( name )
+            self.buf = self.shm.buf
+
+        _, _, _, _, _, self.capacity, self.epc_size, self.policy = HEADER.unpack_from( self.buf, 0 )
+        self.record = self.__record_struct( self.epc_size )
+        self.mask   = self.capacity - 1
+        self.owner  = create
+
+    @classmethod
+    def attach( cls, name, control=None ):
+        assert shared_memory is not None, 'multiprocessing.shared_memory requires Python 3.8+.'
+        return cls( name=name, control=control, create=False )
+
+    @staticmethod
+    def __attach( name ):
+        """ Open the ring of another process without tracking it: the resource_tracker of the
+            consumer would unlink the producer's ring when the consumer exits ( Python 3.8 ~ 3.12 ).
+        """
+        try:
+            return shared_memory.SharedMemory( name=name, track=False )     # 3.13+
+        except TypeError:
+            pass
+        shm = shared_memory.SharedMemory( name=name )
+        if os.name == 'posix':
+            from multiprocessing import resource_tracker
+            ### Children of the producer ( multiprocessing ) share its tracker, the name must stay registered.
+            if ( resource_tracker._resource_tracker._pid is not None ) and ( not FORKED ):
+                resource_tracker.unregister( shm._name, 'shared_memory' )
+        return shm
+
+    @staticmethod
+    def __record_struct( epc_size ):
+        return struct.Struct( '<Q' + ImpinjTagRing.FIELDS.format[1:] + '{}s'.format( epc_size ) )
+
+    @property
+    def name( self ):
+        return None if self.shm is None else self.shm.name
+
+    def __load( self, offset ):
+        return INDEX.unpack_from( self.buf, offset )[0]
+
+    def __store( self, offset, value ):
+        INDEX.pack_into( self.buf, offset, value )
+
+    def __len__( self ):
+        return min( self.__load( HEAD ) - self.__load( TAIL ), self.capacity )
+
+    def statistics( self ):
+        return dict( written=self.__load( WRITTEN ), dropped=self.__load( DROPPED ),
+                     overrun=self.__load( OVERRUN ), blocked=self.blocked, pending=len( self ) )
+
+    #-------------------------------------------------
+    ### Producer
+    def write( self, timestamp, antenna, channel, rssi, epc ):
+        head = self.__load( HEAD )
+        if ( self.policy == POLICY_BLOCK ) and ( head - self.__load( TAIL ) >= self.capacity ):
+            self.blocked += 1
+            deadline = time.monotonic( ) + self.timeout
+            while head - self.__load( TAIL ) >= self.capacity:
+                if time.monotonic( ) > deadline:
+                    self.__store( DROPPED, self.__load( DROPPED ) + 1 )
+                    return False
+                time.sleep( 0.0005 )
+
+        offset = HEADER.size + ( head & self.mask ) * self.record.size
+        epc  = epc[:self.epc_size]
+        rssi = -128 if rssi < -128 else ( 127 if rssi > 127 else rssi )
+        self.record.pack_into( self.buf, offset, 0xFFFFFFFFFFFFFFFF, timestamp, antenna, channel, rssi, len( epc ), epc )
+        self.__store( offset, head )                # Seq is written last: the record is committed.
+        self.__store( HEAD, head + 1 )
+        self.__store( WRITTEN, self.__load( WRITTEN ) + 1 )
+        return True
+
+    def put( self, item, block=True, timeout=None ):
+        """ Queue-like sink for ImpinjProtocolFactory ( TagRead, dict or list of them ). """
+        if isinstance( item, list ):
+            for tag in item:
+                self.put( tag )
+            return
+        if isinstance( item, TagRead ):
+            self.write( item.timestamp, item.antenna, item.channel, item.rssi, item.epc )
+        elif is_tag( item ):
+            self.write( time.time( ), item['antenna'], FREQUENCY_CHANNELS.get( item['frequency'], 0 ), item['rssi'], bytes.fromhex( item['epc'] ) )
+        elif self.control is not None:
+            self.control.put( item, block, timeout )
+
+    #-------------------------------------------------
+    ### Consumer
+    def views( self, limit=None ):
+        """ Yield a memoryview per pending record ( Seq field excluded ), without copying.
+            With 'drop-oldest' a view is only valid until the producer laps the ring.
+        """
+        size, count = self.record.size, 0
+        while ( limit is None ) or ( count < limit ):
+            tail, head = self.__load( TAIL ), self.__load( HEAD )
+            if tail >= head:
+                return
+            if head - tail > self.capacity:                 # Overwritten by the producer.
+                self.__store( OVERRUN, self.__load( OVERRUN ) + head - tail - self.capacity )
+                tail = head - self.capacity
+            offset = HEADER.size + ( tail & self.mask ) * size
+            if self.__load( offset ) != tail:               # Lapped while reading.
+                self.__store( OVERRUN, self.__load( OVERRUN ) + 1 )
+                self.__store( TAIL, tail + 1 )
+                continue
+            yield self.buf[ offset + 8 : offset + size ]
+            self.__store( TAIL, tail + 1 )
+            count += 1
+
+    def unpack( self, view ):
+        """ @return : ( timestamp, antenna, channel, rssi, epc ) """
+        timestamp, antenna, channel, rssi, size = self.FIELDS.unpack_from( view )
+        return timestamp, antenna, channel, rssi, bytes( view[ self.FIELDS.size : self.FIELDS.size + size ] )
+
+    def get( self, limit=None ):
+        """ @return : [ TagRead, ... ] ( copies ) """
+        tags = list( )
+        for view in self.views( limit ):
+            timestamp, antenna, channel, rssi, epc = self.unpack( view )
+            view.release( )
+            tags.append( TagRead( antenna, channel, rssi, epc, timestamp ) )
+        return tags
+
+    def close( self ):
+        if self.shm is None:
+            self.buf.release( )
+            self.map.close( )
+            return
+        self.buf = None
+        self.shm.close( )
+        if self.owner:
+            self.shm.unlink( )
@@ -0,0 +1,143 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 columnar inventory rounds."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 columnar ( NumPy ) export of inventory rounds.
+# Package:  pip install numpy.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+#           2026-10-17 Ver:1.4 [Heyn] Bugfix EPCs ending with 0x00 were cut ( 'S' dtype ).
+
+import time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .records  import TagRead, is_tag
+from .constant import FREQUENCY_TABLES, FREQUENCY_CHANNELS
+
+def _require_numpy( ):
+    if numpy is None:
+        raise ImportError( 'NumPy is required for columnar rounds ( pip3 install numpy ).' )
+
+def distance( rssi, A=60, n=3.5 ):
+    """ Vectorized ImpinjR2KReader.distance
+        @Param
+            rssi : Signal strength ( array )
+            A : Signal strength at a distance of 1m between the transmitter and the receiver
+            n : Environmental factor ( 2 - 5)
+    """
+    _require_numpy( )
+    return numpy.power( 10.0, ( numpy.abs( numpy.asarray( rssi, dtype=numpy.float64 ) ) - A ) / ( 10 * n ) )
+
+def average( data ):
+    _require_numpy( )
+    return float( numpy.mean( numpy.asarray( data, dtype=numpy.float64 ) ) )
+
+def variance( data ):
+    _require_numpy( )
+    return float( numpy.var( numpy.asarray( data, dtype=numpy.float64 ) ) )
+
+def percentile( data, q=50 ):
+    _require_numpy( )
+    return numpy.percentile( numpy.asarray( data, dtype=numpy.float64 ), q )
+
+class ImpinjInventoryRound( object ):
+    """ One inventory round ( first tag frame up to the DONE frame ).
+
+        antenna   : uint8   ( 1 ~ 4 )
+        channel   : uint8   ( Index of constant.FREQUENCY_TABLES )
+        rssi      : int16   ( dBm )
+        timestamp : float64 ( time.time() )
+        epc       : Fixed-width raw bytes ( numpy 'V' dtype, bytes( epc[i] ), keeps trailing 0x00 )
+    """
+    def __init__( self, antenna, channel, rssi, timestamp, epc, total_read=0, duration=0 ):
+        _require_numpy( )
+        self.antenna   = numpy.asarray( antenna,   dtype=numpy.uint8   )
+        self.channel   = numpy.asarray( channel,   dtype=numpy.uint8   )
+        self.rssi      = numpy.asarray( rssi,      dtype=numpy.int16   )
+        self.timestamp = numpy.asarray( timestamp, dtype=numpy.float64 )
+        width = max( [ len( x ) for x in epc ] or [ 1 ] )
+        self.epc = numpy.asarray( epc, dtype='V{}'.format( width ) )
+        self.total_read, self.duration = total_read, duration
+
+    def __len__( self ):
+        return len( self.rssi )
+
+    @property
+    def frequency( self ):
+        return numpy.asarray( FREQUENCY_TABLES )[ self.channel ]
+
+    def unique( self ):
+        return numpy.unique( self.epc )
+
+    def distance( self, A=60, n=3.5 ):
+        return distance( self.rssi, A=A, n=n )
+
+    def rssi_statistics( self, q=( 5, 50, 95 ) ):
+        """ Per-antenna RSSI statistics.
+            @return : { antenna : dict( count, mean, variance, percentile ) }
+        """
+        result = dict()
+        for antenna in numpy.unique( self.antenna ):
+            rssi = self.rssi[ self.antenna == antenna ].astype( numpy.float64 )
+            result[ int( antenna ) ] = dict( count      = len( rssi ),
+                                             mean       = float( rssi.mean( ) ),
+                                             variance   = float( rssi.var( ) ),
+                                             percentile = numpy.percentile( rssi, q ) )
+        return result
+
+    def __repr__( self ):
+        return 'ImpinjInventoryRound(reads={}, unique={}, total_read={}, duration={})'.format( len( self ), len( self.unique( ) ),
+                                                                                                self.total_read, self.duration )
+
+class ImpinjRoundCollector( object ):
+    """ Queue-like sink that turns the tag stream into ImpinjInventoryRound objects.
+
+        ROUND_QUEUE = queue.Queue( 64 )
+        R2000 = ImpinjR2KReader( ImpinjRoundCollector( ROUND_QUEUE ), address=1 )
+        R2000.rt_inventory( repeat=10 )
+        print( ROUND_QUEUE.get( ).rssi_statistics( ) )
+
+        ERROR items are forwarded unchanged.
+    """
+    def __init__( self, queue ):
+        _require_numpy( )
+        self.queue = queue
+        self.__reset( )
+
+    def __reset( self ):
+        self.antenna, self.channel, self.rssi, self.timestamp, self.epc = [], [], [], [], []
+
+    def __append( self, tag ):
+        if isinstance( tag, TagRead ):
+            self.antenna.append( tag.antenna )
+            self.channel.append( tag.channel )
+            self.rssi.append( tag.rssi )
+            self.timestamp.append( tag.timestamp )
+            self.epc.append( tag.epc )
+        else:
+            self.antenna.append( tag['antenna'] )
+            self.channel.append( FREQUENCY_CHANNELS.get( tag['frequency'], 0 ) )
+            self.rssi.append( tag['rssi'] )
+            self.timestamp.append( time.time( ) )
+            self.epc.append( bytes.fromhex( tag['epc'] ) )
+
+    def put( self, item, block=True, timeout=None ):
+        if isinstance( item, list ):        # ImpinjTagBatcher
+            for tag in item:
+                self.__append( tag )
+            return
+
+        if is_tag( item ):
+            self.__append( item )
+        elif item['type'] == 'DONE':
+            self.queue.put( ImpinjInventoryRound( self.antenna, self.channel, self.rssi, self.timestamp, self.epc,
+                                                  total_read=item['total_read'], duration=item['duration'] ), block, timeout )
+            self.__reset( )
+        else:
+            self.queue.put( item, block, timeout )
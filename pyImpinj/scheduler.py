@@ -0,0 +1,363 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 continuous inventory scheduler."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 continuous inventory, re-triggered by the DONE frame.
+# Package:  None.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+#           2026-10-17 Ver:1.4 [Heyn] Re-trigger on failed commands only, with a retry limit.
+#           2026-10-17 Ver:1.4 [Heyn] The population estimate counts the DONE total_read.
+
+import time
+import logging
+import threading
+import collections
+
+from .enums   import ImpinjR2KFastSwitchInventory
+from .records import is_tag
+
+FAST_ANTENNAS = 'ABCD'
+
+class ImpinjInventoryScheduler( object ):
+    """ Queue-like sink that writes the next inventory command as soon as the
+        DONE frame of the previous one arrives ( no idle gap between rounds ).
+
+        R2000.worker_start( )
+        R2000.start_inventory( mode='rt', antennas=[ 0, 1 ], repeat=1 )
+        while True:
+            print( TAG_QUEUE.get( ) )
+        R2000.stop_inventory( )
+
+        @param  mode     : 'rt' ( rt_inventory ), 'session' ( session_inventory ) or 'fast' ( fast_switch_ant_inventory ).
+                antennas : Work antennas ( 0 ~ 3 ). 'rt' and 'session' rotate them round by round.
+                param    : fast_switch_ant_inventory param ( 'fast' ).
+                adaptive : Tune repeat ( and the fast antenna loops ) after every round:
+                           rounds shorter than @duration ( Unit:s ) double repeat, rounds longer
+                           than 4 x @duration or without any read halve it. Fast antenna loops
+                           follow the tags read on each antenna ( one more loop per @step tags ).
+                timeout  : Inventory is written again when no DONE arrived within @timeout seconds.
+                retries  : A failed command ( ERROR with an error code ) is written again at once
+                           @retries times in a row, then by the watchdog only, backing off from
+                           @timeout to 8 x @timeout. The next DONE resets the count.
+
+        Every item is forwarded to @queue unchanged.
+    """
+    def __init__( self, reader, queue, mode='rt', antennas=( 0, ), repeat=1, session='S1', target='A', param=None,
+                  adaptive=True, duration=0.05, max_repeat=255, max_loop=8, step=32, timeout=2.0, retries=3 ):
+        assert mode in ( 'rt', 'session', 'fast' )
+        self.reader, self.queue, self.mode = reader, queue, mode
+        self.antennas, self.index = list( antennas ), 0
+        self.repeat, self.session, self.target = repeat, session, target
+        self.param = dict( param ) if param is not None else self.__fast_param( antennas, repeat )
+        self.adaptive, self.duration, self.step = adaptive, duration, step
+        self.max_repeat, self.max_loop, self.timeout = max_repeat, max_loop, timeout
+        self.retries, self.failures = retries, 0     # Failed commands in a row.
+
+        self.lock    = threading.RLock( )
+        self.wakeup  = threading.Event( )
+        self.alive   = False
+        self.worker  = None
+        self.seen    = set( )
+        self.started = self.begin = 0.0
+        self.busy    = 0.0
+        self.rounds, self.reads, self.errors, self.timeouts = 0, 0, 0, 0
+        self.__reset_round( )
+
+    @staticmethod
+    def __fast_param( antennas, repeat ):
+        param = dict( Interval=0, Repeat=repeat )
+        for index, name in enumerate( FAST_ANTENNAS ):
+            param[ name ] = antennas[index] if index < len( antennas ) else ImpinjR2KFastSwitchInventory.DISABLED
+            param[ name + 'loop' ] = 1
+        return param
+
+    def __reset_round( self ):
+        self.round = dict( reads=0, new=0, total_read=0, antennas=[ 0 ]*4, fresh=[ 0 ]*4, epcs=set( ) )
+
+    #-------------------------------------------------
+    def start( self ):
+        self.alive   = True
+        self.started = time.monotonic( )
+        self.worker  = threading.Thread( target=self.__watchdog, daemon=True )
+        self.worker.start( )
+        self.trigger( )
+
+    def stop( self ):
+        self.alive = False
+        self.wakeup.set( )
+        if ( self.worker is not None ) and ( self.worker is not threading.current_thread( ) ):
+            self.worker.join( )
+        self.worker = None
+
+    def __watchdog( self ):
+        while self.alive:
+            self.wakeup.clear( )
+            wait = self.timeout * min( 8, 2 ** max( 0, self.failures - self.retries ) )
+            if self.wakeup.wait( wait ) or ( not self.alive ):
+                continue
+            logging.debug( '[SCHEDULER] No DONE within {}s, inventory again.'.format( wait ) )
+            self.timeouts += 1
+            self.trigger( )
+
+    def trigger( self ):
+        """ Write the next inventory command. """
+        with self.lock:
+            if not self.alive:
+                return
+            self.wakeup.set( )
+            self.begin = time.monotonic( )
+            protocol = self.reader.protocol
+            if self.mode == 'fast':
+                protocol.fast_switch_ant_inventory( param=self.param )
+                return
+            if len( self.antennas ) > 1:
+                protocol.set_work_antenna( antenna=self.antennas[ self.index ] )
+                self.index = ( self.index + 1 ) % len( self.antennas )
+            if self.mode == 'session':
+                protocol.session_inventory( session=self.session, target=self.target, repeat=self.repeat )
+            else:
+                protocol.rt_inventory( repeat=self.repeat )
+
+    #-------------------------------------------------
+    def adapt( self, elapsed ):
+        """ Called after every round with its length ( Unit:s ), self.round holds its counters. """
+        repeat = self.param['Repeat'] if self.mode == 'fast' else self.repeat
+        if self.round['reads'] == 0 or elapsed > self.duration * 4:
+            repeat = max( 1, repeat // 2 )
+        elif elapsed < self.duration:
+            repeat = min( self.max_repeat, repeat * 2 )
+
+        if self.mode != 'fast':
+            self.repeat = repeat
+            return
+        self.param['Repeat'] = repeat
+        for index, name in enumerate( FAST_ANTENNAS ):
+            if self.param[ name ] != ImpinjR2KFastSwitchInventory.DISABLED:
+                self.param[ name + 'loop' ] = min( self.max_loop, 1 + self.round['antennas'][index] // self.step )
+
+    def __done( self ):
+        now = time.monotonic( )
+        elapsed = now - self.begin
+        self.rounds += 1
+        self.busy   += elapsed
+        if self.adaptive:
+            self.adapt( elapsed )
+        self.__reset_round( )
+
+    def put( self, item, block=True, timeout=None ):
+        if isinstance( item, list ) or is_tag( item ):
+            for tag in ( item if isinstance( item, list ) else [ item ] ):
+                epc, antenna = tag['epc'] if isinstance( tag, dict ) else tag.epc, ( tag['antenna'] - 1 ) & 0x03
+                self.round['reads'] += 1
+                self.round['antennas'][ antenna ] += 1
+                self.round['epcs'].add( epc )
+                if epc not in self.seen:
+                    if len( self.seen ) >= 65536:
+                        self.seen.clear( )
+                    self.seen.add( epc )
+                    self.round['new'] += 1
+                    self.round['fresh'][ antenna ] += 1
+            self.reads += len( item ) if isinstance( item, list ) else 1
+        elif item['type'] == 'DONE':
+            with self.lock:
+                self.failures = 0
+                self.round['total_read'] = item['total_read']
+                self.__done( )
+                self.trigger( )
+        elif item['type'] == 'ERROR':
+            self.errors += 1
+            ### Only a failed command is over ( 'Nothing!' and antenna errors are per tag / antenna ),
+            ### fast switch still sends DONE.
+            if ( self.mode != 'fast' ) and ( 'code' in item ):
+                self.failures += 1
+                if self.failures <= self.retries:
+                    self.trigger( )
+                else:
+                    logging.debug( '[SCHEDULER] {} failed commands in a row, {}.'.format( self.failures, item['logs'] ) )
+        self.queue.put( item, block, timeout )
+
+    def statistics( self ):
+        """ @return : dict( rounds, reads, unique, errors, timeouts, repeat, duty, rate ) """
+        elapsed = max( time.monotonic( ) - self.started, 1e-6 )
+        return dict( rounds=self.rounds, reads=self.reads, unique=len( self.seen ), errors=self.errors,
+                     timeouts=self.timeouts, repeat=self.param['Repeat'] if self.mode == 'fast' else self.repeat,
+                     duty=min( 1.0, self.busy / elapsed ), rate=self.reads / elapsed )
+
+class ImpinjSessionScheduler( ImpinjInventoryScheduler ):
+    """ Session inventory for large static populations ( see ImpinjInventoryScheduler ).
+
+        R2000.start_inventory( mode='session', sessions=( 'S1', 'S2' ) )
+
+        - A/B flipping : a tag read with target A moves to B ( S1 ~ S3 keep that flag ),
+          so the weak tags get their turn. The target is flipped when a round finds
+          less than @flip x population tags not yet read at this target.
+        - Population   : the distinct EPCs of the last complete A + B cycle ( of the current
+                         cycle until the first one is complete ), at least the total_read of
+                         the last DONE ( S1 ~ S3 : the reader counts every tag once per round,
+                         reports lost on the way included ).
+        - Yield        : tags per second not yet read at this target ( re-reads of the
+                         strong tags do not count, S0 scores low on large populations ).
+        - Repeat       : hill climbing on the yield of a round.
+        - Session      : every session of @sessions runs @probe rounds, the one with the
+                         best yield is kept ( probed again after @reprobe rounds ).
+
+        The R2000 picks Q by itself, repeat is the only anti-collision knob of the command.
+    """
+    def __init__( self, reader, queue, sessions=( 'S1', 'S2' ), flip=0.01, probe=4, reprobe=200, **kwargs ):
+        kwargs.update( mode='session', session=sessions[0] )
+        super( ImpinjSessionScheduler, self ).__init__( reader, queue, **kwargs )
+        self.sessions, self.flip = list( sessions ), flip
+        self.probe, self.reprobe = probe, reprobe
+        self.yields     = { session : None for session in self.sessions }
+        self.direction  = 2
+        self.population = 0
+        self.counted    = 0         # DONE total_read of the last round ( S1 ~ S3 ).
+        self.flips      = 0
+        self.cycle      = set( )    # EPCs of the current A + B cycle.
+        self.side       = set( )    # EPCs read since the last flip.
+        self.probed     = 0
+        self.chosen     = self.session
+
+    def __select( self ):
+        """ Session of the next round. """
+        window = self.probe * len( self.sessions )
+        if self.probed < window:
+            self.probed += 1
+            if self.probed < window:
+                return self.sessions[ self.probed // self.probe ]
+            self.chosen = max( self.sessions, key=lambda session : self.yields[ session ] or 0 )
+        elif self.rounds % self.reprobe == 0:
+            self.probed = 0
+            return self.sessions[0]
+        return self.chosen
+
+    def adapt( self, elapsed ):
+        epcs  = self.round['epcs']
+        fresh = len( epcs - self.side )
+        value = fresh / max( elapsed, 1e-3 )
+        last  = self.yields[ self.session ]
+        self.yields[ self.session ] = value if last is None else last * 0.8 + value * 0.2
+
+        ### Repeat
+        if ( last is not None ) and ( value < last ):
+            self.direction = 0.5 if self.direction > 1 else 2
+        self.repeat = max( 1, min( self.max_repeat, int( self.repeat * self.direction ) ) )
+
+        ### Target & population
+        self.side  |= epcs
+        self.cycle |= epcs
+        self.counted = max( len( epcs ), self.round['total_read'] ) if self.session != 'S0' else 0
+        if ( self.session != 'S0' ) and ( fresh <= self.flip * self.estimate( ) ):
+            self.flips += 1
+            self.side.clear( )
+            if self.target == 'B':
+                self.population = len( self.cycle ) or self.population
+                self.cycle.clear( )
+            self.target = 'B' if self.target == 'A' else 'A'
+
+        session = self.__select( )
+        if session != self.session:
+            self.session, self.target = session, 'A'
+            self.side.clear( )
+            self.cycle.clear( )
+
+    def estimate( self ):
+        """ @return : Population estimate ( see Population ). """
+        return max( self.population or len( self.cycle ), self.counted )
+
+    def statistics( self ):
+        """ @return : ImpinjInventoryScheduler.statistics( ) plus session, target, population, flips and yields. """
+        value = super( ImpinjSessionScheduler, self ).statistics( )
+        value.update( session=self.session, target=self.target, population=self.estimate( ),
+                      flips=self.flips, yields=dict( self.yields ) )
+        return value
+
+class ImpinjDwellScheduler( ImpinjInventoryScheduler ):
+    """ fast_switch_ant_inventory with per-antenna dwell optimization ( see ImpinjInventoryScheduler ).
+
+        R2000.start_inventory( mode='fast', dwell=True, antennas=[ 0, 1, 2, 3 ], budget=8 )
+
+        - Yield    : EWMA of new EPCs per loop, per antenna.
+        - Loops    : @budget loops are shared by the active antennas in proportion to
+                     their yield ( at least 1 each, equal shares while nothing is new ).
+        - Disabled : antennas with a missing-antenna error, or without any read for
+                     @idle rounds. They are all tried again every @recheck rounds.
+        - Plans    : on every plan change queue.put( dict( type='PLAN', param=..., rate=... ) )
+                     reports the previous plan with its new tags per second. With fixed=True
+                     the plan ( @param ) is only measured, see statistics( )['plan_rate'].
+    """
+    def __init__( self, reader, queue, antennas=( 0, 1, 2, 3 ), budget=8, idle=20, recheck=100, fixed=False, **kwargs ):
+        kwargs.update( mode='fast', antennas=antennas )
+        super( ImpinjDwellScheduler, self ).__init__( reader, queue, **kwargs )
+        self.ports   = list( antennas )[:4]
+        self.budget, self.idle, self.recheck, self.fixed = budget, idle, recheck, fixed
+        self.yields  = [ 0.0 ]*4
+        self.silent  = [ 0 ]*4
+        self.missing = set( )
+        self.loops   = self.__loops( self.param )
+        self.history = collections.deque( maxlen=100 )
+        self.plan_new, self.plan_begin = 0, time.monotonic( )
+
+    @staticmethod
+    def __loops( param ):
+        """ @return : [ loops of antenna 0 ~ 3 ] of a fast_switch_ant_inventory param. """
+        loops = [ 0 ]*4
+        for name in FAST_ANTENNAS:
+            if param[ name ] != ImpinjR2KFastSwitchInventory.DISABLED:
+                loops[ param[ name ] & 0x03 ] += param[ name + 'loop' ]
+        return loops
+
+    def __plan( self, active ):
+        total = sum( [ self.yields[ port ] for port in active ] )
+        param = dict( Interval=self.param['Interval'], Repeat=self.param['Repeat'] )
+        for index, name in enumerate( FAST_ANTENNAS ):
+            if index >= len( active ):
+                param[ name ], param[ name + 'loop' ] = ImpinjR2KFastSwitchInventory.DISABLED, 1
+                continue
+            port  = active[index]
+            share = self.yields[ port ] / total if total > 0 else 1.0 / len( active )
+            param[ name ], param[ name + 'loop' ] = port, max( 1, min( self.max_loop, int( round( self.budget * share ) ) ) )
+        return param
+
+    def adapt( self, elapsed ):
+        repeat = max( self.param['Repeat'], 1 )
+        for port in self.ports:
+            loops = self.loops[ port ] * repeat
+            if loops == 0:
+                continue
+            self.yields[ port ] = self.yields[ port ] * 0.7 + ( self.round['fresh'][ port ] / loops ) * 0.3
+            self.silent[ port ] = 0 if self.round['antennas'][ port ] else self.silent[ port ] + 1
+        self.plan_new += self.round['new']
+        if self.fixed:
+            return
+
+        if self.rounds % self.recheck == 0:
+            self.missing.clear( )
+            self.silent = [ 0 ]*4
+        active = [ port for port in self.ports if ( port not in self.missing ) and ( self.silent[ port ] < self.idle ) ]
+        active = active or [ port for port in self.ports if port not in self.missing ] or self.ports[:1]
+
+        param = self.__plan( active )
+        if param == self.param:
+            return
+        now  = time.monotonic( )
+        rate = self.plan_new / max( now - self.plan_begin, 1e-3 )
+        self.history.append( ( dict( self.param ), rate ) )
+        self.queue.put( dict( type='PLAN', param=dict( self.param ), rate=rate ) )
+        self.param, self.loops = param, self.__loops( param )
+        self.plan_new, self.plan_begin = 0, now
+
+    def put( self, item, block=True, timeout=None ):
+        if isinstance( item, dict ) and ( item.get( 'type' ) == 'ERROR' ) and ( 'antenna' in item ):
+            self.missing.add( item['antenna'] - 1 )
+        super( ImpinjDwellScheduler, self ).put( item, block, timeout )
+
+    def statistics( self ):
+        """ @return : ImpinjInventoryScheduler.statistics( ) plus param, yields, missing and plan rate. """
+        value = super( ImpinjDwellScheduler, self ).statistics( )
+        value.update( param=dict( self.param ), yields=list( self.yields ), missing=sorted( self.missing ),
+                      plan_rate=self.plan_new / max( time.monotonic( ) - self.plan_begin, 1e-3 ) )
+        return value
@@ -0,0 +1,407 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 reader simulator."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Software Impinj R2000 reader ( socket:// ) for load tests without hardware.
+# Package:  pip3 install libscrc.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+#           2026-10-17 Ver:1.4 [Heyn] New add drop function ( disconnect the clients ).
+
+import time
+import random
+import socket
+import struct
+import libscrc
+import logging
+import threading
+
+from .enums    import ImpinjR2KCommands, ImpinjR2KGlobalErrors, ImpinjR2KRegion
+from .framer   import ImpinjR2KFramer
+from .constant import TAG_MEMORY_BANK
+
+class ImpinjSimTag( object ):
+    """ One simulated tag. Memory banks are bytearrays ( EPC bank = CRC -- PC -- EPC ). """
+    __slots__ = ( 'epc', 'rssi', 'antennas', 'tid', 'user', 'reserved', 'flags' )
+
+    def __init__( self, epc, rssi, antennas, tid, user_size=64 ):
+        self.epc, self.rssi, self.antennas = bytearray( epc ), rssi, antennas
+        self.tid      = bytearray( tid )
+        self.user     = bytearray( user_size )
+        self.reserved = bytearray( 8 )
+        self.flags    = [ 0 ]*4     # Inventoried flag of S0 ~ S3 ( 0 = A, 1 = B ).
+
+    @property
+    def pc( self ):
+        return ( len( self.epc ) // 2 ) << 11
+
+    def bank( self, bank ):
+        if bank == TAG_MEMORY_BANK['EPC']:
+            body = struct.pack( '>H', self.pc ) + bytes( self.epc )
+            return bytearray( struct.pack( '>H', libscrc.xmodem( body, 0xFFFF ) ^ 0xFFFF ) ) + body
+        return { TAG_MEMORY_BANK['RESERVED'] : self.reserved, TAG_MEMORY_BANK['TID'] : self.tid,
+                 TAG_MEMORY_BANK['USER'] : self.user }.get( bank )
+
+    def write( self, bank, address, data ):
+        if bank == TAG_MEMORY_BANK['EPC']:
+            if address < 2:
+                return False
+            epc = bytearray( self.epc )
+            offset = ( address - 2 ) * 2
+            epc[ offset:offset + len( data ) ] = data
+            self.epc = epc
+            return True
+        memory = self.bank( bank )
+        if ( memory is None ) or ( address * 2 + len( data ) > len( memory ) ):
+            return False
+        memory[ address * 2 : address * 2 + len( data ) ] = data
+        return True
+
+class ImpinjTagPopulation( object ):
+    """ Simulated tag field.
+
+        @param  count    : Number of tags.
+                rssi     : ( min, max ) dBm, the mean RSSI of every tag is uniform in this range.
+                jitter   : RSSI standard deviation of a single read ( dBm ).
+                antennas : Antennas ( 1 ~ 4 ) of the field.
+                coverage : How many of @antennas see each tag.
+    """
+    def __init__( self, count=100, epc_size=12, rssi=( -75, -40 ), jitter=2.0, antennas=( 1, 2, 3, 4 ), coverage=1, seed=None ):
+        self.random = random.Random( seed )
+        self.rssi, self.jitter = rssi, jitter
+        self.tags = list( )
+        for index in range( count ):
+            epc = b'\xE2\x00' + index.to_bytes( epc_size - 2, 'big' )
+            tid = b'\xE2\x80\x11\x05' + index.to_bytes( 8, 'big' )
+            self.tags.append( ImpinjSimTag( epc, self.random.uniform( *rssi ),
+                                            frozenset( self.random.sample( antennas, min( coverage, len( antennas ) ) ) ), tid ) )
+
+    def visible( self, antenna ):
+        """ @return : Tags seen by @antenna ( 1 ~ 4 ). """
+        return [ tag for tag in self.tags if antenna in tag.antennas ]
+
+    def read( self, tag ):
+        """ @return : RSSI of one read, or None when the tag is missed ( weak tags are missed more often ). """
+        low, high = self.rssi
+        chance = 0.5 + 0.5 * ( tag.rssi - low ) / max( high - low, 1e-6 )
+        if self.random.random( ) > chance:
+            return None
+        return int( round( self.random.gauss( tag.rssi, self.jitter ) ) )
+
+    def find( self, epc ):
+        return next( ( tag for tag in self.tags if tag.epc == epc ), None )
+
+class ImpinjR2KSimulator( object ):
+    """ Software R2000 reader, served on a TCP port ( pyserial socket:// URL ).
+
+        SIM = ImpinjR2KSimulator( address=1, population=ImpinjTagPopulation( count=500, coverage=2 ) )
+        R2000 = ImpinjR2KReader( TAG_QUEUE, address=1 )
+        R2000.connect( SIM.serve( ) )       # 'socket://127.0.0.1:xxxxx'
+        SIM.drop( )                         # Disconnect the clients, the port keeps listening.
+
+        @param  rate     : Tag reads per second of the radio.
+                baudrate : Line rate used to pace the responses ( 10 bits per byte ).
+                speed    : 1.0 = real time, 10.0 = ten times faster, 0 = no pacing at all.
+                missing  : Antennas ( 1 ~ 4 ) without a connected antenna ( ANTENNA_MISSING_ERROR ).
+                peers    : Other simulators on the same port ( multi-drop bus, one per address ).
+
+        Every command of ImpinjR2KCommands gets an answer ( unknown ones get FAIL ).
+        Inventory rounds honour the work antenna, the session / target flags, the
+        repeat count and the fast switch antenna plan. Tag access honours the
+        access EPC match ( lock is accepted but not enforced ).
+    """
+    def __init__( self, address=1, population=None, rate=500, baudrate=115200, speed=1.0, missing=( ), peers=( ), seed=None ):
+        self.address    = address
+        self.population = population if population is not None else ImpinjTagPopulation( seed=seed )
+        self.rate, self.baudrate, self.speed = rate, baudrate, speed
+        self.missing    = frozenset( missing )
+        self.peers      = list( peers )
+        self.random     = random.Random( seed )
+        self.antenna, self.power, self.beeper = 0, [ 30 ]*4, 0
+        self.region     = [ ImpinjR2KRegion.FCC, 7, 59 ]
+        self.identifier = bytearray( b'0123456789AB' )
+        self.profile, self.detector, self.gpio = 0xD1, 0, [ 0, 0, 0, 0 ]
+        self.match      = None
+        self.buffer     = dict( )   # EPC : [ rssi, antenna, count ]
+        self.statistics = dict( frames=0, reads=0, bytes=0 )
+        self.server     = None
+        self.clients    = set( )
+        self.alive      = False
+
+    #-------------------------------------------------
+    def frame( self, command, data=b'', address=None ):
+        message = bytes( [ 0xA0, 3 + len( data ), self.address if address is None else address, command ] ) + bytes( data )
+        return message + bytes( [ libscrc.lrc( message ) ] )
+
+    def pace( self, size, reads=0 ):
+        """ Sleep for the line time of @size bytes or the RF time of @reads, whichever is longer. """
+        if self.speed <= 0:
+            return
+        delay = max( size * 10.0 / self.baudrate, reads / float( self.rate ) )
+        time.sleep( delay / self.speed )
+
+    def channel( self ):
+        return self.random.randint( self.region[1], max( self.region[1], self.region[2] ) )
+
+    #-------------------------------------------------
+    def __round( self, antenna, repeat, session=None, target=0 ):
+        """ @return : [ ( tag, rssi ) ] of @repeat inventory passes on @antenna ( 1 ~ 4 ). """
+        reads = list( )
+        tags  = self.population.visible( antenna )
+        if session == 0:
+            for tag in tags:
+                tag.flags[0] = 0
+        for _ in range( repeat ):
+            for tag in tags:
+                if ( session is not None ) and ( tag.flags[ session ] != target ):
+                    continue
+                rssi = self.population.read( tag )
+                if rssi is None:
+                    continue
+                reads.append( ( tag, rssi ) )
+                if session is not None:
+                    tag.flags[ session ] ^= 1
+        return reads
+
+    def __report( self, command, antenna, reads ):
+        frames = list( )
+        for tag, rssi in reads:
+            head = ( self.channel( ) << 2 ) | ( ( antenna - 1 ) & 0x03 )
+            frames.append( self.frame( command, bytes( [ head ] ) + struct.pack( '>H', tag.pc ) + bytes( tag.epc ) + bytes( [ ( rssi + 129 ) & 0xFF ] ) ) )
+        return b''.join( frames )
+
+    def __access_frame( self, command, tag, data, tail ):
+        body = struct.pack( '>H', tag.pc ) + bytes( tag.epc )
+        body = body + struct.pack( '>H', libscrc.xmodem( body, 0xFFFF ) ^ 0xFFFF ) + bytes( data )
+        return self.frame( command, struct.pack( '>HB', 1, len( body ) ) + body + bytes( [ tail, self.antenna, 1 ] ) )
+
+    def __access( self, command, message ):
+        tag = self.population.find( self.match ) if self.match is not None else None
+        if ( tag is None ) or ( ( self.antenna + 1 ) not in tag.antennas ):
+            return [ self.frame( command, [ ImpinjR2KGlobalErrors.NO_TAG_ERROR ] ) ]
+
+        if command == ImpinjR2KCommands.READ:
+            bank, address, size = message[0], message[1], message[2]
+            memory = tag.bank( bank )
+            if ( memory is None ) or ( ( address + size ) * 2 > len( memory ) ):
+                return [ self.frame( command, [ ImpinjR2KGlobalErrors.TAG_READ_ERROR ] ) ]
+            data = memory[ address * 2 : ( address + size ) * 2 ]
+            return [ self.__access_frame( command, tag, data, len( data ) ) ]
+
+        if command in ( ImpinjR2KCommands.WRITE, ImpinjR2KCommands.WRITE_BLOCK ):
+            bank, address, size = message[4], message[5], message[6]
+            reply = self.__access_frame( command, tag, b'', ImpinjR2KGlobalErrors.SUCCESS )
+            if not tag.write( bank, address, bytes( message[ 7 : 7 + size * 2 ] ) ):
+                return [ self.frame( command, [ ImpinjR2KGlobalErrors.TAG_WRITE_ERROR ] ) ]
+            return [ reply ]
+
+        if command == ImpinjR2KCommands.KILL:
+            reply = self.__access_frame( command, tag, b'', ImpinjR2KGlobalErrors.SUCCESS )
+            self.population.tags.remove( tag )
+            return [ reply ]
+
+        return [ self.__access_frame( command, tag, b'', ImpinjR2KGlobalErrors.SUCCESS ) ]     # LOCK
+
+    def __inventory( self, command, message, send ):
+        """ Tag commands: tag reports are sent repeat by repeat, paced like the radio. """
+        total, start = 0, time.monotonic( )
+        if command == ImpinjR2KCommands.FAST_SWITCH_ANT_INVENTORY:
+            plan, repeat = [ ( message[index*2], message[index*2+1] ) for index in range( 4 ) ], message[9] if len( message ) > 9 else 1
+            for _ in range( repeat ):
+                for antenna, loops in plan:
+                    if antenna > 3:
+                        continue
+                    if ( antenna + 1 ) in self.missing:
+                        send( self.frame( command, [ antenna, ImpinjR2KGlobalErrors.ANTENNA_MISSING_ERROR ] ) )
+                        continue
+                    reads = self.__round( antenna + 1, loops )
+                    total += len( reads )
+                    send( self.__report( command, antenna + 1, reads ), len( reads ) )
+            duration = int( ( time.monotonic( ) - start ) * 1000 )
+            send( self.frame( command, total.to_bytes( 3, 'big' ) + struct.pack( '>I', duration ) ) )
+            return
+
+        if ( self.antenna + 1 ) in self.missing:
+            send( self.frame( command, [ ImpinjR2KGlobalErrors.ANTENNA_MISSING_ERROR ] ) )
+            return
+        if command == ImpinjR2KCommands.CUSTOMIZED_SESSION_TARGET_INVENTORY:
+            session, target, repeat = message[0], message[1], message[2]
+        else:
+            session, target, repeat = None, 0, message[0] if message else 1
+        for _ in range( repeat ):
+            reads = self.__round( self.antenna + 1, 1, session, target )
+            total += len( reads )
+            send( self.__report( command, self.antenna + 1, reads ), len( reads ) )
+        rate = int( total / max( time.monotonic( ) - start, 1e-3 ) ) & 0xFFFF
+        send( self.frame( command, bytes( [ self.antenna ] ) + struct.pack( '>HI', rate, total ) ) )
+
+    def __buffer( self, command, reset ):
+        if not self.buffer:
+            return [ self.frame( command, [ ImpinjR2KGlobalErrors.BUFFER_IS_EMPTY_ERROR ] ) ]
+        frames, count = list( ), len( self.buffer )
+        for epc, ( rssi, antenna, reads ) in self.buffer.items( ):
+            body = struct.pack( '>H', ( len( epc ) // 2 ) << 11 ) + epc
+            body = body + struct.pack( '>H', libscrc.xmodem( body, 0xFFFF ) ^ 0xFFFF )
+            frames.append( self.frame( command, struct.pack( '>HB', count, len( body ) ) + body +
+                                                bytes( [ ( rssi + 129 ) & 0xFF, antenna - 1, min( reads, 255 ) ] ) ) )
+        if reset:
+            self.buffer.clear( )
+        return frames
+
+    def handle( self, packet, send ):
+        """ Answer one command frame, send( data, reads=0 ) writes to the client. """
+        command, message = packet[3], bytes( packet[4:-1] )
+        self.statistics['frames'] += 1
+        C = ImpinjR2KCommands
+        status = lambda code=ImpinjR2KGlobalErrors.SUCCESS : send( self.frame( command, [ code ] ) )
+
+        if command == C.RESET:
+            self.buffer.clear( )
+        elif command in ( C.REAL_TIME_INVENTORY, C.CUSTOMIZED_SESSION_TARGET_INVENTORY, C.FAST_SWITCH_ANT_INVENTORY ):
+            self.__inventory( command, message, send )
+        elif command == C.INVENTORY:
+            start, repeat = time.monotonic( ), message[0] if message else 1
+            reads = [ ] if ( self.antenna + 1 ) in self.missing else self.__round( self.antenna + 1, repeat )
+            for tag, rssi in reads:
+                item = self.buffer.setdefault( bytes( tag.epc ), [ rssi, self.antenna + 1, 0 ] )
+                item[0], item[2] = max( item[0], rssi ), item[2] + 1
+            self.pace( 0, len( reads ) )
+            rate = int( len( reads ) / max( time.monotonic( ) - start, 1e-3 ) ) & 0xFFFF
+            send( self.frame( command, struct.pack( '>BHHI', self.antenna, len( self.buffer ), rate, len( reads ) ) ) )
+        elif command in ( C.GET_INVENTORY_BUFFER, C.GET_AND_RESET_INVENTORY_BUFFER ):
+            for frame in self.__buffer( command, command == C.GET_AND_RESET_INVENTORY_BUFFER ):
+                send( frame )
+        elif command == C.GET_INVENTORY_BUFFER_TAG_COUNT:
+            send( self.frame( command, struct.pack( '>H', len( self.buffer ) ) ) )
+        elif command == C.RESET_INVENTORY_BUFFER:
+            self.buffer.clear( )
+            status( )
+        elif command in ( C.READ, C.WRITE, C.WRITE_BLOCK, C.LOCK, C.KILL ):
+            for frame in self.__access( command, message ):
+                send( frame )
+        elif command == C.SET_ACCESS_EPC_MATCH:
+            self.match = bytearray( message[2:2+message[1]] ) if message[0] == 0 else None
+            status( )
+        elif command == C.GET_ACCESS_EPC_MATCH:
+            send( self.frame( command, [ 0x01 ] if self.match is None else bytes( [ 0x00, len( self.match ) ] ) + bytes( self.match ) ) )
+        elif command == C.SET_WORK_ANTENNA:
+            self.antenna = message[0]
+            status( )
+        elif command == C.GET_WORK_ANTENNA:
+            send( self.frame( command, [ self.antenna ] ) )
+        elif command in ( C.SET_RF_POWER, C.SET_TEMPORARY_OUTPUT_POWER ):
+            self.power = list( message ) * ( 4 // len( message ) ) if message else self.power
+            status( )
+        elif command == C.GET_RF_POWER:
+            send( self.frame( command, self.power ) )
+        elif command == C.SET_FREQUENCY_REGION:
+            self.region = list( message[0:3] )
+            status( )
+        elif command == C.GET_FREQUENCY_REGION:
+            send( self.frame( command, self.region ) )
+        elif command == C.SET_READER_ADDRESS:
+            status( )
+            self.address = message[0]
+        elif command == C.SET_READER_IDENTIFIER:
+            self.identifier = bytearray( message[0:12] )
+            status( )
+        elif command == C.GET_READER_IDENTIFIER:
+            send( self.frame( command, self.identifier ) )
+        elif command == C.GET_FIRMWARE_VERSION:
+            send( self.frame( command, [ 8, 1 ] ) )
+        elif command == C.GET_READER_TEMPERATURE:
+            send( self.frame( command, [ 1, 35 ] ) )
+        elif command == C.SET_RF_LINK_PROFILE:
+            self.profile = message[0]
+            status( )
+        elif command == C.GET_RF_LINK_PROFILE:
+            send( self.frame( command, [ self.profile ] ) )
+        elif command == C.SET_ANT_CONNECTION_DETECTOR:
+            self.detector = message[0]
+            status( )
+        elif command == C.GET_ANT_CONNECTION_DETECTOR:
+            send( self.frame( command, [ self.detector ] ) )
+        elif command == C.GET_RF_PORT_RETURN_LOSS:
+            send( self.frame( command, [ 0xEE if ( self.antenna + 1 ) in self.missing else 20 ] ) )
+        elif command == C.SET_GPIO_VALUE:
+            self.gpio[ message[0] - 1 ] = message[1]
+            status( )
+        elif command == C.GET_GPIO_VALUE:
+            send( self.frame( command, self.gpio[0:2] ) )
+        elif command in ( C.SET_BEEPER_MODE, C.SET_UART_BAUDRATE, C.SET_IMPINJ_FAST_TID, C.SET_AND_SAVE_IMPINJ_FAST_TID ):
+            self.beeper = message[0] if command == C.SET_BEEPER_MODE else self.beeper
+            status( )
+        else:
+            status( ImpinjR2KGlobalErrors.FAIL )
+
+    #-------------------------------------------------
+    def __client( self, conn ):
+        framer  = ImpinjR2KFramer( address=None )
+        lock    = threading.Lock( )
+        self.clients.add( conn )
+
+        def sender( simulator ):
+            def send( data, reads=0 ):
+                with lock:
+                    conn.sendall( data )
+                simulator.statistics['bytes'] += len( data )
+                simulator.statistics['reads'] += reads
+                simulator.pace( len( data ), reads )
+            return send
+
+        try:
+            while self.alive:
+                data = conn.recv( 4096 )
+                if not data:
+                    break
+                for packet in framer.feed( data ):
+                    readers = { simulator.address : simulator for simulator in [ self ] + self.peers }
+                    targets = list( readers.values( ) ) if packet[2] == 0xFF else [ readers.get( packet[2] ) ]
+                    for simulator in targets:
+                        if simulator is not None:
+                            simulator.handle( packet, sender( simulator ) )
+        except OSError as err:
+            logging.debug( '[SIMULATOR] {}'.format( err ) )
+        finally:
+            self.clients.discard( conn )
+            conn.close( )
+
+    def serve( self, host='127.0.0.1', port=0 ):
+        """ Listen on @host:@port ( 0 = any free port ) and return its socket:// URL. """
+        self.server = socket.socket( socket.AF_INET, socket.SOCK_STREAM )
+        self.server.setsockopt( socket.SOL_SOCKET, socket.SO_REUSEADDR, 1 )
+        self.server.bind( ( host, port ) )
+        self.server.listen( 8 )
+        self.alive = True
+
+        def accept( ):
+            while self.alive:
+                try:
+                    conn, _ = self.server.accept( )
+                except OSError:
+                    return
+                conn.setsockopt( socket.IPPROTO_TCP, socket.TCP_NODELAY, 1 )
+                threading.Thread( target=self.__client, args=( conn, ), daemon=True ).start( )
+        threading.Thread( target=accept, daemon=True ).start( )
+        return 'socket://{}:{}'.format( *self.server.getsockname( ) )
+
+    def drop( self ):
+        """ Disconnect every client ( a dropped link ), new connections are still accepted. """
+        for conn in list( self.clients ):
+            try:
+                conn.shutdown( socket.SHUT_RDWR )
+            except OSError:
+                pass
+
+    def close( self ):
+        self.alive = False
+        if self.server is not None:
+            try:
+                self.server.shutdown( socket.SHUT_RDWR )    # Wake up accept( ), the port is free again.
+            except OSError:
+                pass
+            self.server.close( )
+        self.server = None
+        self.drop( )
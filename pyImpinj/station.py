@@ -0,0 +1,115 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 encoding station."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 inventory-guided tag encoding.
+# Package:  None.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+
+import time
+import queue
+import collections
+
+from .records import is_tag
+
+ImpinjEncodingResult = collections.namedtuple( 'ImpinjEncodingResult', [ 'source', 'target', 'success', 'error', 'latency' ] )
+
+class ImpinjEncodingStation( object ):
+    """ Encode the tags passing an encoding station, one assignment per tag.
+
+        ASSIGNMENTS = ( [ ( 'USER', 0, '{:08X}'.format( serial ) ), ( 'EPC', 2, '646C8DBBD18000004{:07X}'.format( serial ) ) ]
+                        for serial in itertools.count( 1 ) )
+        station = R2000.encode( ASSIGNMENTS )
+        for result in station.run( ):
+            print( result, station.statistics( ) )
+
+        One assignment is a list of ( bank, address, hex data ) writes. Writes to
+        ( 'EPC', 2 ) change the EPC, they are done last.
+
+        Cycle : rt_inventory until DONE -- strongest RSSI tag not encoded yet --
+                writes ( ImpinjR2KAccess ) -- read back ( @verify ) -- next tag.
+        A failed assignment is kept for the next tag, a tag failing @attempts
+        times is skipped.
+    """
+    def __init__( self, reader, assignments, repeat=1, verify=True, attempts=3, timeout=2 ):
+        self.reader, self.assignments = reader, iter( assignments )
+        self.repeat, self.verify, self.attempts, self.timeout = repeat, verify, attempts, timeout
+        self.tags      = queue.Queue( )
+        self.done      = set( )     # EPCs that must not be encoded ( again ).
+        self.failures  = collections.Counter( )
+        self.latencies = collections.deque( maxlen=1000 )
+        self.encoded, self.failed, self.started = 0, 0, None
+
+    def __inventory( self ):
+        """ @return : { epc : rssi } of one inventory round. """
+        self.reader.protocol.rt_inventory( repeat=self.repeat )
+        seen, deadline = dict( ), time.monotonic( ) + self.timeout
+        while True:
+            try:
+                item = self.tags.get( timeout=max( 0, deadline - time.monotonic( ) ) )
+            except queue.Empty:
+                return seen
+            for tag in ( item if isinstance( item, list ) else [ item ] ):
+                if is_tag( tag ):
+                    epc = tag['epc']
+                    seen[ epc ] = max( seen.get( epc, -128 ), tag['rssi'] )
+                elif tag['type'] in ( 'DONE', 'ERROR' ):
+                    return seen
+
+    def encode( self, epc, assignment ):
+        """ @return : ImpinjEncodingResult of one tag. """
+        begin  = time.monotonic( )
+        writes = sorted( assignment, key=lambda write : ( write[0] == 'EPC' ) and ( write[1] == 2 ) )
+        target = next( ( data.upper( ) for bank, address, data in writes if ( bank == 'EPC' ) and ( address == 2 ) ), epc )
+        jobs   = [ ( epc, bank, address, data ) for bank, address, data in writes ]
+        if self.verify:
+            jobs += [ ( target, bank, address, len( data ) // 4 ) for bank, address, data in writes ]
+
+        results = self.reader.access( jobs, timeout=self.timeout )
+        error   = next( ( result.error for result in results if not result.success ), '' )
+        if ( not error ) and self.verify:
+            checks = zip( writes, results[ len( writes ): ] )
+            error  = next( ( 'Verify {} failed.'.format( bank ) for ( bank, _, data ), result in checks if result.data != data.upper( ) ), '' )
+        return ImpinjEncodingResult( epc, target, not error, error, time.monotonic( ) - begin )
+
+    def run( self, count=None ):
+        """ Generator of ImpinjEncodingResult, stops after @count tags or when the assignments run out. """
+        self.started = self.started or time.monotonic( )
+        assignment = None
+        factory = self.reader.protocol_factory
+        package_queue, factory.package_queue = factory.package_queue, self.tags
+        try:
+            while ( count is None ) or ( self.encoded < count ):
+                if assignment is None:
+                    assignment = next( self.assignments, None )
+                    if assignment is None:
+                        return
+                seen = { epc : rssi for epc, rssi in self.__inventory( ).items( ) if epc not in self.done }
+                if not seen:
+                    continue
+                epc = max( seen, key=seen.get )
+
+                result = self.encode( epc, assignment )
+                if result.success:
+                    self.encoded += 1
+                    self.done.update( [ epc, result.target ] )
+                    self.latencies.append( result.latency )
+                    assignment = None
+                else:
+                    self.failed += 1
+                    self.failures[ epc ] += 1
+                    if self.failures[ epc ] >= self.attempts:
+                        self.done.add( epc )
+                yield result
+        finally:
+            factory.package_queue = package_queue
+
+    def statistics( self ):
+        """ @return : dict( encoded, failed, per_minute, latency=dict( mean, min, max ) ) """
+        elapsed   = max( time.monotonic( ) - ( self.started or time.monotonic( ) ), 1e-6 )
+        latencies = list( self.latencies )
+        latency   = dict( mean=sum( latencies ) / len( latencies ), min=min( latencies ), max=max( latencies ) ) if latencies else dict( )
+        return dict( encoded=self.encoded, failed=self.failed, per_minute=self.encoded * 60 / elapsed, latency=latency )
@@ -0,0 +1,180 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 bounded tag queue."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 bounded package_queue with overflow policies and drop accounting.
+# Package:  None.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+
+import time
+import queue
+import threading
+import collections
+
+from .records import TagRead, is_tag
+
+POLICIES = ( 'block', 'drop-newest', 'drop-oldest', 'coalesce' )
+
+class ImpinjTagQueue( object ):
+    """ queue.Queue replacement for package_queue that never stalls the serial thread.
+
+        R2000 = ImpinjR2KReader( address=1, queue_size=1024, queue_policy='coalesce' )
+        TAG_QUEUE = R2000.package_queue     # ImpinjTagQueue
+        print( TAG_QUEUE.get( ), TAG_QUEUE.statistics( ) )
+
+        policy ( when @maxsize tag reads are pending ) :
+            'block'       : put( ) waits for the consumer, up to @timeout seconds, then the read is
+                            dropped. put( ) runs on the serial thread ( ReaderThread ), nothing is
+                            received from the reader while it waits. Once a wait timed out, the
+                            consumer is taken as stalled: further reads are dropped at once until
+                            get( ) frees room, so a stall costs the serial thread one @timeout, not
+                            one per read. timeout=None waits forever and stalls the serial thread
+                            ( the reader's UART buffer overflows ), use it with a consumer that keeps up.
+            'drop-newest' : The new read is dropped.
+            'drop-oldest' : The oldest pending read is dropped.
+            'coalesce'    : While @backlog reads or more are pending, a read of an EPC that is still
+                            pending replaces it ( same place in the queue ). A new EPC drops the
+                            oldest pending read.
+        A batch ( list, ImpinjR2KReader( batch_size=N ) ) counts as len( batch ) reads and is kept or
+        dropped whole ( never coalesced ). Other items ( DONE, ERROR ... ) are never dropped, they
+        may exceed @maxsize.
+
+        Counters ( statistics, tag reads only ) : put, delivered, dropped, coalesced, blocked, high ( high-water mark ).
+        Every read is accounted for: put == delivered + dropped + coalesced + pending.
+    """
+    def __init__( self, maxsize=1024, policy='drop-oldest', timeout=0.5, backlog=None ):
+        assert policy in POLICIES, 'policy must be one of {}.'.format( POLICIES )
+        assert maxsize > 0
+        self.maxsize, self.policy, self.timeout = maxsize, policy, timeout
+        self.backlog  = max( 1, maxsize // 2 ) if backlog is None else backlog
+        self.items    = collections.deque( )    # [ key, item, reads ]
+        self.pending  = dict( )                 # EPC : newest entry ( coalesce )
+        self.tags     = 0                       # Tag reads in @items
+        self.mutex    = threading.Lock( )
+        self.readable = threading.Condition( self.mutex )
+        self.writable = threading.Condition( self.mutex )
+        self.counters = dict( put=0, delivered=0, dropped=0, coalesced=0, blocked=0, high=0 )
+        self.stalled  = False                   # 'block' : a wait timed out, no get( ) since.
+
+    @staticmethod
+    def key( item ):
+        """ @return : ( EPC, reads ), EPC is None for batches and other items. """
+        if isinstance( item, TagRead ):
+            return item.epc, 1
+        if isinstance( item, list ):
+            return None, sum( 1 for tag in item if is_tag( tag ) )
+        if is_tag( item ):
+            return item['epc'], 1
+        return None, 0
+
+    def __drop_oldest( self, reads ):
+        """ Drop the oldest reads ( single or batch ) until @reads more fit, control items stay. """
+        index = 0
+        while ( self.tags + reads > self.maxsize ) and ( index < len( self.items ) ):
+            entry = self.items[ index ]
+            if not entry[2]:
+                index += 1
+                continue
+            del self.items[ index ]
+            self.__forget( entry )
+            self.counters['dropped'] += entry[2]
+
+    def __forget( self, entry ):
+        self.tags -= entry[2]
+        if ( entry[0] is not None ) and ( self.pending.get( entry[0] ) is entry ):
+            del self.pending[ entry[0] ]
+
+    def put( self, item, block=True, timeout=None ):
+        key, reads = self.key( item )
+        with self.mutex:
+            if not reads:
+                self.items.append( [ None, item, 0 ] )
+                self.readable.notify( )
+                return
+
+            counters = self.counters
+            counters['put'] += reads
+
+            if ( self.policy == 'coalesce' ) and ( key is not None ) and ( self.tags >= self.backlog ):
+                entry = self.pending.get( key )
+                if entry is not None:
+                    entry[1] = item
+                    counters['coalesced'] += 1
+                    return
+
+            if self.tags + reads > self.maxsize:
+                if self.policy == 'drop-newest':
+                    counters['dropped'] += reads
+                    return
+                elif self.policy == 'block':
+                    if self.stalled:
+                        counters['dropped'] += reads
+                        return
+                    counters['blocked'] += 1
+                    wait = self.timeout if timeout is None else timeout
+                    deadline = None if ( wait is None ) or ( not block ) else time.monotonic( ) + wait
+                    ### A batch larger than @maxsize waits for an empty queue.
+                    while ( self.tags + reads > self.maxsize ) and self.tags:
+                        remaining = 0 if not block else ( None if deadline is None else deadline - time.monotonic( ) )
+                        if ( remaining is not None ) and ( remaining <= 0 ):
+                            counters['dropped'] += reads
+                            self.stalled = bool( block )
+                            return
+                        self.writable.wait( remaining )
+                else:
+                    self.__drop_oldest( reads )
+
+            entry = [ key, item, reads ]
+            self.items.append( entry )
+            self.tags += reads
+            if key is not None:
+                self.pending[ key ] = entry
+            counters['high'] = max( counters['high'], self.tags )
+            self.readable.notify( )
+
+    def put_nowait( self, item ):
+        return self.put( item, block=False )
+
+    def get( self, block=True, timeout=None ):
+        with self.mutex:
+            if not block:
+                if not self.items:
+                    raise queue.Empty
+            elif timeout is None:
+                while not self.items:
+                    self.readable.wait( )
+            else:
+                deadline = time.monotonic( ) + timeout
+                while not self.items:
+                    remaining = deadline - time.monotonic( )
+                    if remaining <= 0:
+                        raise queue.Empty
+                    self.readable.wait( remaining )
+            entry = self.items.popleft( )
+            if entry[2]:
+                self.__forget( entry )
+                self.counters['delivered'] += entry[2]
+                self.stalled = False
+                self.writable.notify( )
+            return entry[1]
+
+    def get_nowait( self ):
+        return self.get( block=False )
+
+    def qsize( self ):
+        with self.mutex:
+            return len( self.items )
+
+    def empty( self ):
+        return self.qsize( ) == 0
+
+    def full( self ):
+        with self.mutex:
+            return self.tags >= self.maxsize
+
+    def statistics( self ):
+        with self.mutex:
+            return dict( self.counters, pending=self.tags, policy=self.policy, maxsize=self.maxsize )
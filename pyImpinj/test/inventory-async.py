@@ -0,0 +1,42 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Test script."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Test script (asyncio inventory, many readers).
+# Package:  pip3 install pyImpinj pyserial-asyncio.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.0 [Heyn] Initialization
+
+import asyncio
+import logging
+
+from pyImpinj import AsyncImpinjR2KReader
+
+logging.basicConfig( level=logging.INFO )
+
+READERS = [ 'socket://192.168.1.116:4001', 'socket://192.168.1.117:4001' ]
+
+async def worker( port ):
+    R2000 = AsyncImpinjR2KReader( address=1 )
+    try:
+        await R2000.connect( port )
+    except BaseException as err:
+        print( err )
+        return
+
+    print( await R2000.fast_power( 22 ) )
+    await R2000.rt_inventory( repeat=1 )
+    async for data in R2000:
+        if data['type'] == 'DONE':
+            await R2000.rt_inventory( repeat=1 )
+            continue
+        print( port, data )
+
+def main( ):
+    loop = asyncio.get_event_loop( )
+    loop.run_until_complete( asyncio.gather( *[ worker( port ) for port in READERS ] ) )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Test script."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Test script (Continuous inventory, no idle gap between rounds).
+# Package:  pip3 install pyImpinj.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.0 [Heyn] Initialization
+
+import time
+import queue
+import logging
+
+from pyImpinj import ImpinjR2KReader
+
+from pyImpinj.constant import READER_ANTENNA
+
+logging.basicConfig( level=logging.INFO )
+
+def main( ):
+    TAG_QUEUE = queue.Queue( 1024 )
+    R2000 = ImpinjR2KReader( TAG_QUEUE, address=1 )
+
+    try:
+        R2000.connect( 'COM9' )
+    except BaseException as err:
+        print( err )
+        return
+
+    R2000.worker_start()
+    R2000.fast_power( 22 )
+
+    scheduler = R2000.start_inventory( mode='rt', antennas=[ READER_ANTENNA['ANTENNA1'],
+                                                             READER_ANTENNA['ANTENNA2'],
+                                                             READER_ANTENNA['ANTENNA3'],
+                                                             READER_ANTENNA['ANTENNA4'] ] )
+    start = time.time()
+    while True:
+        data = TAG_QUEUE.get( )
+        if data['type'] == 'TAG':
+            print( data )
+        if time.time() - start > 5:
+            print( scheduler.statistics() )
+            start = time.time()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Test script."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Test script (Continuous inventory against the software reader, no hardware).
+# Package:  pip3 install pyImpinj.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.0 [Heyn] Initialization
+
+import time
+import queue
+import logging
+
+from pyImpinj import ImpinjR2KReader, ImpinjR2KSimulator, ImpinjTagPopulation
+
+logging.basicConfig( level=logging.INFO )
+
+def main( ):
+    # speed=1.0 : 115200bps and 500 reads/s like a real module, speed=0 : as fast as possible.
+    SIM = ImpinjR2KSimulator( address=1, population=ImpinjTagPopulation( count=1000, coverage=2 ), speed=0 )
+
+    TAG_QUEUE = queue.Queue( 1024 )
+    R2000 = ImpinjR2KReader( TAG_QUEUE, address=1, compact=True, batch_size=64 )
+    R2000.connect( SIM.serve( ) )
+    R2000.worker_start()
+    R2000.fast_power( 22 )
+
+    scheduler = R2000.start_inventory( mode='fast', dwell=True, antennas=[ 0, 1, 2, 3 ] )
+    start = time.time()
+    while time.time() - start < 10:
+        TAG_QUEUE.get( )
+    print( scheduler.statistics() )
+    print( SIM.statistics )
+
+    R2000.worker_close()
+    SIM.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# !/usr/bin/python
+# -*- coding:utf-8 -*-
+""" Impinj R2000 shared link transport."""
+# Python:   3.6.5+
+# Platform: Windows/Linux/MacOS
+# Author:   Heyn (heyunhuan@gmail.com)
+# Program:  Impinj R2000 transport with reconnect ( serial or serial-over-network ).
+# Package:  pip3 install pyserial.
+# Drivers:  None.
+# History:  2026-10-17 Ver:1.4 [Heyn] Initialization
+
+import time
+import socket
+import serial
+import logging
+import threading
+
+from .enums    import ImpinjR2KCommands
+from .framer   import ImpinjR2KFramer
+from .protocol import ImpinjR2KProtocols
+
+### Configuration frames that are written again after a reconnect.
+CONFIG_COMMANDS = frozenset( [ ImpinjR2KCommands.SET_RF_POWER,
+                               ImpinjR2KCommands.SET_TEMPORARY_OUTPUT_POWER,
+                               ImpinjR2KCommands.SET_WORK_ANTENNA,
+                               ImpinjR2KCommands.SET_FREQUENCY_REGION,
+                               ImpinjR2KCommands.SET_ANT_CONNECTION_DETECTOR,
+                               ImpinjR2KCommands.SET_BEEPER_MODE,
+                               ImpinjR2KCommands.SET_RF_LINK_PROFILE ] )
+
+class ImpinjR2KLink( threading.Thread ):
+    """ One physical link shared by every reader behind it ( demultiplexed by address ).
+
+        link = ImpinjR2KLink.shared( 'socket://192.168.1.116:4001' )
+        link.attach( 1, protocol_factory )      # ImpinjProtocolFactory.handle_packet( packet )
+        link.write( frame )
+
+        - Reads everything the port has buffered in one call ( read batching ).
+        - Reconnects with exponential backoff ( @backoff = ( first, max ) seconds ).
+        - TCP keepalive on socket:// ports. With @keepalive seconds, an idle link
+          is probed with GET_FIRMWARE_VERSION and reopened after 3 silent periods.
+        - The last frame of every CONFIG_COMMANDS command is written again after
+          a reconnect, per address.
+    """
+    LINKS = dict( )
+    LOCK  = threading.Lock( )
+
+    @classmethod
+    def shared( cls, port, baudrate=115200, **kwargs ):
+        """ Return the link of @port, start it if needed. """
+        with cls.LOCK:
+            link = cls.LINKS.get( port )
+            if ( link is None ) or ( not link.alive ):
+                link = cls.LINKS[ port ] = cls( port, baudrate, **kwargs )
+                link.start( )
+            return link
+
+    def __init__( self, port, baudrate=115200, backoff=( 0.5, 30 ), keepalive=None ):
+        super( ImpinjR2KLink, self ).__init__( )
+        self.daemon = True
+        self.port, self.baudrate = port, baudrate
+        self.backoff, self.keepalive = backoff, keepalive
+        self.framer    = ImpinjR2KFramer( address=None )
+        self.protocols = dict( )
+        self.configs   = dict( )
+        self.lock      = threading.Lock( )
+        self.connected = threading.Event( )
+        self.alive     = True
+        self.ser       = None
+        self.recorder  = None       # ImpinjR2KRecorder
+        self.reconnects, self.last_receive = -1, time.monotonic( )
+
+    def attach( self, address, protocol ):
+        self.protocols[ address ] = protocol
+        protocol.connection_made( self )
+
+    def detach( self, address ):
+        protocol = self.protocols.pop( address, None )
+        if protocol is not None:
+            protocol.connection_lost( None )
+        if not self.protocols:
+            self.close( )
+
+    #-------------------------------------------------
+    def __open( self ):
+        ser = serial.serial_for_url( self.port, do_not_open=True )
+        ser.baudrate, ser.bytesize = self.baudrate, 8
+        ser.parity, ser.stopbits = serial.PARITY_NONE, serial.STOPBITS_ONE
+        ser.timeout = 1 if self.keepalive is None else min( 1, self.keepalive )
+        ser.open( )
+        sock = getattr( ser, '_socket', None )
+        if sock is not None:
+            sock.setsockopt( socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1 )
+        self.ser = ser
+
+    def __close( self ):
+        self.connected.clear( )
+        if self.ser is not None:
+            try:
+                self.ser.close( )
+            except BaseException:
+                pass
+        self.ser = None
+        self.framer.reset( )
+
+    def __connect( self ):
+        delay = self.backoff[0]
+        while self.alive:
+            try:
+                self.__open( )
+            except BaseException as err:
+                logging.error( '[LINK] Could not open {}: {} ( retry in {}s )'.format( self.port, err, delay ) )
+                time.sleep( delay )
+                delay = min( delay * 2, self.backoff[1] )
+                continue
+
+            self.reconnects  += 1
+            self.last_receive = time.monotonic( )
+            with self.lock:
+                configs = list( self.configs.values( ) )
+                if configs:
+                    logging.info( '[LINK] {} re-apply {} configuration frames.'.format( self.port, len( configs ) ) )
+                    self.ser.write( b''.join( configs ) )
+            self.connected.set( )
+            return
+
+    def __probe( self ):
+        idle = time.monotonic( ) - self.last_receive
+        if idle > self.keepalive * 3:
+            raise serial.SerialException( 'No response for {:.1f}s'.format( idle ) )
+        if ( idle > self.keepalive ) and self.protocols:
+            address = next( iter( self.protocols ) )
+            self.write( ImpinjR2KProtocols( address=address ).version( ) )
+
+    def run( self ):
+        while self.alive:
+            if not self.connected.is_set( ):
+                self.__connect( )
+                continue
+            try:
+                data = self.ser.read( self.ser.in_waiting or 1 )
+                if data:
+                    self.last_receive = time.monotonic( )
+                    if self.recorder is not None:
+                        self.recorder.write( data )
+                elif self.keepalive is not None:
+                    self.__probe( )
+            except BaseException as err:
+                if self.alive:
+                    logging.error( '[LINK] {} lost: {}'.format( self.port, err ) )
+                self.__close( )
+                continue
+
+            for packet in self.framer.feed( data ):
+                protocol = self.protocols.get( packet[2] )
+                if protocol is None:
+                    continue
+                try:
+                    protocol.handle_packet( packet )
+                except BaseException as err:
+                    logging.error( '[LINK] handle_packet : {}'.format( err ) )
+
+    def write( self, data ):
+        """ Called by ImpinjR2KProtocols ( one frame or a pipeline of frames ). """
+        frames = [ data ] if ( len( data ) == data[1] + 2 ) else ImpinjR2KFramer( address=None ).feed( data )
+        for frame in frames:
+            if frame[3] in CONFIG_COMMANDS:
+                self.configs[ ( frame[2], frame[3] ) ] = bytes( frame )
+
+        with self.lock:
+            if not self.connected.is_set( ):
+                raise serial.SerialException( '{} is not connected.'.format( self.port ) )
+            return self.ser.write( data )
+
+    def close( self ):
+        self.alive = False
+        self.__close( )
+        with ImpinjR2KLink.LOCK:
+            if ImpinjR2KLink.LINKS.get( self.port ) is self:
+                del ImpinjR2KLink.LINKS[ self.port ]
@@ -52,5 +52,6 @@ setup(
     packages=['pyImpinj'],
 
     install_requires=[ 'pyserial == 3.4', 'libscrc == 0.1.6' ],
+    extras_require={ 'numpy' : [ 'numpy' ] },
 
 )
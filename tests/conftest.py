@@ -0,0 +1,21 @@
+# -*- coding:utf-8 -*-
+""" Shared fixtures: a reader connected to ImpinjR2KSimulator. """
+
+import pytest
+
+from pyImpinj import ImpinjR2KReader, ImpinjR2KSimulator, ImpinjTagPopulation
+
+@pytest.fixture
+def simulator( ):
+    simulator = ImpinjR2KSimulator( address=1, population=ImpinjTagPopulation( count=4, antennas=( 1, ), seed=1 ), speed=0, seed=1 )
+    yield simulator
+    simulator.close( )
+
+@pytest.fixture
+def reader( simulator ):
+    """ @return : ( ImpinjR2KReader, EPC of the first simulated tag ) """
+    reader = ImpinjR2KReader( address=1 )
+    reader.connect( simulator.serve( ) )
+    reader.worker_start( )
+    yield reader, bytes( simulator.population.tags[0].epc ).hex( ).upper( )
+    reader.worker_close( )
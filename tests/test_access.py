@@ -0,0 +1,28 @@
+# -*- coding:utf-8 -*-
+""" ImpinjR2KAccess against ImpinjR2KSimulator. """
+
+import threading
+
+def test_access_after_read( reader ):
+    reader, epc = reader
+    assert reader.read( epc, bank='TID', address=0, size=2 )
+    results = reader.access( [ ( epc, 'TID', 0, 2 ), ( epc, 'USER', 0, 2 ) ], timeout=1 )
+    assert [ result.success for result in results ] == [ True, True ], results
+
+def test_access_after_write( reader ):
+    reader, epc = reader
+    assert reader.write( epc, '11112222', bank='USER', address=0 )
+    results = reader.access( [ ( epc, 'USER', 0, '33334444' ), ( epc, 'USER', 0, 2 ) ], timeout=1 )
+    assert [ result.success for result in results ] == [ True, True ], results
+    assert results[1].data == '33334444'
+
+def test_access_after_read_on_another_thread( reader ):
+    reader, epc = reader
+    thread = threading.Thread( target=reader.read, args=( epc, 'TID', 0, 2 ) )
+    thread.start( )
+    thread.join( 10 )
+    results = [ ]
+    thread = threading.Thread( target=lambda : results.extend( reader.access( [ ( epc, 'TID', 0, 2 ), ( epc, 'USER', 0, 2 ) ], timeout=1 ) ) )
+    thread.start( )
+    thread.join( 10 )
+    assert [ result.success for result in results ] == [ True, True ], results
@@ -0,0 +1,43 @@
+# -*- coding:utf-8 -*-
+""" AsyncImpinjR2KReader after a lost connection. """
+
+import asyncio
+
+import pytest
+
+from pyImpinj import AsyncImpinjR2KReader
+
+async def connected( handler ):
+    """ A reader connected to a local server running @handler( reader, writer ). """
+    server = await asyncio.start_server( handler, '127.0.0.1', 0 )
+    reader = AsyncImpinjR2KReader( address=1 )
+    await reader.connect( 'socket://{}:{}'.format( *server.sockets[0].getsockname( )[:2] ) )
+    return server, reader
+
+def test_iteration_ends_on_disconnect( ):
+    async def main( ):
+        async def hang_up( _, writer ):
+            await asyncio.sleep( 0.05 )
+            writer.close( )
+
+        server, reader = await connected( hang_up )
+        items = [ item async for item in reader ]
+        server.close( )
+        return items
+
+    assert asyncio.run( asyncio.wait_for( main( ), 3 ) ) == [ ]
+
+def test_pending_request_fails_on_disconnect( ):
+    async def main( ):
+        async def hang_up( stream, writer ):
+            await stream.read( 1 )
+            writer.close( )
+
+        server, reader = await connected( hang_up )
+        try:
+            with pytest.raises( ConnectionError ):
+                await reader.identifier( )
+        finally:
+            server.close( )
+
+    asyncio.run( asyncio.wait_for( main( ), 3 ) )
@@ -0,0 +1,56 @@
+# -*- coding:utf-8 -*-
+""" ImpinjTagBatcher flush triggers. """
+
+import time
+import queue
+
+from pyImpinj.batch   import ImpinjTagBatcher
+from pyImpinj.records import TagRead
+
+def tags( count ):
+    return [ TagRead( 1, 0, -60, bytes( [ index ] * 12 ), 0.0 ) for index in range( count ) ]
+
+def test_flush_on_size( ):
+    sink    = queue.Queue( )
+    batcher = ImpinjTagBatcher( sink, size=4, latency=60 )
+    reads   = tags( 10 )
+    for tag in reads:
+        batcher.put( tag )
+    assert [ sink.get_nowait( ), sink.get_nowait( ) ] == [ reads[0:4], reads[4:8] ]
+    assert sink.empty( )
+    batcher.close( )
+    assert sink.get_nowait( ) == reads[8:10]
+
+def test_flush_on_latency( ):
+    sink    = queue.Queue( )
+    batcher = ImpinjTagBatcher( sink, size=64, latency=0.05 )
+    reads   = tags( 3 )
+    start   = time.monotonic( )
+    for tag in reads:
+        batcher.put( tag )
+    assert sink.get( timeout=2 ) == reads
+    assert 0.04 <= time.monotonic( ) - start < 1.0
+    batcher.close( )
+
+def test_control_item_flushes_first( ):
+    sink    = queue.Queue( )
+    batcher = ImpinjTagBatcher( sink, size=64, latency=60 )
+    reads   = tags( 2 )
+    for tag in reads:
+        batcher.put( tag )
+    batcher.put( dict( type='DONE', total_read=2, duration=0 ) )
+    assert sink.get_nowait( ) == reads
+    assert sink.get_nowait( )['type'] == 'DONE'
+    batcher.close( )
+
+def test_final_flush_on_close( ):
+    sink    = queue.Queue( )
+    batcher = ImpinjTagBatcher( sink, size=64, latency=60 )
+    reads   = tags( 5 )
+    for tag in reads:
+        batcher.put( tag )
+    assert sink.empty( )
+    batcher.close( )
+    assert sink.get_nowait( ) == reads
+    batcher.flusher.join( 1 )
+    assert not batcher.flusher.is_alive( )
@@ -0,0 +1,44 @@
+# -*- coding:utf-8 -*-
+""" ImpinjR2KBus with two simulated addresses on one port. """
+
+import time
+import queue
+
+from pyImpinj       import ImpinjR2KBus, ImpinjR2KSimulator, ImpinjTagPopulation
+from pyImpinj.enums import ImpinjR2KCommands as C
+
+def logged( simulator, log ):
+    handle = simulator.handle
+    def wrapper( packet, send ):
+        log.append( ( simulator.address, packet[3], time.monotonic( ) ) )
+        return handle( packet, send )
+    simulator.handle = wrapper
+    return simulator
+
+def test_staggered_round_and_drain( ):
+    log   = list( )
+    peer  = logged( ImpinjR2KSimulator( address=2, population=ImpinjTagPopulation( count=6, antennas=( 1, ), seed=2 ), speed=0, seed=2 ), log )
+    first = logged( ImpinjR2KSimulator( address=1, population=ImpinjTagPopulation( count=4, epc_size=8, antennas=( 1, ), seed=1 ),
+                                        speed=0, peers=[ peer ], seed=1 ), log )
+    bus = ImpinjR2KBus( first.serve( ), backoff=( 0.05, 0.2 ) )
+    try:
+        for address in ( 1, 2 ):
+            bus.reader( address, queue.Queue( ) )
+        del log[:]
+        result = bus.inventory_round( repeat=4, stagger=0.05 )
+
+        ### Both radios start before any buffer is drained.
+        assert [ ( address, command ) for address, command, _ in log[:2] ] == [ ( 1, C.INVENTORY ), ( 2, C.INVENTORY ) ]
+        assert log[1][2] - log[0][2] >= 0.04
+        assert all( command == C.GET_AND_RESET_INVENTORY_BUFFER for _, command, _ in log[2:] )
+
+        ### Each buffer is drained once, into its own address.
+        for address, simulator in ( ( 1, first ), ( 2, peer ) ):
+            epcs = [ epc for _, _, epc in result[ address ] ]
+            assert epcs and len( epcs ) == len( set( epcs ) )
+            assert set( epcs ) <= { bytes( tag.epc ).hex( ).upper( ) for tag in simulator.population.tags }
+            assert not simulator.buffer
+        assert [ address for address, _, _ in log[2:] ] == [ 1, 2 ]
+    finally:
+        bus.close( )
+        first.close( )
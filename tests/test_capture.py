@@ -0,0 +1,80 @@
+# -*- coding:utf-8 -*-
+""" Capture files: record, rotate, compress and replay. """
+
+import os
+import queue
+
+import pytest
+
+from pyImpinj         import ImpinjR2KReader, ImpinjProtocolFactory, ImpinjR2KDispatcher
+from pyImpinj.capture import ImpinjR2KRecorder, ImpinjR2KReplay, TX
+from pyImpinj.framer  import ImpinjR2KFramer
+
+def live( reader ):
+    """ Collect the packets handled by @reader. """
+    packets, handle = list( ), reader.protocol_factory.handle_packet
+    def collect( packet ):
+        packets.append( bytes( packet ) )
+        handle( packet )
+    reader.protocol_factory.handle_packet = collect
+    return packets
+
+def test_record_and_replay( reader, tmp_path ):
+    reader, _ = reader
+    path    = str( tmp_path / 'site.r2k' )
+    packets = live( reader )
+    reader.record( path, merge=0 )
+    reader.get_work_antenna( )
+    reader.get_rf_power( )
+    reader.rt_inventory( repeat=2 )
+    while reader.package_queue.get( timeout=3 )['type'] != 'DONE':
+        pass
+    reader.stop_record( )
+
+    replay = ImpinjR2KReplay( path )
+    assert ImpinjR2KFramer( address=1 ).feed( replay.stream( ) ) == packets
+    assert [ frame[3] for frame in ImpinjR2KFramer( address=None ).feed( b''.join( data for _, _, data in replay.chunks( TX ) ) ) ] == [ 0x75, 0x77, 0x89 ]
+
+    tags, commands = queue.Queue( ), ImpinjR2KDispatcher( )
+    factory = ImpinjProtocolFactory( tags, commands, address=1 )
+    assert replay.feed( factory, speed=0 )['bytes'] == len( replay.stream( ) )
+    assert tags.qsize( ) == sum( 1 for packet in packets if packet[3] == 0x89 )
+
+def test_record_before_worker_start( simulator, tmp_path ):
+    reader = ImpinjR2KReader( address=1 )
+    with pytest.raises( ConnectionError ):
+        reader.record( str( tmp_path / 'early.r2k' ) )
+    reader.connect( simulator.serve( ) )
+    reader.record( str( tmp_path / 'early.r2k' ), merge=0 )
+    reader.worker_start( )
+    try:
+        assert reader.get_work_antenna( ) == b'\x00'
+    finally:
+        reader.worker_close( )
+    assert ImpinjR2KFramer( address=1 ).feed( ImpinjR2KReplay( str( tmp_path / 'early.r2k' ) ).stream( ) )
+
+def test_rotation( tmp_path ):
+    path     = str( tmp_path / 'site.r2k' )
+    recorder = ImpinjR2KRecorder( path, max_bytes=200, backups=2, merge=0 )
+    chunks   = [ bytes( [ index ] * 30 ) for index in range( 40 ) ]
+    for chunk in chunks:
+        recorder.write( chunk )
+    recorder.close( )
+
+    assert recorder.statistics( )['rotations'] > 2
+    assert os.path.exists( path + '.2' ) and not os.path.exists( path + '.3' )
+    stream = ImpinjR2KReplay.rotated( path ).stream( )
+    assert stream and b''.join( chunks ).endswith( stream )     # Oldest files are gone, the rest is in order.
+
+def test_gzip( tmp_path ):
+    path     = str( tmp_path / 'site.r2k' )
+    recorder = ImpinjR2KRecorder( path, compress=True, merge=0 )
+    recorder.write( b'\xA0\x04\x01\x89\x00\xD2' )
+    recorder.write( b'\xA0\x03\x01\x72\xEA', TX )
+    recorder.close( )
+
+    with open( path, 'rb' ) as fp:
+        assert fp.read( 2 ) == b'\x1f\x8b'
+    assert ImpinjR2KReplay.is_capture( path )
+    assert ImpinjR2KReplay( path ).stream( ) == b'\xA0\x04\x01\x89\x00\xD2'
+    assert [ data for _, _, data in ImpinjR2KReplay( path ).chunks( None ) ] == [ b'\xA0\x04\x01\x89\x00\xD2', b'\xA0\x03\x01\x72\xEA' ]
@@ -0,0 +1,18 @@
+# -*- coding:utf-8 -*-
+""" ImpinjTagDeduplicator window timer. """
+
+import queue
+
+from pyImpinj import ImpinjTagDeduplicator, TagRead
+
+def test_window_ends_without_reads( ):
+    tags  = queue.Queue( )
+    dedup = ImpinjTagDeduplicator( tags, window=0.05 )
+    for _ in range( 3 ):
+        dedup.put( TagRead( 1, 0, -50, b'\x01', 0.0 ) )
+    dedup.put( TagRead( 2, 0, -60, b'\x02', 0.0 ) )
+    aggregates = [ tags.get( timeout=1 ), tags.get( timeout=1 ) ]     # No further put( ).
+    assert sorted( aggregate.epc for aggregate in aggregates ) == [ b'\x01', b'\x02' ]
+    assert [ aggregate.count for aggregate in aggregates if aggregate.epc == b'\x01' ] == [ 3 ]
+    dedup.close( )
+    assert tags.empty( )
@@ -0,0 +1,29 @@
+# -*- coding:utf-8 -*-
+""" ImpinjR2KDispatcher waiters across threads. """
+
+import threading
+
+from pyImpinj.enums      import ImpinjR2KCommands
+from pyImpinj.dispatcher import ImpinjR2KDispatcher
+
+def in_thread( func, *args ):
+    result = list( )
+    thread = threading.Thread( target=lambda : result.append( func( *args ) ) )
+    thread.start( )
+    thread.join( 10 )
+    return result[0]
+
+def test_dead_thread_waiter_is_skipped( ):
+    dispatcher = ImpinjR2KDispatcher( )
+    in_thread( dispatcher.expect, 1, ImpinjR2KCommands.READ )         # Leaked stream waiter.
+    waiter = dispatcher.expect( 1, ImpinjR2KCommands.READ )
+    dispatcher.put( dict( address=1, command=ImpinjR2KCommands.READ, data=b'\x10' ) )
+    assert waiter.get( timeout=1 )['data'] == b'\x10'
+    assert len( dispatcher.waiters[ ( 1, ImpinjR2KCommands.READ ) ] ) == 1
+
+def test_read_on_another_thread( reader ):
+    reader, epc = reader
+    assert in_thread( reader.read, epc, 'TID', 0, 2 )
+    assert in_thread( reader.write, epc, '11112222', 'USER', 0 )
+    assert not any( reader.command_queue.waiters.values( ) )
+    assert reader.read( epc, bank='USER', address=0, size=2 ) == '11112222'
@@ -0,0 +1,23 @@
+# -*- coding:utf-8 -*-
+""" ImpinjR2KReader.drain_inventory_buffer against ImpinjR2KSimulator. """
+
+def test_drain_returns_each_tag_once( reader, simulator ):
+    reader, _ = reader
+    assert reader.inventory( repeat=4 )
+    buffered = { epc.hex( ).upper( ) for epc in simulator.buffer }
+    assert len( buffered ) > 1
+
+    epcs = [ epc for _, _, epc in reader.drain_inventory_buffer( timeout=1 ) ]
+    assert sorted( epcs ) == sorted( buffered )
+    assert not simulator.buffer
+
+    ### The buffer was reset, so the next drain stops on BUFFER_IS_EMPTY_ERROR.
+    assert list( reader.drain_inventory_buffer( timeout=1 ) ) == [ ]
+
+def test_drain_without_reset_keeps_the_buffer( reader, simulator ):
+    reader, _ = reader
+    assert reader.inventory( repeat=4 )
+    first  = sorted( epc for _, _, epc in reader.drain_inventory_buffer( reset=False, timeout=1 ) )
+    second = sorted( epc for _, _, epc in reader.drain_inventory_buffer( timeout=1 ) )
+    assert first and first == second
+    assert list( reader.drain_inventory_buffer( timeout=1 ) ) == [ ]
@@ -0,0 +1,95 @@
+# -*- coding:utf-8 -*-
+""" ImpinjR2KFleet worker loop and supervision. """
+
+import time
+import threading
+import multiprocessing
+
+from pyImpinj       import ImpinjR2KSimulator, ImpinjTagPopulation
+from pyImpinj.fleet import ImpinjR2KFleet, run_reader
+
+class Conn( object ):
+    def __init__( self ):
+        self.sent = list( )
+
+    def send( self, message ):
+        self.sent.append( message )
+
+def test_single_reads_without_batching( ):
+    simulator = ImpinjR2KSimulator( address=1, population=ImpinjTagPopulation( count=4, antennas=( 1, ), seed=1 ), speed=0, seed=1 )
+    config = dict( name='DOCK1', port=simulator.serve( ), address=1, batch_size=0, timeout=0.2 )
+    conn, stats, alive = Conn( ), dict( ), threading.Event( )
+    alive.set( )
+    thread = threading.Thread( target=run_reader, args=( config, conn, threading.Lock( ), stats, alive ), daemon=True )
+    thread.start( )
+    deadline = time.monotonic( ) + 3
+    while ( stats.get( 'DOCK1', dict( ) ).get( 'rounds', 0 ) < 2 ) and ( time.monotonic( ) < deadline ) and thread.is_alive( ):
+        time.sleep( 0.01 )
+    alive.clear( )
+    thread.join( 3 )
+    simulator.close( )
+
+    assert not thread.is_alive( )
+    assert stats['DOCK1']['rounds'] >= 2
+    assert stats['DOCK1']['errors'] == 0
+    assert stats['DOCK1']['reads'] > 0
+    assert all( [ len( data ) == 1 for kind, _, data in conn.sent if kind == 'TAGS' ] )
+
+class Process( object ):
+    def is_alive( self ):
+        return False
+
+    def terminate( self ):
+        pass
+
+    def join( self, timeout=None ):
+        pass
+
+def test_supervise_closes_the_old_pipe( monkeypatch ):
+    fleet = ImpinjR2KFleet( [ dict( name='DOCK1', port='socket://127.0.0.1:1' ) ], workers=1 )
+    parent, child = multiprocessing.Pipe( )
+    fleet.workers[0] = dict( process=Process( ), conn=parent, seen=time.monotonic( ) )
+    monkeypatch.setattr( fleet, '_ImpinjR2KFleet__spawn', lambda index : None )
+    fleet.supervise( )
+    assert parent.closed
+    assert fleet.restarts == [ 1 ]
+    child.close( )
+
+def wait( condition, timeout=5 ):
+    deadline = time.monotonic( ) + timeout
+    while ( not condition( ) ) and ( time.monotonic( ) < deadline ):
+        time.sleep( 0.01 )
+    return condition( )
+
+def start_reader( config ):
+    conn, stats, alive = Conn( ), dict( ), threading.Event( )
+    alive.set( )
+    thread = threading.Thread( target=run_reader, args=( config, conn, threading.Lock( ), stats, alive ), daemon=True )
+    thread.start( )
+    assert wait( lambda : stats.get( config['name'], dict( ) ).get( 'connected' ) )
+    return thread, stats, alive
+
+def test_disconnect_without_reconnect( simulator ):
+    thread, stats, _ = start_reader( dict( name='DOCK1', port=simulator.serve( ), address=1, timeout=0.2 ) )
+    simulator.drop( )
+    thread.join( 5 )
+    assert not thread.is_alive( )
+    assert stats['DOCK1']['connected'] is False
+    assert stats['DOCK1']['errors'] >= 1
+
+def test_disconnect_with_reconnect( simulator ):
+    url  = simulator.serve( )
+    port = int( url.rpartition( ':' )[2] )
+    thread, stats, alive = start_reader( dict( name='DOCK1', port=url, address=1, timeout=0.2, reconnect=True ) )
+    simulator.close( )
+    assert wait( lambda : stats['DOCK1']['connected'] is False )
+    assert thread.is_alive( )
+    simulator.serve( port=port )
+    assert wait( lambda : stats['DOCK1']['connected'] is True, timeout=10 )
+    alive.clear( )
+    thread.join( 5 )
+    assert stats['DOCK1']['connected'] is False
+
+def test_no_empty_workers( ):
+    fleet = ImpinjR2KFleet( [ dict( name='DOCK1', port='COM1' ), dict( name='DOCK2', port='COM2' ) ], workers=4 )
+    assert fleet.groups == [ [ dict( name='DOCK1', port='COM1' ) ], [ dict( name='DOCK2', port='COM2' ) ] ]
@@ -0,0 +1,57 @@
+# -*- coding:utf-8 -*-
+""" ImpinjR2KFramer resynchronization. """
+
+import random
+
+import libscrc
+
+from pyImpinj.framer import ImpinjR2KFramer
+
+def frame( address, command, data ):
+    message = bytes( [ 0xA0, len( data ) + 3, address, command ] ) + bytes( data )
+    return message + bytes( [ libscrc.lrc( message ) ] )
+
+def feed( framer, stream, chunk ):
+    packets = list( )
+    for index in range( 0, len( stream ), chunk ):
+        packets += framer.feed( stream[index:index+chunk] )
+    return packets
+
+def test_split_frames( ):
+    frames = [ frame( 1, 0x89, bytes( [ index ] * 18 ) ) for index in range( 50 ) ]
+    framer = ImpinjR2KFramer( address=1 )
+    assert feed( framer, b''.join( frames ), 7 ) == frames
+    assert not framer.buffer
+
+def test_corrupt_length_does_not_hold_back_good_frames( ):
+    framer = ImpinjR2KFramer( address=1 )
+    good   = frame( 1, 0x89, bytes( 18 ) )
+    bad    = bytearray( frame( 1, 0x89, bytes( 18 ) ) )
+    bad[1] = 0xF0
+    assert framer.feed( bytes( bad ) + good ) == [ good ]
+    assert ( framer.recovered, framer.resync ) == ( 1, 1 )
+    assert not framer.buffer
+
+def test_fuzz_corrupt_length_bytes( ):
+    rng    = random.Random( 1 )
+    frames = [ frame( 1, 0x89, bytes( rng.randrange( 256 ) for _ in range( rng.randrange( 4, 24 ) ) ) ) for _ in range( 180 ) ]
+    stream, expected = bytearray( ), list( )
+    for index, packet in enumerate( frames ):
+        if index % 10 == 5:
+            packet = bytearray( packet )
+            packet[1] = 0xF0            # Every 10th length byte is corrupted.
+        else:
+            expected.append( packet )
+        stream += packet
+
+    for chunk in ( 1, 5, 64, len( stream ) ):
+        framer = ImpinjR2KFramer( address=1 )
+        assert feed( framer, bytes( stream ), chunk ) == expected
+        assert not framer.buffer
+        assert framer.frames == len( expected )
+
+    framer = ImpinjR2KFramer( address=1 )  # Fed frame by frame, every good frame comes out at once.
+    for index, packet in enumerate( frames ):
+        packets = framer.feed( bytes( stream[:len( packet )] ) )
+        del stream[:len( packet )]
+        assert packets == ( [ ] if index % 10 == 5 else [ packet ] )
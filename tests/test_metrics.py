@@ -0,0 +1,85 @@
+# -*- coding:utf-8 -*-
+""" ImpinjR2KHistogram and the Prometheus exporter ( serve_metrics ). """
+
+import re
+import urllib.error
+import urllib.request
+
+import pytest
+
+from pyImpinj         import ImpinjR2KHistogram
+from pyImpinj.records import is_tag
+
+SAMPLE = re.compile( r'^(pyimpinj_[a-z_]+)(\{[a-z]+="[^"]*"(,[a-z]+="[^"]*")*\})? (\S+)$' )
+
+def test_histogram( ):
+    histogram = ImpinjR2KHistogram( ( 0.1, 1.0 ) )
+    for value in ( 0.05, 0.1, 0.5, 2.0 ):
+        histogram.observe( value )
+    snapshot = histogram.snapshot( )
+    assert snapshot['buckets'] == [ ( 0.1, 2 ), ( 1.0, 3 ), ( float( 'inf' ), 4 ) ]    # Upper bounds are inclusive ( le ).
+    assert ( snapshot['count'], snapshot['sum'], snapshot['mean'] ) == ( 4, 2.65, 2.65 / 4 )
+    assert ImpinjR2KHistogram( ).snapshot( )['mean'] == 0.0
+
+def parse( text ):
+    """ @return : { metric : kind }, [ ( name, { label : value }, value ) ] """
+    kinds, samples = dict( ), list( )
+    for line in text.splitlines( ):
+        if line.startswith( '# TYPE ' ):
+            _, _, name, kind = line.split( ' ' )
+            assert kind in ( 'counter', 'gauge', 'histogram' )
+            kinds[ name ] = kind
+            continue
+        match = SAMPLE.match( line )
+        assert match, line
+        labels = dict( re.findall( r'([a-z]+)="([^"]*)"', match.group( 2 ) or '' ) )
+        samples.append( ( match.group( 1 ), labels, float( match.group( 4 ) ) ) )
+    return kinds, samples
+
+def test_serve_metrics( reader ):
+    reader, epc = reader
+    reader.protocol.rt_inventory( repeat=1 )
+    while True:
+        item = reader.package_queue.get( timeout=5 )
+        if ( not is_tag( item ) ) and item['type'] == 'DONE':
+            break
+    assert reader.read( epc, bank='TID', address=0, size=2 )
+
+    exporter = reader.serve_metrics( port=0, labels=dict( reader='dock-1' ) )
+    try:
+        assert reader.serve_metrics( ) is exporter
+        with urllib.request.urlopen( exporter.url, timeout=5 ) as response:
+            assert response.headers['Content-Type'] == 'text/plain; version=0.0.4; charset=utf-8'
+            kinds, samples = parse( response.read( ).decode( 'utf-8' ) )
+        with pytest.raises( urllib.error.HTTPError ):
+            urllib.request.urlopen( exporter.url.replace( '/metrics', '/other' ), timeout=5 )
+    finally:
+        exporter.close( )
+
+    ### Every sample belongs to a declared metric and carries the exporter labels.
+    for name, labels, _ in samples:
+        base = re.sub( r'_(bucket|sum|count)$', '', name ) if name not in kinds else name
+        assert base in kinds, name
+        assert labels['reader'] == 'dock-1'
+    values = { ( name, tuple( sorted( labels.items( ) ) ) ) : value for name, labels, value in samples }
+
+    assert values[ ( 'pyimpinj_tags_total', ( ( 'antenna', '1' ), ( 'reader', 'dock-1' ) ) ) ] > 0
+    assert kinds['pyimpinj_command_queue_dropped_total'] == 'counter'
+
+    ### Histograms : cumulative buckets, +Inf equals _count.
+    for name, kind in kinds.items( ):
+        if kind != 'histogram':
+            continue
+        series = dict( )
+        for sample, labels, value in samples:
+            if sample == name + '_bucket':
+                key = tuple( sorted( ( key, item ) for key, item in labels.items( ) if key != 'le' ) )
+                series.setdefault( key, [ ] ).append( ( labels['le'], value ) )
+        for key, buckets in series.items( ):
+            counts = [ value for _, value in buckets ]
+            assert counts == sorted( counts ) and buckets[-1][0] == '+Inf'
+            assert counts[-1] == values[ ( name + '_count', key ) ]
+
+    assert values[ ( 'pyimpinj_round_seconds_count', ( ( 'reader', 'dock-1' ), ) ) ] == 1
+    latency = { labels['command'] for sample, labels, _ in samples if sample == 'pyimpinj_command_latency_seconds_count' }
+    assert 'READ' in latency
@@ -0,0 +1,36 @@
+# -*- coding:utf-8 -*-
+""" ImpinjR2KPipeline against ImpinjR2KSimulator. """
+
+from pyImpinj.enums import ImpinjR2KCommands as C
+
+def test_pipeline_in_flight( reader, simulator ):
+    reader, _ = reader
+    writes, write = list( ), reader.ser.write
+    reader.ser.write = lambda data : writes.append( bytes( data ) ) or write( data )
+
+    with reader.pipeline( timeout=3 ) as pipe:
+        pipe.get_work_antenna( )
+        pipe.set_work_antenna( antenna=2 )
+        pipe.get_work_antenna( )
+        pipe.get_reader_identifier( )
+        pipe.rt_inventory( repeat=1 )
+        pipe.beeper( mode=0 )
+
+    assert len( writes ) == 1                       # Every frame in one write.
+    results = pipe.results
+    assert [ result.command for result in results ] == [ C.GET_WORK_ANTENNA, C.SET_WORK_ANTENNA, C.GET_WORK_ANTENNA,
+                                                         C.GET_READER_IDENTIFIER, C.REAL_TIME_INVENTORY, C.SET_BEEPER_MODE ]
+    assert ( results[0].data, results[2].data ) == ( b'\x00', b'\x02' )    # Same command, matched in order.
+    assert results[1].success and results[5].success
+    assert results[3].data == bytes( simulator.identifier )
+    assert results[4].success is None
+    while reader.package_queue.get( timeout=3 )['type'] != 'DONE':
+        pass
+    assert not any( reader.command_queue.waiters.values( ) )
+
+def test_pipeline_timeout( reader ):
+    reader, _ = reader
+    reader.ser.write = lambda data : len( data )    # Nothing reaches the reader.
+    results = reader.pipeline( timeout=0.2 ).get_work_antenna( ).beeper( mode=0 ).execute( )
+    assert [ ( result.success, result.error ) for result in results ] == [ ( False, 'Timeout' ) ]*2
+    assert not any( reader.command_queue.waiters.values( ) )
@@ -0,0 +1,23 @@
+# -*- coding:utf-8 -*-
+""" ImpinjR2KProtocols frame encoder. """
+
+import libscrc
+
+from pyImpinj.protocol import ImpinjR2KProtocols
+
+def reference( address, command, data ):
+    message = bytes( [ 0xA0, len( data ) + 3, address, command ] ) + bytes( data )
+    return message + bytes( [ libscrc.lrc( message ) ] )
+
+def test_encode( ):
+    encoder = ImpinjR2KProtocols( address=1 )
+    for size in ( 0, 1, 10, 11, 40, 11, 252 ):
+        data = [ ( index * 7 ) & 0xFF for index in range( size ) ]
+        assert encoder.encode( 0x82, data ) == reference( 1, 0x82, data )
+        assert encoder.encode( 0x82, bytes( data ) ) == reference( 1, 0x82, data )
+
+def test_frames_are_not_shared( ):
+    encoder = ImpinjR2KProtocols( address=1 )
+    first   = encoder.encode( 0x82, list( range( 20 ) ) )
+    encoder.encode( 0x82, list( range( 20, 40 ) ) )
+    assert first == reference( 1, 0x82, list( range( 20 ) ) )
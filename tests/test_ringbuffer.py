@@ -0,0 +1,70 @@
+# -*- coding:utf-8 -*-
+""" ImpinjTagRing records and cleanup. """
+
+import os
+import sys
+import subprocess
+import multiprocessing
+
+from multiprocessing import shared_memory
+
+from pyImpinj            import ringbuffer
+from pyImpinj.records    import TagRead
+from pyImpinj.ringbuffer import ImpinjTagRing
+
+ROOT = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+EPC = bytes.fromhex( 'E20000000000000000000001' )
+
+def test_rssi_is_clamped( ):
+    ring = ImpinjTagRing( capacity=8, policy='drop-oldest' )
+    try:
+        ring.put( [ TagRead( 1, 0, -129, EPC, 1.0 ), TagRead( 2, 3, -60, EPC, 2.0 ) ] )
+        assert [ ( tag.antenna, tag.channel, tag.rssi, tag.epc ) for tag in ring.get( ) ] == [ ( 1, 0, -128, EPC ), ( 2, 3, -60, EPC ) ]
+    finally:
+        ring.close( )
+
+def test_mmap_fallback_close( monkeypatch ):
+    monkeypatch.setattr( ringbuffer, 'shared_memory', None )
+    ring = ImpinjTagRing( capacity=8 )
+    ring.put( TagRead( 1, 0, -60, EPC, 1.0 ) )
+    assert len( ring.get( ) ) == 1
+    ring.close( )
+    assert ring.map.closed
+
+CONSUMER = """
+from pyImpinj.ringbuffer import ImpinjTagRing
+ring = ImpinjTagRing.attach( {!r} )
+print( len( ring.get( ) ) )
+ring.close( )
+"""
+
+def consume( name, conn ):
+    ring = ImpinjTagRing.attach( name )
+    conn.send( len( ring.get( ) ) )
+    ring.close( )
+
+def test_consumer_process_does_not_unlink( ):
+    ring = ImpinjTagRing( capacity=8 )
+    try:
+        ### Any process ( its own resource_tracker ).
+        ring.put( TagRead( 1, 0, -60, EPC, 1.0 ) )
+        done = subprocess.run( [ sys.executable, '-c', CONSUMER.format( ring.name ) ], cwd=ROOT,
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, timeout=30 )
+        assert ( done.returncode, done.stdout.strip( ) ) == ( 0, '1' ), done.stderr
+        assert 'leaked' not in done.stderr
+        shared_memory.SharedMemory( name=ring.name ).close( )   # Still there.
+
+        ### A multiprocessing child ( the producer's resource_tracker ).
+        ring.put( TagRead( 2, 0, -60, EPC, 2.0 ) )
+        context = multiprocessing.get_context( 'spawn' )
+        parent, child = context.Pipe( )
+        process = context.Process( target=consume, args=( ring.name, child ) )
+        process.start( )
+        assert parent.recv( ) == 1
+        process.join( 10 )
+        assert process.exitcode == 0
+
+        ring.put( TagRead( 3, 0, -60, EPC, 3.0 ) )
+        assert [ tag.antenna for tag in ring.get( ) ] == [ 3 ]
+    finally:
+        ring.close( )
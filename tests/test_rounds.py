@@ -0,0 +1,41 @@
+# -*- coding:utf-8 -*-
+""" ImpinjRoundCollector against ImpinjR2KSimulator. """
+
+import queue
+
+import pytest
+
+from pyImpinj import ImpinjR2KReader, ImpinjR2KSimulator, ImpinjTagPopulation, ImpinjRoundCollector, ImpinjInventoryRound
+
+numpy = pytest.importorskip( 'numpy' )
+
+@pytest.mark.parametrize( 'compact', [ False, True ] )
+def test_round_collection( compact ):
+    population = ImpinjTagPopulation( count=20, antennas=( 1, ), seed=1 )
+    simulator  = ImpinjR2KSimulator( address=1, population=population, speed=0, seed=1 )
+    rounds     = queue.Queue( )
+    reader     = ImpinjR2KReader( ImpinjRoundCollector( rounds ), address=1, compact=compact, batch_size=8 )
+    reader.connect( simulator.serve( ) )
+    reader.worker_start( )
+    try:
+        reader.rt_inventory( repeat=3 )
+        first = rounds.get( timeout=3 )
+        reader.rt_inventory( repeat=1 )
+        second = rounds.get( timeout=3 )
+    finally:
+        reader.worker_close( )
+        simulator.close( )
+
+    assert isinstance( first, ImpinjInventoryRound )
+    assert len( first ) == first.total_read > 0
+    assert len( second ) == second.total_read        # The collector starts over after DONE.
+    assert set( bytes( epc ) for epc in first.unique( ) ) <= set( bytes( tag.epc ) for tag in population.tags )
+    assert set( first.antenna ) == { 1 }
+    assert first.rssi.dtype == numpy.int16
+    assert first.rssi_statistics( )[1]['count'] == len( first )
+
+def test_epc_trailing_zero_bytes( ):
+    epcs  = [ b'\xE2\x00\x00\x00', b'\xE2\x00\x00\x01', b'\xE2\x00\x00\x00' ]
+    value = ImpinjInventoryRound( [ 1 ]*3, [ 0 ]*3, [ -60 ]*3, [ 0.0 ]*3, epcs )
+    assert [ bytes( epc ) for epc in value.epc ] == epcs
+    assert len( value.unique( ) ) == 2
@@ -0,0 +1,112 @@
+# -*- coding:utf-8 -*-
+""" Inventory schedulers against an in-process ImpinjR2KSimulator. """
+
+import queue
+import collections
+
+from pyImpinj            import ImpinjR2KSimulator, ImpinjTagPopulation
+from pyImpinj.enums      import ImpinjR2KFastSwitchInventory
+from pyImpinj.framer     import ImpinjR2KFramer
+from pyImpinj.records    import decode_tag_report
+from pyImpinj.protocol   import ImpinjR2KProtocols
+from pyImpinj.scheduler  import ImpinjInventoryScheduler, ImpinjSessionScheduler, ImpinjDwellScheduler
+from pyImpinj.dispatcher import TAG_COMMANDS
+
+RT_INVENTORY = 0x89
+
+class Protocol( object ):
+    def __init__( self ):
+        self.commands = 0
+
+    def rt_inventory( self, repeat=1 ):
+        self.commands += 1
+
+class Reader( object ):
+    def __init__( self ):
+        self.protocol = Protocol( )
+
+def scheduler( **kwargs ):
+    value = ImpinjInventoryScheduler( Reader( ), queue.Queue( ), mode='rt', timeout=60, **kwargs )
+    value.start( )
+    return value
+
+def test_nothing_does_not_retrigger( ):
+    value = scheduler( )
+    nothing = decode_tag_report( 0x06, RT_INVENTORY, bytes( [ 0x00, 0x00, 0x00 ] ) )
+    assert nothing['logs'] == 'Nothing!'
+    value.put( nothing )
+    value.stop( )
+    assert value.reader.protocol.commands == 1
+    assert value.errors == 1
+
+def test_failed_command_retries_are_limited( ):
+    value = scheduler( retries=2 )
+    failed = decode_tag_report( 0x04, RT_INVENTORY, bytes( [ 0x11 ] ) )
+    for _ in range( 5 ):
+        value.put( failed )
+    assert value.reader.protocol.commands == 1 + 2
+
+    value.put( decode_tag_report( 0x0A, RT_INVENTORY, bytes( 7 ) ) )    # DONE resets the count.
+    value.put( failed )
+    value.stop( )
+    assert value.reader.protocol.commands == 1 + 2 + 1 + 1
+
+class SimLink( object ):
+    """ In-process serial port: frames go to the simulator, its answers wait in @pending. """
+    def __init__( self, simulator ):
+        self.simulator, self.framer, self.pending = simulator, ImpinjR2KFramer( address=None ), collections.deque( )
+
+    def write( self, data ):
+        def send( data, reads=0 ):
+            self.pending.append( data )
+            self.simulator.pace( 0, reads )
+        for packet in self.framer.feed( bytes( data ) ):
+            self.simulator.handle( packet, send )
+        return len( data )
+
+class SimReader( object ):
+    def __init__( self, simulator ):
+        self.link     = SimLink( simulator )
+        self.protocol = ImpinjR2KProtocols( address=1, serial=self.link )
+
+def run( cls, population, rounds, missing=( ), **kwargs ):
+    """ Run @rounds inventory rounds of scheduler @cls against an in-process simulator. """
+    simulator = ImpinjR2KSimulator( address=1, population=population, rate=50000, speed=1.0, missing=missing, seed=1 )
+    reader, tags, framer = SimReader( simulator ), queue.Queue( ), ImpinjR2KFramer( address=1 )
+    value = cls( reader, tags, timeout=60, **kwargs )
+    value.start( )
+    while value.rounds < rounds:
+        for packet in framer.feed( reader.link.pending.popleft( ) ):
+            if packet[3] in TAG_COMMANDS:
+                item = decode_tag_report( packet[1], packet[3], bytes( packet[4:-1] ) )
+                if item is not None:
+                    value.put( item )
+    value.stop( )
+    return value, list( tags.queue )
+
+def test_session_target_flipping( ):
+    value, _ = run( ImpinjSessionScheduler, ImpinjTagPopulation( count=100, antennas=( 1, ), seed=1 ), 40, sessions=( 'S1', ) )
+    assert value.flips >= 4
+    assert value.estimate( ) == 100
+    assert value.statistics( )['unique'] == 100
+
+def test_session_selection( ):
+    value, _ = run( ImpinjSessionScheduler, ImpinjTagPopulation( count=200, antennas=( 1, ), seed=1 ), 18, sessions=( 'S0', 'S2' ), probe=8 )
+    assert value.chosen == 'S2', value.yields
+    assert value.session == 'S2'
+
+def test_session_estimate_counts_total_read( ):
+    value = ImpinjSessionScheduler( SimReader( ImpinjR2KSimulator( ) ), queue.Queue( ), timeout=60 )
+    value.round['epcs'].update( [ 'E2000001', 'E2000002' ] )
+    value.put( dict( type='DONE', total_read=5, duration=0 ) )     # 3 reports were lost.
+    assert value.estimate( ) == 5
+
+def test_dwell_reallocation( ):
+    population = ImpinjTagPopulation( count=120, antennas=( 1, 2 ), seed=1 )
+    for tag in population.tags[:100]:
+        tag.antennas = frozenset( [ 1 ] )       # Antenna 1 sees most tags.
+    value, items = run( ImpinjDwellScheduler, population, 30, missing=( 4, ), antennas=( 0, 1, 2, 3 ), budget=8, idle=5, recheck=1000 )
+    assert value.missing == { 3 }
+    active = { value.param[ name ] : value.param[ name + 'loop' ] for name in 'ABCD' if value.param[ name ] != ImpinjR2KFastSwitchInventory.DISABLED }
+    assert set( active ) == { 0, 1 }              # Antenna 3 : silent, antenna 4 : missing.
+    assert any( item.get( 'type' ) == 'PLAN' for item in items if isinstance( item, dict ) )
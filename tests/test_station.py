@@ -0,0 +1,28 @@
+# -*- coding:utf-8 -*-
+""" ImpinjEncodingStation against ImpinjR2KSimulator. """
+
+ASSIGNMENTS = [ [ ( 'USER', 0, '{:08X}'.format( serial ) ), ( 'EPC', 2, '646C8DBBD18000004{:07X}'.format( serial ) ) ] for serial in range( 1, 4 ) ]
+
+def test_encode_and_verify( reader, simulator ):
+    reader, _ = reader
+    sink    = reader.protocol_factory.package_queue
+    station = reader.encode( ASSIGNMENTS, timeout=1 )
+    results = list( station.run( count=2 ) )
+
+    assert [ result.success for result in results ] == [ True, True ], results
+    assert reader.protocol_factory.package_queue is sink
+    epcs = { bytes( tag.epc ).hex( ).upper( ) for tag in simulator.population.tags }
+    for result, assignment in zip( results, ASSIGNMENTS ):
+        assert result.target == assignment[1][2] and result.target in epcs
+        assert reader.read( result.target, bank='USER', address=0, size=2 ) == assignment[0][2]
+    assert station.statistics( )['encoded'] == 2
+
+def test_sink_is_restored_on_close( reader ):
+    reader, _ = reader
+    sink    = reader.protocol_factory.package_queue
+    station = reader.encode( ASSIGNMENTS, timeout=1 )
+    run     = station.run( )
+    assert next( run ).success
+    assert reader.protocol_factory.package_queue is station.tags
+    run.close( )
+    assert reader.protocol_factory.package_queue is sink
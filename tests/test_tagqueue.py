@@ -0,0 +1,82 @@
+# -*- coding:utf-8 -*-
+""" ImpinjTagQueue overflow policies and accounting. """
+
+import time
+import queue
+
+import pytest
+
+from pyImpinj import ImpinjTagQueue, TagRead
+
+def tag( index ):
+    return TagRead( 1, 0, -50, bytes( [ index ] ), 0.0 )
+
+def drain( tags ):
+    items = list( )
+    while True:
+        try:
+            items.append( tags.get_nowait( ) )
+        except queue.Empty:
+            return items
+
+def balanced( tags ):
+    counters = tags.statistics( )
+    return counters['put'] == counters['delivered'] + counters['dropped'] + counters['coalesced'] + counters['pending']
+
+@pytest.mark.parametrize( 'policy', [ 'drop-newest', 'drop-oldest', 'coalesce', 'block' ] )
+def test_batches_are_bounded( policy ):
+    tags = ImpinjTagQueue( maxsize=16, policy=policy, timeout=0.001 )
+    for start in range( 0, 200, 8 ):
+        tags.put( [ tag( index ) for index in range( start, start + 8 ) ] )
+        tags.put( dict( type='DONE' ) )
+    assert tags.statistics( )['pending'] <= 16
+    assert balanced( tags )
+    items = drain( tags )
+    assert sum( len( item ) for item in items if isinstance( item, list ) ) == tags.statistics( )['delivered']
+    assert len( [ item for item in items if isinstance( item, dict ) ] ) == 25
+    assert balanced( tags )
+
+def test_drop_oldest_keeps_newest( ):
+    tags = ImpinjTagQueue( maxsize=4, policy='drop-oldest' )
+    for index in range( 10 ):
+        tags.put( tag( index ) )
+    assert [ item.epc[0] for item in drain( tags ) ] == [ 6, 7, 8, 9 ]
+    assert tags.statistics( )['dropped'] == 6
+
+def test_coalesce_only_when_backlogged( ):
+    tags = ImpinjTagQueue( maxsize=8, policy='coalesce', backlog=4 )
+    for index in ( 1, 1, 2 ):
+        tags.put( tag( index ) )
+    assert tags.statistics( )['coalesced'] == 0
+    tags.put( tag( 3 ) )
+    tags.put( tag( 4 ) )
+    tags.put( tag( 4 ) )                # Backlog of 5 reads: replaces the pending read of EPC 4.
+    assert tags.statistics( )['coalesced'] == 1
+    assert [ item.epc[0] for item in drain( tags ) ] == [ 1, 1, 2, 3, 4 ]
+    assert balanced( tags )
+
+def test_block_times_out( ):
+    tags = ImpinjTagQueue( maxsize=2, policy='block', timeout=0.05 )
+    start = time.monotonic( )
+    for index in range( 3 ):
+        tags.put( tag( index ) )
+    assert 0.04 <= time.monotonic( ) - start < 1
+    assert tags.statistics( )['dropped'] == 1
+
+def test_block_waits_once_per_stall( ):
+    tags = ImpinjTagQueue( maxsize=2, policy='block', timeout=0.05 )
+    start = time.monotonic( )
+    for index in range( 20 ):
+        tags.put( tag( index ) )
+    assert time.monotonic( ) - start < 0.5          # Not 18 timeouts of the serial thread.
+    assert tags.statistics( )['dropped'] == 18
+    assert tags.statistics( )['blocked'] == 1
+
+    ### get( ) ends the stall, the next full put( ) waits again.
+    assert tags.get( ).epc[0] == 0
+    tags.put( tag( 20 ) )
+    start = time.monotonic( )
+    tags.put( tag( 21 ) )
+    assert time.monotonic( ) - start >= 0.04
+    assert tags.statistics( )['blocked'] == 2
+    assert balanced( tags )
@@ -0,0 +1,94 @@
+# -*- coding:utf-8 -*-
+""" ImpinjR2KLink against ImpinjR2KSimulator and a silent TCP stand-in. """
+
+import time
+import socket
+import threading
+
+import pytest
+
+from pyImpinj           import ImpinjR2KReader, ImpinjR2KSimulator, ImpinjTagPopulation
+from pyImpinj.transport import ImpinjR2KLink
+
+def wait( condition, timeout=5 ):
+    deadline = time.monotonic( ) + timeout
+    while ( not condition( ) ) and ( time.monotonic( ) < deadline ):
+        time.sleep( 0.01 )
+    return condition( )
+
+@pytest.fixture
+def readers( ):
+    """ Readers 1 and 2 on one port ( multi-drop ), connected with reconnect=True. """
+    peer      = ImpinjR2KSimulator( address=2, population=ImpinjTagPopulation( count=2, seed=2 ), speed=0 )
+    simulator = ImpinjR2KSimulator( address=1, population=ImpinjTagPopulation( count=2, seed=1 ), speed=0, peers=[ peer ] )
+    url       = simulator.serve( )
+    readers   = [ ImpinjR2KReader( address=address ) for address in ( 1, 2 ) ]
+    for reader in readers:
+        reader.connect( url, reconnect=True, backoff=( 0.05, 0.2 ) )
+        reader.worker_start( )
+    yield simulator, peer, url, readers
+    for reader in readers:
+        reader.worker_close( )
+    simulator.close( )
+
+def test_two_addresses_share_one_link( readers ):
+    simulator, peer, _, ( first, second ) = readers
+    assert first.link is second.link
+    assert first.set_work_antenna( 1 )[0] and second.set_work_antenna( 2 )[0]
+    assert ( simulator.antenna, peer.antenna ) == ( 1, 2 )
+    assert ( first.get_work_antenna( ), second.get_work_antenna( ) ) == ( b'\x01', b'\x02' )
+
+def test_reconnect_with_backoff( readers ):
+    simulator, _, url, ( first, _ ) = readers
+    link = first.link
+    simulator.close( )                              # Down: the link retries with backoff.
+    assert wait( lambda : not link.connected.is_set( ) )
+    time.sleep( 0.5 )
+    assert link.reconnects == 0
+    simulator.serve( port=int( url.rpartition( ':' )[2] ) )
+    assert wait( lambda : link.connected.is_set( ) )
+    assert link.reconnects == 1
+    assert first.get_work_antenna( ) == b'\x00'
+
+def test_config_replayed_after_reconnect( readers ):
+    simulator, peer, _, ( first, second ) = readers
+    assert first.set_rf_power( 20, 21, 22, 23 )[0]
+    assert second.set_work_antenna( 3 )[0]
+    simulator.power, peer.antenna = [ 30 ]*4, 0     # The readers reboot with their defaults.
+    simulator.drop( )
+    assert wait( lambda : first.link.reconnects == 1 )
+    assert wait( lambda : ( simulator.power, peer.antenna ) == ( [ 20, 21, 22, 23 ], 3 ) )
+
+class Sink( object ):
+    def connection_made( self, transport ):
+        pass
+
+    def handle_packet( self, packet ):
+        pass
+
+def test_keepalive_detects_a_silent_peer( ):
+    server = socket.socket( socket.AF_INET, socket.SOCK_STREAM )
+    server.bind( ( '127.0.0.1', 0 ) )
+    server.listen( 4 )
+    accepted = list( )
+
+    def accept( ):
+        while True:
+            try:
+                conn, _ = server.accept( )
+            except OSError:
+                return
+            accepted.append( conn )                 # Connected, but never answers.
+    threading.Thread( target=accept, daemon=True ).start( )
+
+    link = ImpinjR2KLink( 'socket://{}:{}'.format( *server.getsockname( ) ), backoff=( 0.05, 0.2 ), keepalive=0.1 )
+    link.attach( 1, Sink( ) )                       # One address to probe.
+    link.start( )
+    try:
+        assert wait( lambda : link.reconnects >= 1 )
+        assert len( accepted ) >= 2
+    finally:
+        link.close( )
+        server.close( )
+        for conn in accepted:
+            conn.close( )